@@ -0,0 +1,8 @@
+"""The benchmarks of the non-dominated sorting.
+
+Run command:
+```
+python -m benchmarks --help
+```
+
+"""
@@ -0,0 +1,47 @@
+"""Command line interface of the benchmarks.
+
+"""
+
+import argparse
+import json
+import sys
+
+from . import datasets
+from .runner import run
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmarks of the non-dominated sorting.")
+    parser.add_argument("--distributions", nargs="+", default=sorted(datasets.DISTRIBUTIONS),
+                        choices=sorted(datasets.DISTRIBUTIONS), help="The distributions of the points.")
+    parser.add_argument("--dims", nargs="+", type=int, default=[2, 3, 5, 10], help="The numbers of the objectives.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1000, 10000],
+                        help="The numbers of the points, for example: 100 1000 10000 100000 1000000.")
+    parser.add_argument("--repeat", type=int, default=3, help="The number of the measurements of the time.")
+    parser.add_argument("--naive-max-size", type=int, default=2000,
+                        help="The naive O(mn^2) sorting is measured only for the sizes less or equal to it.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the random generator.")
+    parser.add_argument("--output", default="-", help="The path to the JSON file with the results or '-' for stdout.")
+    parser.add_argument("--quiet", action="store_true", help="Do not print the progress to stderr.")
+
+    args = parser.parse_args(argv)
+
+    def log(message: str) -> None:
+        print(message, file=sys.stderr)
+
+    report = run(args.distributions, args.dims, args.sizes, args.repeat, args.naive_max_size, args.seed,
+                 None if args.quiet else log)
+
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""The module contains the generators of the datasets for the benchmarks.
+
+"""
+
+__all__ = ["DISTRIBUTIONS", "generate"]
+
+from typing import List, Tuple, Callable
+import random
+
+
+def uniform(size: int, dim: int, rng: random.Random) -> List[Tuple[float, ...]]:
+    """The points are uniformly distributed in the unit hypercube."""
+    return [tuple(rng.random() for _ in range(dim)) for _ in range(size)]
+
+
+def hyperplane(size: int, dim: int, rng: random.Random) -> List[Tuple[float, ...]]:
+    """The points are on the hyperplane 'sum(x) = 1', so all points are in the one front."""
+    points = []
+
+    for _ in range(size):
+        values = [rng.expovariate(1.0) for _ in range(dim)]
+        total = sum(values)
+        points.append(tuple(value / total for value in values))
+
+    return points
+
+
+def chain(size: int, dim: int, rng: random.Random) -> List[Tuple[float, ...]]:
+    """The points are on the diagonal of the hypercube, so every point is in the own front."""
+    points = [(float(i),) * dim for i in range(size)]
+    rng.shuffle(points)
+    return points
+
+
+def tied(size: int, dim: int, rng: random.Random) -> List[Tuple[int, ...]]:
+    """The integer points with the small number of the unique values of the every objective."""
+    return [tuple(rng.randrange(10) for _ in range(dim)) for _ in range(size)]
+
+
+# The names of the distributions as keys and the generators as values.
+DISTRIBUTIONS = {
+    "uniform": uniform,
+    "hyperplane": hyperplane,
+    "chain": chain,
+    "tied": tied
+}
+
+
+def generate(distribution: str, size: int, dim: int, seed: int) -> list:
+    """Generate the reproducible dataset.
+
+    --------------------
+    Args:
+        'distribution': The name of the distribution from the 'DISTRIBUTIONS'.
+        'size': The number of the points.
+        'dim': The number of the objectives.
+        'seed': The seed of the random generator.
+
+    --------------------
+    Returns:
+        The list of the points.
+
+    """
+    generator: Callable[[int, int, random.Random], list] = DISTRIBUTIONS[distribution]
+    return generator(size, dim, random.Random("{0}-{1}-{2}-{3}".format(distribution, size, dim, seed)))
@@ -0,0 +1,34 @@
+"""The module contains the naive O(mn^2) non-dominated sorting for the comparison.
+
+"""
+
+__all__ = ["naive_front_indices"]
+
+from typing import List, Sequence, Any
+
+from nds import stools as st
+
+
+def naive_front_indices(seq: Sequence[Sequence[Any]]) -> List[int]:
+    """A naive non-dominated sorting.
+
+    The points are processed in the lexicographical order, so the fronts of the dominating points are already known.
+
+    --------------------
+    Args:
+        'seq': The sequence of the values of the objectives.
+
+    --------------------
+    Returns:
+        The list of front's indices for the every point in 'seq'.
+
+    """
+    fronts = [0] * len(seq)
+    order = sorted(range(len(seq)), key=lambda index: tuple(seq[index]))
+
+    for (k, i) in enumerate(order):
+        for j in order[:k]:
+            if fronts[j] >= fronts[i] and st.is_dominate(seq[j], seq[i]):
+                fronts[i] = fronts[j] + 1
+
+    return fronts
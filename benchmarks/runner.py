@@ -0,0 +1,118 @@
+"""The module contains the measurements of the time and the memory of the non-dominated sorting.
+
+"""
+
+__all__ = ["measure", "scaling_exponent", "run"]
+
+from typing import List, Dict, Callable, Iterable, Any
+import gc
+import math
+import time
+import tracemalloc
+
+from nds import ndomsort
+
+from . import datasets
+from .naive import naive_front_indices
+
+
+def _sort(seq: list) -> tuple:
+    return ndomsort.non_domin_sort(seq, only_front_indices=True)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Measure the minimum time of the 'repeat' calls and the peak memory of the one call of the 'func'.
+
+    The peak memory is measured in the separate call, because the tracing slows down the execution.
+
+    """
+    times = []
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"time": min(times), "peak_memory": peak_memory}
+
+
+def scaling_exponent(sizes: List[int], times: List[float]) -> float:
+    """Estimate the exponent k in the 'time = c * size^k' by the least squares in the logarithmic scale.
+
+    --------------------
+    Returns:
+        The exponent or NaN, if there are less than two measurements.
+
+    """
+    points = [(math.log(size), math.log(max(elapsed, 1e-9))) for (size, elapsed) in zip(sizes, times)]
+
+    if len(points) < 2:
+        return float("nan")
+
+    mean_x = sum(x for (x, _) in points) / len(points)
+    mean_y = sum(y for (_, y) in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for (x, _) in points)
+
+    if variance == 0:
+        return float("nan")
+
+    return sum((x - mean_x) * (y - mean_y) for (x, y) in points) / variance
+
+
+def run(distributions: Iterable[str], dims: Iterable[int], sizes: Iterable[int], repeat: int = 3,
+        naive_max_size: int = 2000, seed: int = 0, log: Callable[[str], None] = None) -> Dict[str, Any]:
+    """Run the benchmarks for the all combinations of the distributions, the dimensions and the sizes.
+
+    --------------------
+    Args:
+        'distributions': The names of the distributions from the 'datasets.DISTRIBUTIONS'.
+        'dims': The numbers of the objectives.
+        'sizes': The numbers of the points.
+        'repeat': The number of the measurements of the time.
+        'naive_max_size': The naive sorting is measured only for the sizes less or equal to it.
+        'seed': The seed of the random generator.
+        'log': The function for the progress messages or None.
+
+    --------------------
+    Returns:
+        The dictionary, which can be serialized to JSON.
+
+    """
+    sizes = sorted(sizes)
+    results = []
+    scaling = []
+
+    for distribution in distributions:
+        for dim in dims:
+            times = []
+
+            for size in sizes:
+                seq = datasets.generate(distribution, size, dim, seed)
+                record = {"distribution": distribution, "dim": dim, "size": size}
+                record.update(measure(lambda: _sort(seq), repeat))
+                times.append(record["time"])
+
+                if size <= naive_max_size:
+                    naive = measure(lambda: naive_front_indices(seq), 1)
+                    record["naive_time"] = naive["time"]
+                    record["naive_peak_memory"] = naive["peak_memory"]
+                    record["is_equal_naive"] = list(_sort(seq)) == naive_front_indices(seq)
+
+                results.append(record)
+
+                if log is not None:
+                    log("{distribution} dim={dim} size={size}: {time:.4f} s, {peak_memory} B".format(**record))
+
+            scaling.append({"distribution": distribution, "dim": dim,
+                            "exponent": scaling_exponent(sizes, times)})
+
+    return {"seed": seed, "repeat": repeat, "results": results, "scaling": scaling}
@@ -0,0 +1,341 @@
+"""The module contains an archive of the decisions, which keeps the indices of the fronts after the changes.
+
+An element can change its front only if it is weakly dominated by an inserted or a removed element,
+so only these elements are sorted again after the change. They are found by the '_nd_helper_b',
+where the changed elements are compared with the rest elements. The changes are collected until the fronts
+are requested, so the insertions and the removals between the requests are handled by the one update.
+
+"""
+
+__all__ = ["NonDominatedArchive"]
+
+from typing import List, Iterable, Sequence, Callable, Dict, Tuple, Any
+from collections import defaultdict
+import bisect
+
+from . import ndomsort as nd
+
+# If the number of the changed or the affected elements multiplied by it is greater or equal
+# to the size of the archive, then all elements are sorted again.
+FULL_UPDATE_RATIO = 2
+
+# The number of the candidates, which are checked for the estimation of the number of the affected elements.
+ESTIMATE_SAMPLE_SIZE = 16
+
+
+def _is_weakly_dominate(leftv: Tuple[Any, ...], rightv: Sequence[Any]) -> bool:
+    return all(left <= right for (left, right) in zip(leftv, rightv))
+
+
+class NonDominatedArchive:
+    """The archive of the decisions with the indices of the fronts.
+
+    Every inserted decision gets a unique identifier. The fronts are updated after 'insert' and 'remove',
+    when they are requested.
+    The decisions with a same values of the objectives are stored once in the dictionary of the objectives
+    and the unique values of the objectives are kept in the lexicographical order.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    """
+
+    def __init__(self, decisions: Iterable[Any] = (), get_objectives: Callable[[Any], Iterable[Any]] = None):
+        self._get_objectives = get_objectives
+        self._count_of_obj = None
+        self._next_id = 0
+
+        # The identifiers of the decisions as keys and the pairs (decision, objectives) as values.
+        self._decisions = {}
+        # The objectives as keys and the identifiers of the their preimages as values.
+        self._objs_dict = defaultdict(list)
+        # The objectives as keys and the indices of the fronts as values.
+        self._fronts = {}
+        # The unique objectives in the lexicographical order.
+        self._sorted_objs = []
+        # The inserted and the removed objectives, whose dominated elements are not updated yet.
+        self._changed_objs = set()
+
+        self.insert(decisions)
+
+    @classmethod
+    def from_fronts(cls, decisions: Iterable[Any], sorted_objs: Sequence[Tuple[Any, ...]], fronts: Sequence[int],
+                    inverse: Iterable[int], get_objectives: Callable[[Any], Iterable[Any]] = None) \
+            -> "NonDominatedArchive":
+        """Create the archive of the already sorted decisions without the sorting.
+
+        --------------------
+        Args:
+            'decisions': The sequence of the decisions.
+            'sorted_objs': The lexicographically ordered unique values of the objectives of the decisions.
+            'fronts': The indices of the fronts of the 'sorted_objs'.
+            'inverse': The index of the values of the objectives in the 'sorted_objs' for the every decision.
+            'get_objectives': The function which maps a decision space into a objectives space.
+            It is used for the inserted decisions.
+
+        --------------------
+        Returns:
+            The archive. The identifiers of the decisions are their indices in 'decisions'.
+
+        """
+        archive = cls(get_objectives=get_objectives)
+        sorted_objs = [tuple(objs) for objs in sorted_objs]
+
+        assert sorted_objs, "'sorted_objs' is empty."
+        assert len(fronts) == len(sorted_objs), "'fronts' must have a same length as 'sorted_objs'."
+
+        archive._count_of_obj = len(sorted_objs[0])
+        archive._sorted_objs = sorted_objs
+        archive._fronts = dict(zip(sorted_objs, fronts))
+
+        for (decision, index) in zip(decisions, inverse):
+            objs = sorted_objs[index]
+            archive._objs_dict[objs].append(archive._next_id)
+            archive._decisions[archive._next_id] = (decision, objs)
+            archive._next_id += 1
+
+        return archive
+
+    def __len__(self) -> int:
+        return len(self._decisions)
+
+    def __contains__(self, decision_id: int) -> bool:
+        return decision_id in self._decisions
+
+    def get(self, decision_id: int) -> Any:
+        """Return the decision with the identifier 'decision_id'."""
+        return self._decisions[decision_id][0]
+
+    def front(self, decision_id: int) -> int:
+        """Return the index of the front of the decision with the identifier 'decision_id'."""
+        self._flush()
+        return self._fronts[self._decisions[decision_id][1]]
+
+    def fronts(self) -> Dict[int, Tuple[Any, ...]]:
+        """Return the fronts in the same form as 'ndomsort.non_domin_sort'.
+
+        --------------------
+        Returns:
+            A dictionary. It contains indices of fronts as keys and values are tuple consist of
+            the decisions which have a same index of the front.
+
+        """
+        self._flush()
+        fronts = defaultdict(list)
+
+        for objs in self._sorted_objs:
+            fronts[self._fronts[objs]].extend(self._decisions[decision_id][0]
+                                              for decision_id in self._objs_dict[objs])
+
+        return {front: tuple(decisions) for (front, decisions) in fronts.items()}
+
+    def insert(self, decisions: Iterable[Any]) -> List[int]:
+        """Insert the decisions into the archive and update the fronts.
+
+        --------------------
+        Args:
+            'decisions': The sequence of the decisions.
+
+        --------------------
+        Returns:
+            The list of the identifiers of the inserted decisions.
+
+        """
+        ids = []
+        new_objs = []
+
+        for decision in decisions:
+            objs = tuple(decision) if self._get_objectives is None else tuple(self._get_objectives(decision))
+
+            if self._count_of_obj is None:
+                assert len(objs) > 1, "The number of the objectives must be > 1, " \
+                                      "but image of the decision have the length is {0}.".format(len(objs))
+                self._count_of_obj = len(objs)
+            else:
+                assert len(objs) == self._count_of_obj, "The image of the decision have the number of the objectives " \
+                                                        "{0}, but the archive contains the images with the number " \
+                                                        "of the objectives {1}.".format(len(objs),
+                                                                                        self._count_of_obj)
+
+            decision_id = self._next_id
+            self._next_id += 1
+
+            if objs not in self._objs_dict:
+                new_objs.append(objs)
+                self._fronts[objs] = 0
+
+            self._objs_dict[objs].append(decision_id)
+            self._decisions[decision_id] = (decision, objs)
+            ids.append(decision_id)
+
+        new_objs.sort()
+        # The merge of the two ordered runs.
+        self._sorted_objs.extend(new_objs)
+        self._sorted_objs.sort()
+        self._changed_objs.update(new_objs)
+
+        return ids
+
+    def remove(self, ids: Iterable[int]) -> None:
+        """Remove the decisions from the archive and update the fronts.
+
+        --------------------
+        Args:
+            'ids': The identifiers of the decisions.
+
+        --------------------
+        Raises:
+            KeyError: If there is not a decision with the identifier from 'ids'.
+
+        """
+        removed_objs = []
+
+        for decision_id in ids:
+            _, objs = self._decisions.pop(decision_id)
+            same_objs_ids = self._objs_dict[objs]
+            same_objs_ids.remove(decision_id)
+
+            if not same_objs_ids:
+                del self._objs_dict[objs]
+                del self._fronts[objs]
+                removed_objs.append(objs)
+
+        if removed_objs:
+            removed_objs.sort()
+            removed_set = set(removed_objs)
+            self._sorted_objs = [objs for objs in self._sorted_objs if objs not in removed_set]
+            self._changed_objs.update(removed_objs)
+
+    def _flush(self) -> None:
+        """Update the fronts after the collected changes."""
+        if self._changed_objs:
+            changed_objs = sorted(self._changed_objs)
+            self._changed_objs.clear()
+            self._update(changed_objs)
+
+    def _find_candidates(self, changed_objs: List[Tuple[Any, ...]]) -> List[int]:
+        """Find the positions of the elements in the archive, which can be weakly dominated by the 'changed_objs'.
+
+        Only the lexicographically greater or equal elements, which are weakly dominated by the minimum
+        of the 'changed_objs' on the every objective, can be dominated by them.
+
+        --------------------
+        Args:
+            'changed_objs': The ordered inserted or removed objectives.
+
+        --------------------
+        Returns:
+            The ordered positions in the list of the ordered objectives.
+
+        """
+        sorted_objs = self._sorted_objs
+        lower_bound = [min(objs[k] for objs in changed_objs) for k in range(self._count_of_obj)]
+        start = bisect.bisect_left(sorted_objs, changed_objs[0])
+
+        return [pos for pos in range(start, len(sorted_objs)) if _is_weakly_dominate(lower_bound, sorted_objs[pos])]
+
+    def _estimate_affected(self, changed_objs: List[Tuple[Any, ...]], candidates: List[int]) -> int:
+        """Estimate the number of the 'candidates', which are weakly dominated by the 'changed_objs',
+        by the uniform sample of them."""
+        if not candidates:
+            return 0
+
+        step = max(1, len(candidates) // ESTIMATE_SAMPLE_SIZE)
+        sample = [self._sorted_objs[pos] for pos in candidates[::step]]
+        count_of_dominated = sum(1 for fitness in sample
+                                 if any(_is_weakly_dominate(objs, fitness) for objs in changed_objs))
+
+        return count_of_dominated * len(candidates) // len(sample)
+
+    def _find_affected(self, changed_objs: List[Tuple[Any, ...]], candidates: List[int]) -> List[int]:
+        """Find the positions of the elements in the archive, which are weakly dominated by the 'changed_objs'.
+
+        --------------------
+        Args:
+            'changed_objs': The ordered inserted or removed objectives.
+            'candidates': The ordered positions of the elements, which can be dominated (see '_find_candidates').
+
+        --------------------
+        Returns:
+            The ordered positions in the list of the ordered objectives.
+
+        """
+        sorted_objs = self._sorted_objs
+        changed_set = set(changed_objs)
+
+        changed_pos = [pos for pos in candidates if sorted_objs[pos] in changed_set]
+        other_pos = [pos for pos in candidates if sorted_objs[pos] not in changed_set]
+
+        if not other_pos:
+            return changed_pos
+
+        # The changed elements have the front 0 and the rest elements have the front -1,
+        # so the weakly dominated elements get the front 1.
+        objs = sorted(changed_objs + [sorted_objs[pos] for pos in other_pos])
+        local_index = {fitness: index for (index, fitness) in enumerate(objs)}
+        fronts = [-1] * len(objs)
+
+        for fitness in changed_objs:
+            fronts[local_index[fitness]] = 0
+
+        buffer = [local_index[fitness] for fitness in changed_objs] + \
+                 [local_index[sorted_objs[pos]] for pos in other_pos]
+        nd._run_tasks(objs, fronts, buffer, [(nd._TASK_HELPER_B, 0, len(changed_objs), len(changed_objs),
+                                              len(buffer), self._count_of_obj)])
+
+        dominated_pos = [pos for pos in other_pos if fronts[local_index[sorted_objs[pos]]] == 1]
+
+        return sorted(changed_pos + dominated_pos)
+
+    def _update(self, changed_objs: List[Tuple[Any, ...]]) -> None:
+        """Update the fronts of the elements, which are weakly dominated by the 'changed_objs'.
+
+        The fronts of the other elements are not changed, because their dominating elements are not changed.
+
+        --------------------
+        Args:
+            'changed_objs': The ordered inserted or removed objectives.
+
+        """
+        if not changed_objs or not self._sorted_objs:
+            return
+
+        sorted_objs = self._sorted_objs
+        affected = None
+
+        if FULL_UPDATE_RATIO * len(changed_objs) < len(sorted_objs):
+            candidates = self._find_candidates(changed_objs)
+
+            # The search of the affected elements is skipped, if the most elements are sorted again anyway.
+            if FULL_UPDATE_RATIO * self._estimate_affected(changed_objs, candidates) < len(sorted_objs):
+                affected = self._find_affected(changed_objs, candidates)
+
+        if affected is None or FULL_UPDATE_RATIO * len(affected) >= len(sorted_objs):
+            for (objs, front) in zip(sorted_objs, nd._nd_sort(sorted_objs, self._count_of_obj, engine="auto",
+                                                              ties=None)):
+                self._fronts[objs] = front
+            return
+        elif not affected:
+            return
+
+        # The bounding box of the affected elements. Only the elements inside it can dominate them,
+        # they are lexicographically less or equal to its upper corner.
+        upper_bound = tuple(max(sorted_objs[pos][k] for pos in affected) for k in range(self._count_of_obj))
+        end = min(affected[-1], bisect.bisect_right(sorted_objs, upper_bound))
+        affected_set = set(affected)
+        comp = [pos for pos in range(end)
+                if pos not in affected_set and _is_weakly_dominate(sorted_objs[pos], upper_bound)]
+
+        # The local indices are ordered as the elements in the lexicographical order.
+        positions = sorted(comp + affected)
+        local_index = {pos: index for (index, pos) in enumerate(positions)}
+
+        objs = [sorted_objs[pos] for pos in positions]
+        fronts = [0 if pos in affected_set else self._fronts[sorted_objs[pos]] for pos in positions]
+        buffer = [local_index[pos] for pos in comp] + [local_index[pos] for pos in affected]
+
+        tasks = [(nd._TASK_HELPER_A, len(comp), len(buffer), self._count_of_obj),
+                 (nd._TASK_HELPER_B, 0, len(comp), len(comp), len(buffer), self._count_of_obj)]
+        nd._run_tasks(objs, fronts, buffer, tasks)
+
+        for pos in affected:
+            self._fronts[sorted_objs[pos]] = fronts[local_index[pos]]
@@ -0,0 +1,208 @@
+"""The module contains the asynchronous non-dominated sorting for the asyncio applications.
+
+The sorting is executed in an executor, so the event loop is not blocked. The large sortings are executed
+by the chunks of the tasks of the 'ndomsort._run_tasks' in the thread of the executor: the cancellation token
+is checked after the every chunk and the progress is reported to the event loop by the 'call_soon_threadsafe'.
+The 'SortService' bounds the number of the concurrent sortings by a semaphore and a pool of the threads.
+
+"""
+
+__all__ = ["CancellationToken", "non_domin_sort_async", "SortService"]
+
+from typing import Iterable, Callable, Dict, Tuple, Any, Union
+from array import array
+from concurrent.futures import Executor, ThreadPoolExecutor
+import asyncio
+import functools
+import threading
+import time
+
+from . import ndomsort as nd
+from . import stools as st
+
+# The minimum number of the unique values of the objectives for the execution by the chunks.
+# The smaller sortings are executed at once by the 'ndomsort._nd_sort'.
+CHUNKED_SIZE = 10000
+
+# The number of the tasks of the 'ndomsort._run_tasks' in a chunk.
+CHUNK_TASKS = 64
+
+# The minimum interval between the reports of the progress in seconds.
+PROGRESS_INTERVAL = 0.1
+
+
+class CancellationToken:
+    """The token of the cancellation of the sorting.
+
+    It is cancelled from any thread, and the sorting stops after the current chunk with the 'asyncio.CancelledError'.
+
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request the cancellation of the sortings with the token."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Is the cancellation requested?"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise the 'asyncio.CancelledError', if the cancellation is requested."""
+        if self._event.is_set():
+            raise asyncio.CancelledError("The sorting is cancelled.")
+
+
+def _sort_in_chunks(decisions: Iterable[Any], get_objectives: Callable[[Any], Iterable[Any]], result: str,
+                    token: CancellationToken, report: Callable[[float], None] = None) \
+        -> Union[Tuple[int], Dict[int, Tuple[Any]], Tuple[array, array, array]]:
+    """Sort the decisions in the thread of the executor (see 'non_domin_sort_async').
+
+    --------------------
+    Args:
+        'report': The function, which is called with the fraction of the elements with the final fronts, or None.
+
+    """
+    objs_dict, count_of_obj = nd._group_by_objectives(decisions, get_objectives)
+    unique_objs = sorted(objs_dict.keys())
+    token.raise_if_cancelled()
+
+    if len(unique_objs) < CHUNKED_SIZE:
+        unique_fronts = nd._nd_sort(unique_objs, count_of_obj, engine="auto", ties=None)
+    else:
+        objs, fenwick = unique_objs, None
+        compressed = nd._rank_compress(unique_objs, nd.TIE_DOMAIN_SIZE)
+
+        if compressed is not None:
+            objs, domain_sizes = compressed
+            fenwick = st.FenwickMax(domain_sizes[1])
+
+        unique_fronts = [0] * len(objs)
+        buffer = list(range(len(objs)))
+        tasks = [(nd._TASK_HELPER_A, 0, len(objs), count_of_obj)]
+        count_of_final = 0
+        last_report = time.monotonic()
+
+        while tasks:
+            token.raise_if_cancelled()
+            count_of_final += nd._run_tasks(objs, unique_fronts, buffer, tasks, fenwick=fenwick, max_tasks=CHUNK_TASKS)
+
+            if report is not None and time.monotonic() - last_report >= PROGRESS_INTERVAL:
+                report(count_of_final / len(objs))
+                last_report = time.monotonic()
+
+    if report is not None:
+        report(1.0)
+
+    return nd._assemble_fronts(objs_dict, unique_objs, unique_fronts, result)
+
+
+async def non_domin_sort_async(decisions: Iterable[Any], get_objectives: Callable[[Any], Iterable[Any]] = None,
+                               only_front_indices: bool = False, result: str = "dict", executor: Executor = None,
+                               token: CancellationToken = None, progress: Callable[[float], None] = None) \
+        -> Union[Tuple[int], Dict[int, Tuple[Any]], Tuple[array, array, array]]:
+    """The non-dominated sorting in an executor, which does not block the event loop.
+
+    If the number of the unique values of the objectives is at least 'CHUNKED_SIZE', then the sorting is executed
+    by the chunks of the tasks with the "python" engine, and it is cancellable after the every chunk.
+    A chunk takes at most O(n log n) time. The smaller sortings are not divided.
+    If the coroutine is cancelled, then the token is cancelled too, so the thread of the executor stops.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions for non-dominated sorting.
+        'get_objectives': The function which maps a decision space into a objectives space.
+        'only_front_indices': If it is True, then it is equivalent to the 'result="indices"'.
+        'result': The form of the result (see 'ndomsort.non_domin_sort').
+        'executor': The executor with the threads or None for the default executor of the event loop.
+        'token': The cancellation token or None.
+        'progress': The function, which is called in the event loop with the fraction of the sorted elements
+        from 0 to 1, or None.
+
+    --------------------
+    Returns:
+        The same result as the 'ndomsort.non_domin_sort'.
+
+    --------------------
+    Raises:
+        asyncio.CancelledError: If the token is cancelled or the coroutine is cancelled.
+
+    """
+    assert result in nd._RESULT_FORMS, "'result' must be one of the {0}, but it is {1}.".format(nd._RESULT_FORMS,
+                                                                                              result)
+    # It is the running loop inside the coroutine ('asyncio.get_running_loop' requires Python 3.7).
+    loop = asyncio.get_event_loop()
+
+    if token is None:
+        token = CancellationToken()
+
+    report = None if progress is None else functools.partial(loop.call_soon_threadsafe, progress)
+
+    call = functools.partial(_sort_in_chunks, decisions, get_objectives,
+                             "indices" if only_front_indices is True else result, token, report)
+
+    try:
+        return await loop.run_in_executor(executor, call)
+    except asyncio.CancelledError:
+        token.cancel()
+        raise
+
+
+class SortService:
+    """The service of the asynchronous sortings with the bounded concurrency.
+
+    At most 'max_concurrency' sortings are executed at the same time in the pool of 'max_workers' threads,
+    the rest requests wait in the order of the arrival. The sortings hold the GIL, so the concurrent sortings
+    share the time of a processor, and the bound keeps the latency of the every request predictable.
+
+    """
+
+    def __init__(self, max_workers: int = 1, max_concurrency: int = None):
+        """
+        --------------------
+        Args:
+            'max_workers': The number of the threads.
+            'max_concurrency': The maximum number of the concurrent sortings. If it is None, then it is 'max_workers'.
+
+        """
+        assert max_workers > 0, "'max_workers' must be > 0, but it is {0}.".format(max_workers)
+        assert max_concurrency is None or max_concurrency > 0, \
+            "'max_concurrency' must be > 0, but it is {0}.".format(max_concurrency)
+
+        self._executor = ThreadPoolExecutor(max_workers)
+        self._max_concurrency = max_workers if max_concurrency is None else max_concurrency
+        # The semaphore is created in the event loop by the first request.
+        self._semaphore = None
+
+    async def sort(self, decisions: Iterable[Any], get_objectives: Callable[[Any], Iterable[Any]] = None,
+                   only_front_indices: bool = False, result: str = "dict", token: CancellationToken = None,
+                   progress: Callable[[float], None] = None) \
+            -> Union[Tuple[int], Dict[int, Tuple[Any]], Tuple[array, array, array]]:
+        """Sort the decisions, when the number of the current sortings is less than 'max_concurrency'.
+
+        The arguments and the result are the same as in the 'non_domin_sort_async'.
+
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async with self._semaphore:
+            if token is not None:
+                token.raise_if_cancelled()
+            return await non_domin_sort_async(decisions, get_objectives, only_front_indices, result,
+                                              self._executor, token, progress)
+
+    def close(self) -> None:
+        """Wait the current sortings and release the threads."""
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "SortService":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await asyncio.get_event_loop().run_in_executor(None, self.close)
@@ -0,0 +1,80 @@
+"""The module contains the cache of the values of the objectives for the repeated sortings.
+
+The same decisions are often sorted in the consecutive generations, so the values of their objectives are
+computed once and they are kept in the cache with the LRU eviction.
+
+"""
+
+__all__ = ["ObjectiveCache"]
+
+from typing import Iterable, Callable, Tuple, Hashable, Any
+from collections import OrderedDict
+
+# The default maximum number of the decisions in the cache.
+DEFAULT_MAXSIZE = 1 << 16
+
+
+class ObjectiveCache:
+    """The cache of the values of the objectives with the LRU eviction.
+
+    It is the callable object, which maps a decision into the tuple of the values of the objectives,
+    so it is passed as the argument 'get_objectives' of the sortings.
+
+    If 'key' is None, then the decisions are identified by the 'id'. The cache keeps the references to the decisions,
+    so the identifiers of the cached decisions are not reused.
+
+    """
+
+    def __init__(self, get_objectives: Callable[[Any], Iterable[Any]] = None, maxsize: int = DEFAULT_MAXSIZE,
+                 key: Callable[[Any], Hashable] = None):
+        """
+        --------------------
+        Args:
+            'get_objectives': The function which maps a decision space into a objectives space.
+            If it is None, then it is identity map.
+            'maxsize': The maximum number of the decisions in the cache or None for the unbounded cache.
+            'key': The function which maps a decision into a hashable key or None.
+
+        """
+        assert maxsize is None or maxsize > 0, "'maxsize' must be > 0, but it is {0}.".format(maxsize)
+
+        self._get_objectives = get_objectives
+        self._maxsize = maxsize
+        self._key = key
+        # The keys of the decisions as keys and the pairs (decision or None, objectives) as values.
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __call__(self, decision: Any) -> Tuple[Any, ...]:
+        """Return the values of the objectives of the 'decision'."""
+        if self._key is None:
+            key, kept_decision = id(decision), decision
+        else:
+            key, kept_decision = self._key(decision), None
+
+        entry = self._entries.get(key)
+
+        if entry is not None and (kept_decision is None or entry[0] is decision):
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        objs = tuple(decision) if self._get_objectives is None else tuple(self._get_objectives(decision))
+        self._entries[key] = (kept_decision, objs)
+        self._entries.move_to_end(key)
+
+        if self._maxsize is not None and len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+        return objs
+
+    def clear(self) -> None:
+        """Remove all decisions from the cache."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,396 @@
+"""The module contains the compiled engine of the non-dominated sorting.
+
+It is the same algorithm as in the 'ndomsort', but the values of the objectives, the fronts, the buffer of
+the indices and the stack of the tasks are typed arrays of the NumPy, so the procedures are compiled
+by the Numba. If the Numba is not installed, then the procedures are plain Python functions,
+they are correct, but slow, so the engine is not used by default.
+
+The task is a row of the array: the kind of the task ('ndomsort._TASK_*') and its arguments:
+    the '_TASK_HELPER_A': lo, hi, 0, 0, count_of_obj, 0;
+    the '_TASK_HELPER_B': comp_lo, comp_hi, assign_lo, assign_hi, count_of_obj, 0;
+    the '_TASK_MERGE': lo, hi, 0, 0, 0, 0;
+    the '_TASK_RESTORE': lo, hi, 0, 0, 0, the offset of the saved indices in the stack of the saved ranges.
+
+"""
+
+__all__ = ["is_available", "is_float_exact_array", "nd_sort", "nd_sort_array"]
+
+from typing import Sequence, List, Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# The same values as in the 'ndomsort', they are repeated here, because the module does not import it.
+_TASK_HELPER_A, _TASK_HELPER_B, _TASK_MERGE, _TASK_RESTORE = range(4)
+
+
+def _jit(func):
+    """Compile the function by the Numba, if it is installed."""
+    if numba is None:
+        return func
+
+    return numba.njit(cache=True, nogil=True)(func)
+
+
+def is_available() -> bool:
+    """Check. Are the NumPy and the Numba installed?"""
+    return np is not None and numba is not None
+
+
+def is_float_exact_array(objectives: "np.ndarray") -> bool:
+    """Check. Are all values of the array exactly representable as float64?"""
+    if objectives.dtype.kind == "f":
+        return objectives.dtype.itemsize <= 8
+    elif objectives.dtype.kind in "iub":
+        return bool(np.all(objectives.astype(np.float64).astype(objectives.dtype) == objectives))
+
+    return False
+
+
+@_jit
+def _is_weakly_dominate(objs, i, j, count_of_obj):
+    for k in range(count_of_obj):
+        if objs[i, k] > objs[j, k]:
+            return False
+    return True
+
+
+@_jit
+def _brute_force_a(objs, fronts, buffer, lo, hi, count_of_obj):
+    for p in range(lo + 1, hi):
+        j = buffer[p]
+        front = fronts[j]
+        for q in range(lo, p):
+            i = buffer[q]
+            if fronts[i] >= front and _is_weakly_dominate(objs, i, j, count_of_obj):
+                front = fronts[i] + 1
+        fronts[j] = front
+
+
+@_jit
+def _brute_force_b(objs, fronts, buffer, comp_lo, comp_hi, assign_lo, assign_hi, count_of_obj):
+    for p in range(assign_lo, assign_hi):
+        j = buffer[p]
+        front = fronts[j]
+        for q in range(comp_lo, comp_hi):
+            i = buffer[q]
+            if fronts[i] >= front and _is_weakly_dominate(objs, i, j, count_of_obj):
+                front = fronts[i] + 1
+        fronts[j] = front
+
+
+@_jit
+def _stairs_max_front(stair_values, stair_fronts, size, value):
+    """The same as the 'stools.FrontStaircase.max_front' for the staircase 'stair_values[:size]'."""
+    pos = np.searchsorted(stair_values[:size], value, side="right")
+    return stair_fronts[pos - 1] if pos > 0 else -1
+
+
+@_jit
+def _stairs_add(stair_values, stair_fronts, size, value, front):
+    """The same as the 'stools.FrontStaircase.add' for the staircase 'stair_values[:size]'.
+
+    --------------------
+    Returns:
+        The new size of the staircase.
+
+    """
+    pos = np.searchsorted(stair_values[:size], value, side="right")
+
+    if pos > 0 and stair_fronts[pos - 1] >= front:
+        return size
+
+    start = np.searchsorted(stair_values[:pos], value, side="left")
+    end = start + np.searchsorted(stair_fronts[start:size], front, side="right")
+    # The range [start, end) is replaced by the one pair.
+    shift = end - start - 1
+
+    if shift > 0:
+        for t in range(end, size):
+            stair_values[t - shift] = stair_values[t]
+            stair_fronts[t - shift] = stair_fronts[t]
+    elif shift < 0:
+        for t in range(size - 1, end - 1, -1):
+            stair_values[t + 1] = stair_values[t]
+            stair_fronts[t + 1] = stair_fronts[t]
+
+    stair_values[start] = value
+    stair_fronts[start] = front
+
+    return size - shift
+
+
+@_jit
+def _sweep_a(objs, fronts, buffer, lo, hi, stair_values, stair_fronts):
+    size = 0
+
+    for p in range(lo, hi):
+        i = buffer[p]
+        value = objs[i, 1]
+        fronts[i] = max(fronts[i], _stairs_max_front(stair_values, stair_fronts, size, value) + 1)
+        size = _stairs_add(stair_values, stair_fronts, size, value, fronts[i])
+
+
+@_jit
+def _sweep_b(objs, fronts, buffer, comp_lo, comp_hi, assign_lo, assign_hi, stair_values, stair_fronts):
+    size = 0
+    q = comp_lo
+
+    for p in range(assign_lo, assign_hi):
+        j = buffer[p]
+
+        while q < comp_hi:
+            i = buffer[q]
+            # The lexicographical comparison of the first two values.
+            if objs[i, 0] < objs[j, 0] or (objs[i, 0] == objs[j, 0] and objs[i, 1] <= objs[j, 1]):
+                size = _stairs_add(stair_values, stair_fronts, size, objs[i, 1], fronts[i])
+                q += 1
+            else:
+                break
+
+        fronts[j] = max(fronts[j], _stairs_max_front(stair_values, stair_fronts, size, objs[j, 1]) + 1)
+
+
+@_jit
+def _split_by(objs, buffer, lo, hi, k, split_value, equal, greater):
+    """The stable split of the 'buffer[lo:hi]' into three ranges by the k-th value (see 'ndomsort._split_by').
+
+    The 'equal' and the 'greater' are the buffers for the indices with the equal and the greater values.
+
+    --------------------
+    Returns:
+        The tuple (mid1, mid2).
+
+    """
+    mid1 = lo
+    count_equal = 0
+    count_greater = 0
+
+    for p in range(lo, hi):
+        i = buffer[p]
+        if objs[i, k] < split_value:
+            buffer[mid1] = i
+            mid1 += 1
+        elif objs[i, k] > split_value:
+            greater[count_greater] = i
+            count_greater += 1
+        else:
+            equal[count_equal] = i
+            count_equal += 1
+
+    mid2 = mid1 + count_equal
+    buffer[mid1:mid2] = equal[:count_equal]
+    buffer[mid2:hi] = greater[:count_greater]
+
+    return mid1, mid2
+
+
+@_jit
+def _median_low(objs, buffer, lo, hi, k, values, offset):
+    """Return the low median of the k-th values of the 'buffer[lo:hi]' and 'values[:offset]'."""
+    for p in range(lo, hi):
+        values[offset + p - lo] = objs[buffer[p], k]
+
+    count = offset + hi - lo
+    return np.partition(values[:count], (count - 1) // 2)[(count - 1) // 2]
+
+
+@_jit
+def _push(tasks, top, kind, a, b, c, d, count_of_obj, saved_offset):
+    if top == len(tasks):
+        new_tasks = np.empty((2 * len(tasks), tasks.shape[1]), dtype=tasks.dtype)
+        new_tasks[:top] = tasks
+        tasks = new_tasks
+
+    tasks[top, 0] = kind
+    tasks[top, 1] = a
+    tasks[top, 2] = b
+    tasks[top, 3] = c
+    tasks[top, 4] = d
+    tasks[top, 5] = count_of_obj
+    tasks[top, 6] = saved_offset
+
+    return tasks, top + 1
+
+
+@_jit
+def _save(saved, saved_top, buffer, lo, hi):
+    if saved_top + hi - lo > len(saved):
+        new_saved = np.empty(2 * (saved_top + hi - lo), dtype=saved.dtype)
+        new_saved[:saved_top] = saved[:saved_top]
+        saved = new_saved
+
+    saved[saved_top:saved_top + hi - lo] = buffer[lo:hi]
+
+    return saved, saved_top + hi - lo
+
+
+@_jit
+def _run(objs, fronts, buffer, lo, hi, count_of_obj, brute_force_size_a, brute_force_size_b):
+    """Attribute front's indices to the elements in the 'objs', with the indices in the 'buffer[lo:hi]'.
+
+    It is the '_nd_helper_a' with the stack of the tasks (see 'ndomsort._run_tasks').
+
+    --------------------
+    Args:
+         'objs': The lexicographically ordered unique values of the objectives (float64 array (n, m)).
+         'fronts': The indices of the fronts of the 'objs' (int64 array). They are lower bounds of the fronts.
+         'buffer': The buffer of the indices (int64 array).
+         'lo', 'hi': The ordered range of the 'buffer'.
+         'count_of_obj': The number of the values from the objectives, for the sorting.
+         'brute_force_size_a', 'brute_force_size_b': See 'ndomsort.BRUTE_FORCE_SIZE_A' and
+         'ndomsort.BRUTE_FORCE_SIZE_B'.
+
+    """
+    n = len(objs)
+    stair_values = np.empty(n, dtype=objs.dtype)
+    stair_fronts = np.empty(n, dtype=np.int64)
+    equal = np.empty(n, dtype=np.int64)
+    greater = np.empty(n, dtype=np.int64)
+    values = np.empty(2 * n, dtype=objs.dtype)
+
+    tasks = np.empty((64, 7), dtype=np.int64)
+    saved = np.empty(2 * n + 1, dtype=np.int64)
+    saved_top = 0
+    tasks, top = _push(tasks, 0, _TASK_HELPER_A, lo, hi, 0, 0, count_of_obj, 0)
+
+    while top > 0:
+        top -= 1
+        kind = tasks[top, 0]
+        m = tasks[top, 5]
+
+        if kind == _TASK_HELPER_A:
+            lo, hi = tasks[top, 1], tasks[top, 2]
+
+            if hi - lo < 2:
+                continue
+            elif hi - lo <= brute_force_size_a:
+                _brute_force_a(objs, fronts, buffer, lo, hi, m)
+                continue
+            elif m == 2:
+                _sweep_a(objs, fronts, buffer, lo, hi, stair_values, stair_fronts)
+                continue
+
+            k = m - 1
+            min_value = max_value = objs[buffer[lo], k]
+            for p in range(lo + 1, hi):
+                min_value = min(min_value, objs[buffer[p], k])
+                max_value = max(max_value, objs[buffer[p], k])
+
+            if min_value == max_value:
+                tasks, top = _push(tasks, top, _TASK_HELPER_A, lo, hi, 0, 0, m - 1, 0)
+                continue
+
+            median = _median_low(objs, buffer, lo, hi, k, values, 0)
+            saved_offset = saved_top
+            saved, saved_top = _save(saved, saved_top, buffer, lo, hi)
+            mid1, mid2 = _split_by(objs, buffer, lo, hi, k, median, equal, greater)
+
+            tasks, top = _push(tasks, top, _TASK_RESTORE, lo, hi, 0, 0, 0, saved_offset)
+            tasks, top = _push(tasks, top, _TASK_HELPER_A, mid2, hi, 0, 0, m, 0)
+            tasks, top = _push(tasks, top, _TASK_HELPER_B, lo, mid2, mid2, hi, m - 1, 0)
+            tasks, top = _push(tasks, top, _TASK_MERGE, lo, mid2, 0, 0, 0, 0)
+            tasks, top = _push(tasks, top, _TASK_HELPER_A, mid1, mid2, 0, 0, m - 1, 0)
+            tasks, top = _push(tasks, top, _TASK_HELPER_B, lo, mid1, mid1, mid2, m - 1, 0)
+            tasks, top = _push(tasks, top, _TASK_HELPER_A, lo, mid1, 0, 0, m, 0)
+        elif kind == _TASK_HELPER_B:
+            comp_lo, comp_hi, assign_lo, assign_hi = tasks[top, 1], tasks[top, 2], tasks[top, 3], tasks[top, 4]
+
+            if comp_lo == comp_hi or assign_lo == assign_hi:
+                continue
+            elif comp_hi - comp_lo == 1 or assign_hi - assign_lo == 1 \
+                    or (comp_hi - comp_lo) * (assign_hi - assign_lo) <= brute_force_size_b:
+                _brute_force_b(objs, fronts, buffer, comp_lo, comp_hi, assign_lo, assign_hi, m)
+                continue
+            elif m == 2:
+                _sweep_b(objs, fronts, buffer, comp_lo, comp_hi, assign_lo, assign_hi, stair_values, stair_fronts)
+                continue
+
+            k = m - 1
+            comp_min = comp_max = objs[buffer[comp_lo], k]
+            for p in range(comp_lo + 1, comp_hi):
+                comp_min = min(comp_min, objs[buffer[p], k])
+                comp_max = max(comp_max, objs[buffer[p], k])
+
+            assign_min = assign_max = objs[buffer[assign_lo], k]
+            for p in range(assign_lo + 1, assign_hi):
+                assign_min = min(assign_min, objs[buffer[p], k])
+                assign_max = max(assign_max, objs[buffer[p], k])
+
+            if comp_max <= assign_min:
+                tasks, top = _push(tasks, top, _TASK_HELPER_B, comp_lo, comp_hi, assign_lo, assign_hi, m - 1, 0)
+            elif comp_min <= assign_max:
+                for p in range(comp_lo, comp_hi):
+                    values[p - comp_lo] = objs[buffer[p], k]
+                median = _median_low(objs, buffer, assign_lo, assign_hi, k, values, comp_hi - comp_lo)
+
+                # The ranges are restored in the reverse order of the saving.
+                assign_offset = saved_top
+                saved, saved_top = _save(saved, saved_top, buffer, assign_lo, assign_hi)
+                comp_offset = saved_top
+                saved, saved_top = _save(saved, saved_top, buffer, comp_lo, comp_hi)
+
+                comp_mid1, comp_mid2 = _split_by(objs, buffer, comp_lo, comp_hi, k, median, equal, greater)
+                assign_mid1, assign_mid2 = _split_by(objs, buffer, assign_lo, assign_hi, k, median, equal, greater)
+
+                tasks, top = _push(tasks, top, _TASK_RESTORE, assign_lo, assign_hi, 0, 0, 0, assign_offset)
+                tasks, top = _push(tasks, top, _TASK_RESTORE, comp_lo, comp_hi, 0, 0, 0, comp_offset)
+                tasks, top = _push(tasks, top, _TASK_HELPER_B, comp_mid2, comp_hi, assign_mid2, assign_hi, m, 0)
+                tasks, top = _push(tasks, top, _TASK_HELPER_B, comp_lo, comp_mid2, assign_mid2, assign_hi, m - 1, 0)
+                tasks, top = _push(tasks, top, _TASK_MERGE, comp_lo, comp_mid2, 0, 0, 0, 0)
+                tasks, top = _push(tasks, top, _TASK_HELPER_B, comp_mid1, comp_mid2, assign_mid1, assign_mid2, m - 1,
+                                   0)
+                tasks, top = _push(tasks, top, _TASK_HELPER_B, comp_lo, comp_mid1, assign_mid1, assign_mid2, m - 1,
+                                   0)
+                tasks, top = _push(tasks, top, _TASK_HELPER_B, comp_lo, comp_mid1, assign_lo, assign_mid1, m, 0)
+        elif kind == _TASK_MERGE:
+            lo, hi = tasks[top, 1], tasks[top, 2]
+            buffer[lo:hi] = np.sort(buffer[lo:hi])
+        else:
+            lo, hi, saved_offset = tasks[top, 1], tasks[top, 2], tasks[top, 6]
+            buffer[lo:hi] = saved[saved_offset:saved_offset + hi - lo]
+            saved_top = saved_offset
+
+
+def nd_sort_array(objs: "np.ndarray", brute_force_size_a: int, brute_force_size_b: int) -> "np.ndarray":
+    """Attribute front's indices to the lexicographically ordered unique rows of the array.
+
+    --------------------
+    Args:
+         'objs': The lexicographically ordered unique values of the objectives, the array (n, m).
+         'brute_force_size_a', 'brute_force_size_b': The sizes of the subproblems for the pairwise comparisons.
+
+    --------------------
+    Returns:
+         The array of front's indices (int64) for the every row in 'objs'.
+
+    """
+    objs = np.ascontiguousarray(objs, dtype=np.float64)
+    fronts = np.zeros(len(objs), dtype=np.int64)
+    buffer = np.arange(len(objs), dtype=np.int64)
+    _run(objs, fronts, buffer, 0, len(objs), objs.shape[1], brute_force_size_a, brute_force_size_b)
+
+    return fronts
+
+
+def nd_sort(objs: Sequence[Sequence[Any]], count_of_obj: int, brute_force_size_a: int,
+            brute_force_size_b: int) -> List[int]:
+    """Attribute front's indices to the unique lexicographically ordered values of the objectives.
+
+    The values must be exactly representable as floats (see 'parallel.is_float_exact').
+
+    --------------------
+    Returns:
+         The list of front's indices for the every element in 'objs'.
+
+    """
+    objs_array = np.array(objs, dtype=np.float64).reshape(len(objs), count_of_obj)
+
+    return nd_sort_array(objs_array, brute_force_size_a, brute_force_size_b).tolist()
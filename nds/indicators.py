@@ -0,0 +1,551 @@
+"""The module contains the hypervolume indicator and the exclusive contributions of the points to it.
+
+All objectives are minimized. The hypervolume is the volume of the union of the boxes between the points
+and the reference point. The points, which are not less than the reference point in all objectives, are ignored.
+
+The points are deduplicated and ordered in the lexicographical order as in the 'ndomsort.non_domin_sort'.
+For two objectives, the volume is found by the sweep with the minimum of the second value. For three objectives,
+the sweep over the first value keeps the staircase of the first front on the second and the third values
+(as the 'ndomsort._first_front') and its area. For the greater number of the objectives, the WFG algorithm is used:
+the points are processed in the descending order of the last value, so the exclusive volume of a point is
+computed by the volume of the limited points with the less number of the objectives. The limited points are bounded
+by their first front, and the volumes of the same limited sets are cached.
+
+The exclusive contribution of a point does not decrease, when other points are removed, so the greedy removal
+of the points with the least contribution keeps the contributions in the heap as the lower bounds and recomputes
+only the popped contribution. For the first front with two objectives, only the contributions of the neighbours
+of the removed point are recomputed. For three objectives, all contributions are found by the sweep
+over the first value, which keeps the exclusive area of the every point of the staircase.
+
+"""
+
+__all__ = ["hypervolume", "exclusive_contributions", "remove_least_contributors"]
+
+from typing import Iterable, Callable, Sequence, List, Tuple, Dict, Any
+from collections import defaultdict
+import bisect
+import heapq
+
+from . import pareto
+
+
+def _box_volume(point: Sequence[float], reference: Sequence[float]) -> float:
+    volume = 1.0
+
+    for (value, ref_value) in zip(point, reference):
+        volume *= ref_value - value
+
+    return volume
+
+
+def _hv2d(points: Sequence[Sequence[float]], reference: Sequence[float]) -> float:
+    """Compute the hypervolume of the lexicographically ordered points with two objectives."""
+    volume = 0.0
+    min_value = reference[1]
+    prev_value = None
+
+    for (first_value, second_value) in points:
+        if second_value < min_value:
+            if prev_value is not None:
+                volume += (first_value - prev_value) * (reference[1] - min_value)
+            prev_value = first_value
+            min_value = second_value
+
+    if prev_value is not None:
+        volume += (reference[0] - prev_value) * (reference[1] - min_value)
+
+    return volume
+
+
+def _hv3d(points: Sequence[Sequence[float]], reference: Sequence[float]) -> float:
+    """Compute the hypervolume of the lexicographically ordered points with three objectives."""
+    # The staircase of the first front on the second and the third values:
+    # 'second_values' are increasing, 'third_values' are decreasing.
+    second_values = []
+    third_values = []
+    area = 0.0
+    volume = 0.0
+    prev_value = None
+
+    for (first_value, second_value, third_value) in points:
+        if prev_value is not None:
+            volume += area * (first_value - prev_value)
+        prev_value = first_value
+
+        pos = bisect.bisect_right(second_values, second_value)
+        if pos and third_values[pos - 1] <= third_value:
+            continue
+
+        start = end = bisect.bisect_left(second_values, second_value, 0, pos)
+        # The exclusive area of the point: the height of the staircase above it in the every step.
+        height = third_values[start - 1] if start else reference[2]
+        step_start = second_value
+
+        while end < len(third_values) and third_values[end] >= third_value:
+            area += (second_values[end] - step_start) * (height - third_value)
+            step_start, height = second_values[end], third_values[end]
+            end += 1
+
+        step_end = second_values[end] if end < len(second_values) else reference[1]
+        area += (step_end - step_start) * (height - third_value)
+
+        second_values[start:end] = (second_value,)
+        third_values[start:end] = (third_value,)
+
+    if prev_value is not None:
+        volume += area * (reference[0] - prev_value)
+
+    return volume
+
+
+def _wfg(points: List[Tuple[float, ...]], reference: Sequence[float], cache: Dict[Tuple, float]) -> float:
+    """Compute the hypervolume of the lexicographically ordered unique non-dominated points by the WFG algorithm."""
+    count_of_obj = len(reference)
+
+    if count_of_obj == 2:
+        return _hv2d(points, reference)
+    elif count_of_obj == 3:
+        return _hv3d(points, reference)
+    elif len(points) == 1:
+        return _box_volume(points[0], reference)
+
+    key = tuple(points)
+    volume = cache.get(key)
+
+    if volume is not None:
+        return volume
+
+    volume = 0.0
+    points = sorted(points, key=lambda point: point[-1], reverse=True)
+
+    for (i, point) in enumerate(points):
+        # The rest points have the less or equal last values, so the limited points have the same last value,
+        # and the exclusive volume is the product of the height and the exclusive volume of the projection.
+        head = point[:-1]
+        limited = {tuple(max(value, other_value) for (value, other_value) in zip(head, other))
+                   for other in points[i + 1:]}
+
+        if head in limited:
+            continue
+
+        exclusive_volume = _box_volume(head, reference)
+
+        if limited:
+            limited_points = sorted(limited)
+            front = [limited_points[j] for j in pareto._first_front_indices(limited_points, count_of_obj - 1)]
+            exclusive_volume -= _wfg(front, reference[:-1], cache)
+
+        volume += exclusive_volume * (reference[-1] - point[-1])
+
+    cache[key] = volume
+
+    return volume
+
+
+def _volume(points: Iterable[Tuple[float, ...]], reference: Sequence[float]) -> float:
+    """Compute the hypervolume of the points, which are less than the reference point."""
+    points = sorted(set(points))
+
+    if not points:
+        return 0.0
+
+    if len(reference) > 3:
+        points = [points[i] for i in pareto._first_front_indices(points, len(reference))]
+
+    return _wfg(points, reference, {})
+
+
+def _prepare(decisions: Iterable[Any], reference: Sequence[float], get_objectives: Callable[[Any], Iterable[Any]]) \
+        -> Tuple[List[Tuple[float, ...]], List[bool]]:
+    """Return the values of the objectives and the flags: is a point less than the reference point?"""
+    reference = tuple(reference)
+
+    assert len(reference) > 1, "The number of the objectives must be > 1, but it is {0}.".format(len(reference))
+
+    if get_objectives is None:
+        points = [tuple(decision) for decision in decisions]
+    else:
+        points = [tuple(get_objectives(decision)) for decision in decisions]
+
+    for (index, point) in enumerate(points):
+        assert len(point) == len(reference), "The point at position {0} has the number of the objectives {1}, " \
+                                             "but the reference point has {2}.".format(index, len(point),
+                                                                                       len(reference))
+
+    is_inside = [all(value < ref_value for (value, ref_value) in zip(point, reference)) for point in points]
+
+    return points, is_inside
+
+
+def hypervolume(decisions: Iterable[Any], reference: Sequence[float],
+                get_objectives: Callable[[Any], Iterable[Any]] = None) -> float:
+    """Compute the hypervolume of the decisions.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions.
+        'reference': The reference point. It must be worse than the points in all objectives.
+        'get_objectives': The function which maps a decision space into a objectives space.
+
+    --------------------
+    Returns:
+        The volume of the union of the boxes between the points and the reference point.
+
+    """
+    points, is_inside = _prepare(decisions, reference, get_objectives)
+
+    return _volume((point for (point, inside) in zip(points, is_inside) if inside), tuple(reference))
+
+
+def _contribution(point: Tuple[float, ...], others: Iterable[Tuple[float, ...]], reference: Sequence[float]) -> float:
+    """Compute the exclusive contribution of the point: the volume of its box, which is not covered by the 'others'."""
+    limited = {tuple(max(value, other_value) for (value, other_value) in zip(point, other)) for other in others}
+
+    if point in limited:
+        return 0.0
+
+    return _box_volume(point, reference) - _volume(limited, reference)
+
+
+def _contributions_2d(points: List[Tuple[float, ...]], indices: List[int], reference: Sequence[float]) \
+        -> Dict[int, float]:
+    """Compute the exclusive contributions of the points with two objectives.
+
+    The contribution of a point of the first front is the box between it and its neighbours in the front,
+    if it does not dominate other points, otherwise it is computed by the '_contribution'.
+
+    """
+    order = sorted(indices, key=lambda index: points[index])
+    contributions = dict.fromkeys(indices, 0.0)
+    # The indices of the unique points of the first front and the flags: is the point repeated?
+    front = []
+    is_repeated = []
+    dominated = []
+
+    for index in order:
+        if front and points[front[-1]] == points[index]:
+            is_repeated[-1] = True
+        elif front and points[front[-1]][1] <= points[index][1]:
+            dominated.append(index)
+        else:
+            front.append(index)
+            is_repeated.append(False)
+
+    # The points of the front, which dominate a point, are the contiguous range of the front.
+    first_values = [points[index][0] for index in front]
+    negative_second_values = [-points[index][1] for index in front]
+    count_of_dominated = [0] * (len(front) + 1)
+
+    for index in dominated:
+        first_value, second_value = points[index]
+        lo = bisect.bisect_left(negative_second_values, -second_value)
+        hi = bisect.bisect_right(first_values, first_value)
+        if lo < hi:
+            count_of_dominated[lo] += 1
+            count_of_dominated[hi] -= 1
+
+    count = 0
+
+    for (pos, index) in enumerate(front):
+        count += count_of_dominated[pos]
+
+        if is_repeated[pos]:
+            continue
+        elif count:
+            contributions[index] = _contribution(points[index], (points[other] for other in indices
+                                                                 if other != index), reference)
+        else:
+            next_first = points[front[pos + 1]][0] if pos + 1 < len(front) else reference[0]
+            prev_second = points[front[pos - 1]][1] if pos else reference[1]
+            contributions[index] = (next_first - points[index][0]) * (prev_second - points[index][1])
+
+    return contributions
+
+
+def _contributions_3d(points: List[Tuple[float, ...]], indices: List[int], reference: Sequence[float]) \
+        -> Dict[int, float]:
+    """Compute the exclusive contributions of the points with three objectives.
+
+    The sweep over the first value keeps the staircase of the first front on the second and the third values
+    as the '_hv3d'. The exclusive area of a point of the staircase is the box between it and its neighbours
+    without the boxes of the points, which are dominated only by it. These points are kept as the own staircase
+    of the point with the sum of its inner steps, so the area is updated by the changed steps only.
+    The contribution is the sum of the exclusive areas multiplied by the lengths of the intervals of the first value,
+    where they are not changed.
+
+    """
+    counts = defaultdict(int)
+
+    for index in indices:
+        counts[points[index]] += 1
+
+    unique_points = sorted(counts)
+    # The exclusive volumes, the exclusive areas and the first values, since which the areas are not changed.
+    volumes = [0.0] * len(unique_points)
+    areas = [0.0] * len(unique_points)
+    starts = [0.0] * len(unique_points)
+    # The own staircases of the points and the sums of their inner steps: (next second - second) * (third - base).
+    own_second_values = [[] for _ in unique_points]
+    own_third_values = [[] for _ in unique_points]
+    inner_areas = [0.0] * len(unique_points)
+    # The staircase of the first front: 'second_values' are increasing, 'third_values' are decreasing.
+    second_values = []
+    third_values = []
+    front = []
+
+    def replace_own(owner: int, start: int, end: int, new_second: Sequence[float], new_third: Sequence[float]):
+        own_second, own_third = own_second_values[owner], own_third_values[owner]
+        base = unique_points[owner][2]
+
+        for i in range(max(start - 1, 0), min(end, len(own_second) - 1)):
+            inner_areas[owner] -= (own_second[i + 1] - own_second[i]) * (own_third[i] - base)
+
+        own_second[start:end] = new_second
+        own_third[start:end] = new_third
+
+        for i in range(max(start - 1, 0), min(start + len(new_second), len(own_second) - 1)):
+            inner_areas[owner] += (own_second[i + 1] - own_second[i]) * (own_third[i] - base)
+
+    def update_area(pos: int, first_value: float):
+        owner = front[pos]
+        volumes[owner] += areas[owner] * (first_value - starts[owner])
+        starts[owner] = first_value
+
+        _, second_value, third_value = unique_points[owner]
+        next_second = second_values[pos + 1] if pos + 1 < len(front) else reference[1]
+        prev_third = third_values[pos - 1] if pos else reference[2]
+        own_second, own_third = own_second_values[owner], own_third_values[owner]
+
+        if own_second:
+            areas[owner] = (own_second[0] - second_value) * (prev_third - third_value) + inner_areas[owner] + \
+                           (next_second - own_second[-1]) * (own_third[-1] - third_value)
+        else:
+            areas[owner] = (next_second - second_value) * (prev_third - third_value)
+
+    for (owner, (first_value, second_value, third_value)) in enumerate(unique_points):
+        pos = bisect.bisect_right(second_values, second_value)
+
+        if pos and third_values[pos - 1] <= third_value:
+            # The dominated point changes the exclusive area, only if it is dominated by the one point
+            # of the staircase and it is not dominated by the own staircase of this point.
+            if pos > 1 and third_values[pos - 2] <= third_value:
+                continue
+
+            dominating = front[pos - 1]
+            own_second, own_third = own_second_values[dominating], own_third_values[dominating]
+            own_pos = bisect.bisect_right(own_second, second_value)
+
+            if own_pos and own_third[own_pos - 1] <= third_value:
+                continue
+
+            start = end = bisect.bisect_left(own_second, second_value, 0, own_pos)
+
+            while end < len(own_third) and own_third[end] >= third_value:
+                end += 1
+
+            replace_own(dominating, start, end, (second_value,), (third_value,))
+            update_area(pos - 1, first_value)
+            continue
+
+        start = end = bisect.bisect_left(second_values, second_value, 0, pos)
+
+        while end < len(third_values) and third_values[end] >= third_value:
+            end += 1
+
+        # The points, which are dominated by the new point, are dominated only by it.
+        for removed in front[start:end]:
+            volumes[removed] += areas[removed] * (first_value - starts[removed])
+            own_second_values[removed] = own_third_values[removed] = None
+
+        replace_own(owner, 0, 0, second_values[start:end], third_values[start:end])
+        second_values[start:end] = (second_value,)
+        third_values[start:end] = (third_value,)
+        front[start:end] = (owner,)
+        starts[owner] = first_value
+        update_area(start, first_value)
+
+        # The points of the own staircases of the neighbours, which are dominated by the new point, are removed.
+        if start:
+            left = front[start - 1]
+            replace_own(left, bisect.bisect_left(own_second_values[left], second_value),
+                        len(own_second_values[left]), (), ())
+            update_area(start - 1, first_value)
+
+        if start + 1 < len(front):
+            right = front[start + 1]
+            count = 0
+
+            while count < len(own_third_values[right]) and own_third_values[right][count] >= third_value:
+                count += 1
+
+            replace_own(right, 0, count, (), ())
+            update_area(start + 1, first_value)
+
+    for owner in front:
+        volumes[owner] += areas[owner] * (reference[0] - starts[owner])
+
+    volume_of_point = {point: volume for (point, volume) in zip(unique_points, volumes)}
+
+    return {index: volume_of_point[points[index]] if counts[points[index]] == 1 else 0.0 for index in indices}
+
+
+def exclusive_contributions(decisions: Iterable[Any], reference: Sequence[float],
+                            get_objectives: Callable[[Any], Iterable[Any]] = None) -> Tuple[float]:
+    """Compute the exclusive contribution of the every decision to the hypervolume.
+
+    The exclusive contribution is the decrease of the hypervolume, when the decision is removed.
+    The dominated and the repeated decisions have the zero contribution.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions.
+        'reference': The reference point.
+        'get_objectives': The function which maps a decision space into a objectives space.
+
+    --------------------
+    Returns:
+        The tuple of the contributions for the every decision in 'decisions'.
+
+    """
+    points, is_inside = _prepare(decisions, reference, get_objectives)
+    reference = tuple(reference)
+    indices = [index for (index, inside) in enumerate(is_inside) if inside]
+
+    if len(reference) == 2:
+        contributions = _contributions_2d(points, indices, reference)
+        return tuple(contributions.get(index, 0.0) for index in range(len(points)))
+    elif len(reference) == 3:
+        contributions = _contributions_3d(points, indices, reference)
+        return tuple(contributions.get(index, 0.0) for index in range(len(points)))
+
+    contributions = [0.0] * len(points)
+
+    for index in indices:
+        contributions[index] = _contribution(points[index], (points[other] for other in indices if other != index),
+                                             reference)
+
+    return tuple(contributions)
+
+
+def _remove_from_front_2d(points: List[Tuple[float, ...]], front: List[int], count: int,
+                          reference: Sequence[float]) -> List[int]:
+    """Remove the points with the least exclusive contribution from the ordered first front with two objectives.
+
+    The front stays the front after the removal of a point, so only the contributions of its neighbours are changed.
+
+    """
+    # The linked list of the front: the positions of the neighbours, -1 is the reference point.
+    prev_pos = list(range(-1, len(front) - 1))
+    next_pos = list(range(1, len(front) + 1))
+    next_pos[-1] = -1
+
+    def contribution(pos: int) -> float:
+        first_value, second_value = points[front[pos]]
+        next_first = reference[0] if next_pos[pos] == -1 else points[front[next_pos[pos]]][0]
+        prev_second = reference[1] if prev_pos[pos] == -1 else points[front[prev_pos[pos]]][1]
+        return (next_first - first_value) * (prev_second - second_value)
+
+    contributions = [contribution(pos) for pos in range(len(front))]
+    heap = [(contributions[pos], front[pos], pos) for pos in range(len(front))]
+    heapq.heapify(heap)
+    removed = []
+
+    while len(removed) < count:
+        value, index, pos = heapq.heappop(heap)
+
+        # The outdated contribution or the removed point.
+        if contributions[pos] != value:
+            continue
+
+        removed.append(index)
+        contributions[pos] = None
+        before, after = prev_pos[pos], next_pos[pos]
+
+        if before != -1:
+            next_pos[before] = after
+        if after != -1:
+            prev_pos[after] = before
+
+        for neighbour in (before, after):
+            if neighbour != -1:
+                contributions[neighbour] = contribution(neighbour)
+                heapq.heappush(heap, (contributions[neighbour], front[neighbour], neighbour))
+
+    return removed
+
+
+def remove_least_contributors(decisions: Iterable[Any], count: int, reference: Sequence[float],
+                              get_objectives: Callable[[Any], Iterable[Any]] = None) -> Tuple[int]:
+    """Remove the decisions with the least exclusive contribution one by one (as in the SMS-EMOA).
+
+    The contributions are computed once, and they are kept in the heap as the lower bounds of the current
+    contributions. A popped contribution is recomputed, and the decision is removed, if it is still the least one.
+    The decisions, which are not less than the reference point, are removed first.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions.
+        'count': The number of the removed decisions.
+        'reference': The reference point.
+        'get_objectives': The function which maps a decision space into a objectives space.
+
+    --------------------
+    Returns:
+        The tuple of the indices of the removed decisions in the order of the removal.
+
+    """
+    points, is_inside = _prepare(decisions, reference, get_objectives)
+    reference = tuple(reference)
+
+    assert 0 <= count <= len(points), "'count' must be in the range [0, {0}], " \
+                                      "but it is {1}.".format(len(points), count)
+
+    removed = [index for (index, inside) in enumerate(is_inside) if not inside][:count]
+    alive = {index for (index, inside) in enumerate(is_inside) if inside}
+
+    if len(removed) == count:
+        return tuple(removed)
+
+    if len(reference) == 2:
+        order = sorted(alive, key=lambda index: points[index])
+
+        # The ordered points are the first front without the repeated points,
+        # if their second values are strictly decreasing.
+        if all(points[order[pos]][1] > points[order[pos + 1]][1] for pos in range(len(order) - 1)):
+            return tuple(removed + _remove_from_front_2d(points, order, count - len(removed), reference))
+
+        initial = _contributions_2d(points, sorted(alive), reference)
+    elif len(reference) == 3:
+        initial = _contributions_3d(points, sorted(alive), reference)
+    else:
+        initial = {index: _contribution(points[index], (points[other] for other in alive if other != index),
+                                        reference) for index in alive}
+
+    heap = [(contribution, index) for (index, contribution) in initial.items()]
+    heapq.heapify(heap)
+    # The contributions in the heap are recomputed after the last removal, if the index is in it.
+    is_actual = set(alive)
+
+    while len(removed) < count:
+        contribution, index = heapq.heappop(heap)
+
+        if index not in is_actual:
+            contribution = _contribution(points[index], (points[other] for other in alive if other != index),
+                                         reference)
+            is_actual.add(index)
+
+            if heap and (contribution, index) > heap[0]:
+                heapq.heappush(heap, (contribution, index))
+                continue
+
+        removed.append(index)
+        alive.remove(index)
+        is_actual.clear()
+
+    return tuple(removed)
@@ -9,14 +9,63 @@ A Provably Asymptotically Fast Version of the Generalized Jensen Algorithm for N
 
 """
 
-__all__ = ["non_domin_sort"]
+__all__ = ["non_domin_sort", "non_domin_sort_array", "non_domin_sort_many", "iter_fronts"]
 
-from typing import List, Iterable, Tuple, Callable, Dict, Any, Union
-from collections import defaultdict
-import statistics
+from typing import List, Iterable, Iterator, Sequence, Tuple, Callable, Dict, Any, Union
+from collections import defaultdict, Counter
+from array import array
+from itertools import repeat
+import bisect
+import operator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from . import stools as st
 
+# The kinds of the tasks for the '_run_tasks'.
+# The task '_TASK_RESTORE' writes the ordered copy of the range back to the buffer.
+_TASK_HELPER_A, _TASK_HELPER_B, _TASK_MERGE, _TASK_RESTORE = range(4)
+
+# The key of the infeasible decisions with the same violation of the constraints in the '_constrained_sort'.
+# It is not equal to any value of the objectives.
+_INFEASIBLE = object()
+
+# The forms of the result of the 'non_domin_sort'.
+_RESULT_FORMS = ("dict", "indices", "array")
+
+# The engines of the sorting: "python" is the '_run_tasks', "compiled" is the 'compiled' module,
+# "auto" is the "compiled", if it is available and the values are exactly representable as floats.
+_ENGINES = ("auto", "python", "compiled")
+
+# The maximum number of the fronts, which are peeled off by the '_first_front' in the 'iter_fronts',
+# for the number of the objectives. The rest fronts are found by the '_nd_sort' at once.
+# For the greater number of the objectives only the first front is peeled off by the Kung's method.
+ITER_PEELED_FRONTS = {2: 4, 3: 32}
+
+# The maximum number of the fronts, which are peeled off by the '_first_front' in the '_nd_sort_top',
+# for the number of the objectives.
+TOP_PEELED_FRONTS = {2: 4, 3: 32}
+
+# The maximum number of the fronts, which are peeled off by the Kung's method in the '_nd_sort_top'
+# for the greater number of the objectives. A front costs about a third of the sorting of all elements.
+TOP_KUNG_PEELED_FRONTS = 3
+
+# The subproblems of the '_nd_helper_a' with the size less or equal to it are solved by the pairwise comparisons.
+BRUTE_FORCE_SIZE_A = 32
+
+# The subproblems of the '_nd_helper_b', where the product of the sizes of the sets is less or equal to it,
+# are solved by the pairwise comparisons.
+BRUTE_FORCE_SIZE_B = 1024
+
+# The short lists are sorted in the '_select_median_low', because it is faster than the partitioning.
+_SELECT_SORT_THRESHOLD = 64
+
+# If every objective has at most it unique values, then the tie-aware mode is used (see '_rank_compress').
+TIE_DOMAIN_SIZE = 256
+
 
 def _is_seq_has_one_uniq_value(iterable: Iterable[Any]) -> bool:
     """Check. Has 'iterable' only a one unique value?
@@ -57,173 +106,252 @@ def _is_seq_has_one_uniq_value(iterable: Iterable[Any]) -> bool:
     return is_has_uniq_value
 
 
-def _merge(indices1: List[int], indices2: List[int]) -> List[int]:
-    """Merge the two list of the indices. Each list must be sorted.
+def _select_median_low(values: List[Any]) -> Any:
+    """Select the low median of the 'values' by the quickselect algorithm.
+
+    It is equivalent following: 'statistics.median_low(values)', but it takes the expected linear time.
 
     --------------------
     Args:
-        'indices1': A sorted list of the indices.
-        'indices2': A sorted list of the indices.
+        'values': A non-empty list of the values. It is not modified.
 
     --------------------
     Returns:
-        The ordered list of indices.
+        The low median of the 'values'.
 
     """
-    merged_list = indices1 + indices2
+    k = (len(values) - 1) // 2
 
-    index1 = 0
-    index2 = 0
+    while len(values) > _SELECT_SORT_THRESHOLD:
+        # The median of the three values protects from the quadratic time on the ordered values.
+        pivot = sorted((values[0], values[len(values) // 2], values[-1]))[1]
 
-    merge_index = 0
+        less_pivot = [value for value in values if value < pivot]
 
-    while index1 < len(indices1) and index2 < len(indices2):
-        if indices1[index1] < indices2[index2]:
-            merged_list[merge_index] = indices1[index1]
-            index1 += 1
-        else:
-            merged_list[merge_index] = indices2[index2]
-            index2 += 1
-        merge_index += 1
+        if k < len(less_pivot):
+            values = less_pivot
+            continue
+
+        greater_pivot = [value for value in values if value > pivot]
+        count_less_or_eq = len(values) - len(greater_pivot)
+
+        if k < count_less_or_eq:
+            return pivot
+
+        k -= count_less_or_eq
+        values = greater_pivot
+
+    return sorted(values)[k]
+
+
+def _count_median_low(values: List[Any]) -> Any:
+    """Select the low median of the 'values' by the counting of the unique values.
 
-    for i in range(index1, len(indices1)):
-        merged_list[merge_index] = indices1[i]
-        merge_index += 1
+    It takes O(n + u log u) time, where u is the number of the unique values, so it is faster than
+    the '_select_median_low' for the values with the many ties.
 
-    for i in range(index2, len(indices2)):
-        merged_list[merge_index] = indices2[i]
-        merge_index += 1
+    --------------------
+    Args:
+        'values': A non-empty list of the values. It is not modified.
+
+    --------------------
+    Returns:
+        The low median of the 'values'.
+
+    """
+    counts = Counter(values)
+    k = (len(values) - 1) // 2
+
+    for value in sorted(counts):
+        k -= counts[value]
+        if k < 0:
+            return value
 
-    return merged_list
 
+def _counted(stats: "SortStats", routine: Callable[..., Any], *args: Any) -> Any:
+    """Call the 'routine' with the 'args'. It is counted in the 'stats', if it is not None (see 'stats.SortStats')."""
+    return routine(*args) if stats is None else stats.call(routine, *args)
 
-def _split_by(seq_objs_front: List[Dict[str, Union[int, Any]]], indices: List[int], split_value: Any, index_value: int) \
-        -> Tuple[List[int], List[int], List[int]]:
-    """'indices' splits into three lists.
 
-    The three lits are the list of indices, where 'index_value'th value of the objectives is less than a 'split_value',
-    the list of indices, where 'index_value'th value of the objectives is equal to a 'split_value',
-    the list of indices, where 'index_value'th value of the objectives is greater than a 'split_value'.
+def _split_by(buffer: List[int], lo: int, indices: List[int], values: List[Any], split_value: Any) \
+        -> Tuple[int, int]:
+    """The 'indices' splits into three consecutive ranges of the 'buffer', which start at 'lo'.
+
+    The first range contains the indices, where the value is less than a 'split_value',
+    the second range contains the indices, where the value is equal to a 'split_value',
+    the third range contains the indices, where the value is greater than a 'split_value'.
+    The split is stable, so the order of the indices in the each range is preserved.
 
     --------------------
     Args:
-         'seq_objs_front': A dictionary contains the values of the objectives and indices of the fronts.
-         'indices': The indices of the objectives in the 'seq_objs_front'.
+         'buffer': The buffer of the indices.
+         'lo': The start of the range.
+         'indices': The indices for the splitting.
+         'values': The values for the 'indices'.
          'split_value': A value for the splitting.
-         'index_value': The index of the value in the objectives, for the split.
 
     --------------------
     Returns:
-         The tuple of lists of the indices.
+         The tuple (mid1, mid2), where 'buffer[lo:mid1]', 'buffer[mid1:mid2]', 'buffer[mid2:lo + len(indices)]'
+         are the ranges.
 
     """
-    indices_less_split_value = []
-    indices_greater_split_value = []
-    indices_equal_split_value = []
-
-    for index in indices:
-        if seq_objs_front[index]["objs"][index_value] < split_value:
-            indices_less_split_value.append(index)
-        elif seq_objs_front[index]["objs"][index_value] > split_value:
-            indices_greater_split_value.append(index)
+    less_split_value = []
+    equal_split_value = []
+    greater_split_value = []
+
+    for (index, value) in zip(indices, values):
+        if value < split_value:
+            less_split_value.append(index)
+        elif value > split_value:
+            greater_split_value.append(index)
         else:
-            indices_equal_split_value.append(index)
+            equal_split_value.append(index)
+
+    mid1 = lo + len(less_split_value)
+    mid2 = mid1 + len(equal_split_value)
+
+    buffer[lo:mid1] = less_split_value
+    buffer[mid1:mid2] = equal_split_value
+    buffer[mid2:mid2 + len(greater_split_value)] = greater_split_value
+
+    return mid1, mid2
+
+
+def _merge(buffer: List[int], lo: int, hi: int) -> None:
+    """Merge the ordered runs of the range 'buffer[lo:hi]'.
+
+    The range consists of two ordered runs after '_split_by', so the merge takes the linear time.
+
+    """
+    buffer[lo:hi] = sorted(buffer[lo:hi])
+
+
+def _brute_force_a(objs: Sequence[Sequence[Any]], fronts: List[int], indices: List[int], count_of_obj: int) -> None:
+    """Pairwise comparisons for the small subproblems of the '_nd_helper_a'.
+
+    The 'indices' are ordered, so the fronts of the elements, which can dominate an element, are already known.
 
-    return indices_less_split_value, indices_equal_split_value, indices_greater_split_value
+    """
+    projections = [objs[i][:count_of_obj] for i in indices]
+
+    for k in range(1, len(indices)):
+        fitness = projections[k]
+        front = fronts[indices[k]]
+        for i in range(k):
+            # The projections are unique, so the weak dominance is equivalent to the dominance.
+            if fronts[indices[i]] >= front and all(map(operator.le, projections[i], fitness)):
+                front = fronts[indices[i]] + 1
+        fronts[indices[k]] = front
+
+
+def _brute_force_b(objs: Sequence[Sequence[Any]], fronts: List[int], comp_indices: List[int],
+                   assign_indices: List[int], count_of_obj: int) -> None:
+    """Pairwise comparisons for the small subproblems of the '_nd_helper_b'."""
+    comp_projections = [(objs[i][:count_of_obj], fronts[i]) for i in comp_indices]
+
+    for j in assign_indices:
+        fitness = objs[j][:count_of_obj]
+        front = fronts[j]
+        for (comp_fitness, comp_front) in comp_projections:
+            if comp_front >= front and all(map(operator.le, comp_fitness, fitness)):
+                front = comp_front + 1
+        fronts[j] = front
 
 
-def _sweep_a(seq_objs_front: List[Dict[str, Union[Any, str]]], indices: List[int]) -> None:
+def _sweep_a(objs: Sequence[Sequence[Any]], fronts: List[int], indices: Iterable[int],
+             fenwick: st.FenwickMax = None) -> None:
     """Two-objective sorting.
 
-    It attributes front's index to the lexicographically ordered elements in the  'seq_objs_front',
+    It attributes front's index to the lexicographically ordered elements in the 'objs',
     with the indices in the 'indices', based on the first two values of the objectives using a line-sweep algorithm.
 
     --------------------
     Args:
-        'seq_objs_front': A dictionary contains the values of the objectives and indices of the fronts.
-        'indices': The indices of the objectives in the 'seq_objs_front'.
+        'objs': The lexicographically ordered values of the objectives.
+        'fronts': The indices of the fronts of the 'objs'.
+        'indices': The indices of the objectives in the 'objs'.
+        'fenwick': The tree over the ranks of the second values in the tie-aware mode or None.
 
     --------------------
     Returns:
         None
 
     """
-    init_ind = set((indices[0],))
+    stairs = st.FrontStaircase() if fenwick is None else fenwick
 
-    for k in range(1, len(indices)):
-        i = indices[k]
-        indices_where_sec_values_less_or_eq = [index for index in init_ind
-                                               if seq_objs_front[index]["objs"][1] <= seq_objs_front[i]["objs"][1]]
-        if indices_where_sec_values_less_or_eq:
-            max_front = max(seq_objs_front[index]["front"]
-                            for index in indices_where_sec_values_less_or_eq)
-            seq_objs_front[i]["front"] = max(seq_objs_front[i]["front"], max_front + 1)
+    for i in indices:
+        value = objs[i][1]
+        fronts[i] = max(fronts[i], stairs.max_front(value) + 1)
+        stairs.add(value, fronts[i])
 
-        init_ind -= {index for index in init_ind if seq_objs_front[index]
-                     ["front"] == seq_objs_front[i]["front"]}
-        init_ind.add(i)
+    if fenwick is not None:
+        fenwick.clear()
 
 
-def _sweep_b(seq_objs_front: List[Dict[str, Union[Any, int]]], comp_indices: List[int], assign_indices: List[int]) -> None:
+def _sweep_b(objs: Sequence[Sequence[Any]], fronts: List[int], comp_indices: Sequence[int],
+             assign_indices: Iterable[int], fenwick: st.FenwickMax = None) -> None:
     """Two-objective sorting procedure.
 
-    It attributes front's indices to elements in the 'seq_objs_front', with the indices in the 'assign_indices',
+    It attributes front's indices to elements in the 'objs', with the indices in the 'assign_indices',
     based on the first two values of the objectives by comparing them to fitnesses,
     with the indices in the  'comp_indices', using a line-sweep algorithm.
 
     --------------------
     Args:
-        'seq_objs_front': A dictionary contains the values of the objectives and indices of the fronts.
+        'objs': The lexicographically ordered values of the objectives.
+        'fronts': The indices of the fronts of the 'objs'.
         'comp_indices': The indices for comparing.
         'assign_indices': The indices for assign front.
+        'fenwick': The tree over the ranks of the second values in the tie-aware mode or None.
 
     --------------------
     Returns:
         None
 
     """
-
-    init_ind = set()
+    stairs = st.FrontStaircase() if fenwick is None else fenwick
     p = 0
 
     for j in assign_indices:
-        if p < len(comp_indices):
-            fitness_right = seq_objs_front[j]["objs"][:2]
+        fitness_right = objs[j][:2]
 
         while p < len(comp_indices):
             i = comp_indices[p]
-            fitness_left = seq_objs_front[i]["objs"][:2]
+            fitness_left = objs[i][:2]
             if fitness_left <= fitness_right:
-                indices_less_value_eq_front = [index for index in init_ind
-                                               if seq_objs_front[index]["front"] == seq_objs_front[i]["front"]
-                                               and seq_objs_front[index]["objs"][1] < seq_objs_front[i]["objs"][1]]
-
-                if not indices_less_value_eq_front:
-                    init_ind -= {index for index in init_ind
-                                 if seq_objs_front[index]["front"] == seq_objs_front[i]["front"]}
-                    init_ind.add(i)
+                stairs.add(fitness_left[1], fronts[i])
                 p += 1
             else:
                 break
-        indices_less_or_eq_value = [index for index in init_ind
-                                    if seq_objs_front[index]["objs"][1] <= seq_objs_front[j]["objs"][1]]
 
-        if indices_less_or_eq_value:
-            max_front = max(seq_objs_front[index]["front"] for index in indices_less_or_eq_value)
-            seq_objs_front[j]["front"] = max(seq_objs_front[j]["front"], max_front + 1)
+        fronts[j] = max(fronts[j], stairs.max_front(fitness_right[1]) + 1)
+
+    if fenwick is not None:
+        fenwick.clear()
 
 
-def _nd_helper_a(seq_objs_front: List[Dict[str, Union[Any, int]]], indices: List[int], count_of_obj: int) -> None:
-    """Recursive procedure.
+def _nd_helper_a(objs: Sequence[Sequence[Any]], fronts: List[int], buffer: List[int], tasks: List[Tuple],
+                 lo: int, hi: int, count_of_obj: int, fenwick: st.FenwickMax = None, stats: "SortStats" = None) \
+        -> None:
+    """Divide-and-conquer procedure.
 
-    It attributes front's indices to all elements in the 'seq_objs_front', with the indices in the 'indices',
+    It attributes front's indices to all elements in the 'objs', with the indices in the 'buffer[lo:hi]',
     for the first 'count_of_obj' values of the objectives.
+    The subproblems are pushed to the 'tasks' in the reverse order of the execution.
+    The range must be ordered and it is ordered after the execution of the subproblems.
 
     --------------------
     Args:
-         'seq_objs_front': A dictionary contains the values of the objectives and indices of the fronts.
-         'indices': The indices for assign front.
+         'objs': The lexicographically ordered values of the objectives.
+         'fronts': The indices of the fronts of the 'objs'.
+         'buffer': The buffer of the indices.
+         'tasks': The stack of the tasks.
+         'lo': The start of the range of the indices for assign front.
+         'hi': The end of the range of the indices for assign front (exclusive).
          'count_of_obj': The number of the values from the objectives, for the sorting.
+         'fenwick': The tree for the sweep in the tie-aware mode or None (see '_rank_compress').
+         'stats': The statistics of the sorting or None (see 'stats.SortStats').
 
     --------------------
     Returns:
@@ -231,49 +359,62 @@ def _nd_helper_a(seq_objs_front: List[Dict[str, Union[Any, int]]], indices: List
 
     """
 
-    if len(indices) < 2:
+    if hi - lo < 2:
         return
-    elif len(indices) == 2:
-        index_l, index_r = indices[0], indices[1]
-        fitness1, fitness2 = seq_objs_front[index_l]["objs"][:
-                                                             count_of_obj], seq_objs_front[index_r]["objs"][:count_of_obj]
-
-        if st.is_dominate(fitness1, fitness2):
-            seq_objs_front[index_r]["front"] = max(
-                seq_objs_front[index_r]["front"], seq_objs_front[index_l]["front"] + 1)
+    elif hi - lo <= BRUTE_FORCE_SIZE_A:
+        if stats is None:
+            _brute_force_a(objs, fronts, buffer[lo:hi], count_of_obj)
+        else:
+            stats.call(_brute_force_a, objs, fronts, buffer[lo:hi], count_of_obj)
     elif count_of_obj == 2:
-        _sweep_a(seq_objs_front, indices)
-    elif _is_seq_has_one_uniq_value(seq_objs_front[index]["objs"][count_of_obj - 1] for index in indices):
-        _nd_helper_a(seq_objs_front, indices, count_of_obj - 1)
+        if stats is None:
+            _sweep_a(objs, fronts, buffer[lo:hi], fenwick)
+        else:
+            stats.call(_sweep_a, objs, fronts, buffer[lo:hi], fenwick)
     else:
-        median = statistics.median_low(
-            seq_objs_front[index]["objs"][count_of_obj - 1] for index in indices)
+        indices = buffer[lo:hi]
+        values = [objs[index][count_of_obj - 1] for index in indices]
 
-        less_median, equal_median, greater_median = _split_by(
-            seq_objs_front, indices, median, count_of_obj - 1)
+        if _is_seq_has_one_uniq_value(values):
+            tasks.append((_TASK_HELPER_A, lo, hi, count_of_obj - 1))
+            return
 
-        less_and_equal_median = _merge(equal_median, less_median)
+        median = _select_median_low(values) if fenwick is None else _count_median_low(values)
+        mid1, mid2 = _counted(stats, _split_by, buffer, lo, indices, values, median)
 
-        _nd_helper_a(seq_objs_front, less_median, count_of_obj)
-        _nd_helper_b(seq_objs_front, less_median, equal_median, count_of_obj - 1)
-        _nd_helper_a(seq_objs_front, equal_median, count_of_obj - 1)
-        _nd_helper_b(seq_objs_front, less_and_equal_median, greater_median, count_of_obj - 1)
-        _nd_helper_a(seq_objs_front, greater_median, count_of_obj)
+        tasks.extend(((_TASK_RESTORE, lo, indices),
+                      (_TASK_HELPER_A, mid2, hi, count_of_obj),
+                      (_TASK_HELPER_B, lo, mid2, mid2, hi, count_of_obj - 1),
+                      (_TASK_MERGE, lo, mid2),
+                      (_TASK_HELPER_A, mid1, mid2, count_of_obj - 1),
+                      (_TASK_HELPER_B, lo, mid1, mid1, mid2, count_of_obj - 1),
+                      (_TASK_HELPER_A, lo, mid1, count_of_obj)))
 
 
-def _nd_helper_b(seq_objs_front: List[Dict[str, Union[Any, int]]], comp_indices: List[int], assign_indices: List[int], count_of_obj: int) -> None:
-    """Recursive procedure.
+def _nd_helper_b(objs: Sequence[Sequence[Any]], fronts: List[int], buffer: List[int], tasks: List[Tuple],
+                 comp_lo: int, comp_hi: int, assign_lo: int, assign_hi: int, count_of_obj: int,
+                 fenwick: st.FenwickMax = None, stats: "SortStats" = None) -> None:
+    """Divide-and-conquer procedure.
 
-    It attributes a front's indices to all elements in the 'seq_objs_front', with the indices in the  'assign_indices',
-    for the first 'count_of_obj' values of the objectives, by comparing them to elements in the 'seq_objs_front',
-    with the indices in the 'comp_indices'.
+    It attributes a front's indices to all elements in the 'objs',
+    with the indices in the 'buffer[assign_lo:assign_hi]', for the first 'count_of_obj' values of the objectives, by comparing them to elements in the 'objs',
+    with the indices in the 'buffer[comp_lo:comp_hi]'.
+    The subproblems are pushed to the 'tasks' in the reverse order of the execution.
+    The ranges must not intersect. They must be ordered and they are ordered after the execution of the subproblems.
 
     --------------------
     Args:
-         'seq_objs_front': A dictionary contains the values of the objectives and indices of the fronts.
-         'comp_indices': The indices for comparing.
-         'assign_indices': The indices for assign front.
+         'objs': The lexicographically ordered values of the objectives.
+         'fronts': The indices of the fronts of the 'objs'.
+         'buffer': The buffer of the indices.
+         'tasks': The stack of the tasks.
+         'comp_lo': The start of the range of the indices for comparing.
+         'comp_hi': The end of the range of the indices for comparing (exclusive).
+         'assign_lo': The start of the range of the indices for assign front.
+         'assign_hi': The end of the range of the indices for assign front (exclusive).
          'count_of_obj': The number of the values from the objectives, for the sorting.
+         'fenwick': The tree for the sweep in the tie-aware mode or None (see '_rank_compress').
+         'stats': The statistics of the sorting or None (see 'stats.SortStats').
 
     --------------------
     Returns:
@@ -281,75 +422,466 @@ def _nd_helper_b(seq_objs_front: List[Dict[str, Union[Any, int]]], comp_indices:
 
     """
 
-    if not comp_indices or not assign_indices:
+    if comp_lo == comp_hi or assign_lo == assign_hi:
         return
-    elif len(comp_indices) == 1 or len(assign_indices) == 1:
-        for i in assign_indices:
-            hv = seq_objs_front[i]["objs"][:count_of_obj]
-            for j in comp_indices:
-                lv = seq_objs_front[j]["objs"][:count_of_obj]
-                if st.is_dominate(lv, hv) or lv == hv:
-                    seq_objs_front[i]["front"] = max(
-                        seq_objs_front[i]["front"], seq_objs_front[j]["front"] + 1)
+    elif comp_hi - comp_lo == 1 or assign_hi - assign_lo == 1 \
+            or (comp_hi - comp_lo) * (assign_hi - assign_lo) <= BRUTE_FORCE_SIZE_B:
+        if stats is None:
+            _brute_force_b(objs, fronts, buffer[comp_lo:comp_hi], buffer[assign_lo:assign_hi], count_of_obj)
+        else:
+            stats.call(_brute_force_b, objs, fronts, buffer[comp_lo:comp_hi], buffer[assign_lo:assign_hi],
+                       count_of_obj)
     elif count_of_obj == 2:
-        _sweep_b(seq_objs_front, comp_indices, assign_indices)
+        if stats is None:
+            _sweep_b(objs, fronts, buffer[comp_lo:comp_hi], buffer[assign_lo:assign_hi], fenwick)
+        else:
+            stats.call(_sweep_b, objs, fronts, buffer[comp_lo:comp_hi], buffer[assign_lo:assign_hi], fenwick)
     else:
-        values_objs_from_comp_indices = {
-            seq_objs_front[i]["objs"][count_of_obj - 1] for i in comp_indices}
-        values_objs_from_assign_indices = {
-            seq_objs_front[j]["objs"][count_of_obj - 1] for j in assign_indices}
+        comp_indices, assign_indices = buffer[comp_lo:comp_hi], buffer[assign_lo:assign_hi]
+        comp_values = [objs[i][count_of_obj - 1] for i in comp_indices]
+        assign_values = [objs[j][count_of_obj - 1] for j in assign_indices]
+
+        if max(comp_values) <= min(assign_values):
+            tasks.append((_TASK_HELPER_B, comp_lo, comp_hi, assign_lo, assign_hi, count_of_obj - 1))
+        elif min(comp_values) <= max(assign_values):
+            values = comp_values + assign_values
+            median = _select_median_low(values) if fenwick is None else _count_median_low(values)
+
+            comp_mid1, comp_mid2 = _counted(stats, _split_by, buffer, comp_lo, comp_indices, comp_values, median)
+            assign_mid1, assign_mid2 = _counted(stats, _split_by, buffer, assign_lo, assign_indices, assign_values,
+                                                median)
+
+            tasks.extend(((_TASK_RESTORE, assign_lo, assign_indices),
+                          (_TASK_RESTORE, comp_lo, comp_indices),
+                          (_TASK_HELPER_B, comp_mid2, comp_hi, assign_mid2, assign_hi, count_of_obj),
+                          (_TASK_HELPER_B, comp_lo, comp_mid2, assign_mid2, assign_hi, count_of_obj - 1),
+                          (_TASK_MERGE, comp_lo, comp_mid2),
+                          (_TASK_HELPER_B, comp_mid1, comp_mid2, assign_mid1, assign_mid2, count_of_obj - 1),
+                          (_TASK_HELPER_B, comp_lo, comp_mid1, assign_mid1, assign_mid2, count_of_obj - 1),
+                          (_TASK_HELPER_B, comp_lo, comp_mid1, assign_lo, assign_mid1, count_of_obj)))
+
+
+def _run_tasks(objs: Sequence[Sequence[Any]], fronts: List[int], buffer: List[int], tasks: List[Tuple],
+               parallel: Any = None, fenwick: st.FenwickMax = None, max_tasks: int = None,
+               stats: "SortStats" = None) -> int:
+    """Execute the tasks from the stack, until it is empty.
+
+    The divide-and-conquer procedures push their subproblems to the stack instead of the recursive calls,
+    so the depth of the recursion does not depend on the input.
+
+    --------------------
+    Args:
+         'objs': The lexicographically ordered values of the objectives.
+         'fronts': The indices of the fronts of the 'objs'.
+         'buffer': The buffer of the indices.
+         'tasks': The stack of the tasks. Each task is a tuple: the kind of the task and its arguments.
+         'parallel': The executor of the large subproblems of the '_nd_helper_b' (see 'parallel.ParallelHelperB')
+         or None.
+         'fenwick': The tree for the sweep in the tie-aware mode or None (see '_rank_compress').
+         'max_tasks': The maximum number of the executed tasks or None. If it is not None, then the rest tasks
+         stay in the stack, and the execution is continued by the next call with the same stack.
+         'stats': The statistics of the sorting or None (see 'stats.SortStats'). The subproblems, which are
+         executed by the 'parallel', are not counted.
+
+    --------------------
+    Returns:
+         The number of the elements, whose fronts are final after the executed tasks. The task '_TASK_HELPER_A',
+         which does not push the subproblems, is executed after all elements, which dominate its elements,
+         so the fronts of its elements are final.
 
-        min_from_comp_indices, max_from_comp_indices = \
-            min(values_objs_from_comp_indices), max(values_objs_from_comp_indices)
+    """
+    count_of_final = 0
+    count_of_tasks = 0
+
+    while tasks and (max_tasks is None or count_of_tasks < max_tasks):
+        task = tasks.pop()
+        kind = task[0]
+        count_of_tasks += 1
+
+        if kind == _TASK_HELPER_A:
+            size_of_stack = len(tasks)
+            if stats is None:
+                _nd_helper_a(objs, fronts, buffer, tasks, *task[1:], fenwick)
+            else:
+                stats.call(_nd_helper_a, objs, fronts, buffer, tasks, *task[1:], fenwick, stats)
+            if len(tasks) == size_of_stack:
+                count_of_final += task[2] - task[1]
+        elif kind == _TASK_HELPER_B:
+            if parallel is not None and parallel.accepts(*task[1:]):
+                parallel.helper_b(objs, fronts, buffer, *task[1:])
+            elif stats is None:
+                _nd_helper_b(objs, fronts, buffer, tasks, *task[1:], fenwick)
+            else:
+                stats.call(_nd_helper_b, objs, fronts, buffer, tasks, *task[1:], fenwick, stats)
+        elif kind == _TASK_MERGE:
+            if stats is None:
+                _merge(buffer, task[1], task[2])
+            else:
+                stats.call(_merge, buffer, task[1], task[2])
+        else:
+            lo, indices = task[1], task[2]
+            buffer[lo:lo + len(indices)] = indices
 
-        min_from_assign_indices, max_from_assign_indices = \
-            min(values_objs_from_assign_indices), max(values_objs_from_assign_indices)
+        if stats is not None:
+            stats.add_depth(len(tasks))
 
-        if max_from_comp_indices <= min_from_assign_indices:
-            _nd_helper_b(seq_objs_front, comp_indices, assign_indices, count_of_obj - 1)
-        elif min_from_comp_indices <= max_from_assign_indices:
-            median = statistics.median_low(values_objs_from_comp_indices |
-                                           values_objs_from_assign_indices)
+    return count_of_final
 
-            less_median_indices_1, equal_median_indices_1, greater_median_indices_1 = \
-                _split_by(seq_objs_front, comp_indices, median, count_of_obj - 1)
-            less_median_indices_2, equal_median_indices_2, greater_median_indices_2 = \
-                _split_by(seq_objs_front, assign_indices, median, count_of_obj - 1)
 
-            less_end_equal_median_indices_1 = _merge(less_median_indices_1, equal_median_indices_1)
+def _first_front(objs: Sequence[Sequence[Any]], indices: Iterable[int], count_of_obj: int) \
+        -> Tuple[List[int], List[int]]:
+    """Split the unique lexicographically ordered elements into the first front and the rest.
 
-            _nd_helper_b(seq_objs_front, less_median_indices_1, less_median_indices_2, count_of_obj)
-            _nd_helper_b(seq_objs_front, less_median_indices_1,
-                         equal_median_indices_2, count_of_obj - 1)
-            _nd_helper_b(seq_objs_front, equal_median_indices_1,
-                         equal_median_indices_2, count_of_obj - 1)
-            _nd_helper_b(seq_objs_front, less_end_equal_median_indices_1,
-                         greater_median_indices_2, count_of_obj - 1)
-            _nd_helper_b(seq_objs_front, greater_median_indices_1,
-                         greater_median_indices_2, count_of_obj)
+    An element can be dominated only by the lexicographically less elements,
+    so it is compared with the already found elements of the first front.
+    For two and three objectives it takes O(n log n) time.
 
+    --------------------
+    Args:
+         'objs': The lexicographically ordered unique values of the objectives.
+         'indices': The ordered indices of the objectives in the 'objs'.
+         'count_of_obj': The number of the objectives.
 
-def non_domin_sort(decisions: Iterable[Any], get_objectives: Callable[[Any], Iterable[Any]] = None,
-                   only_front_indices: bool = False) -> Union[Tuple[int], Dict[int, Tuple[Any]]]:
-    """A non-dominated sorting.
+    --------------------
+    Returns:
+         The tuple of the ordered lists: the indices of the first front and the rest indices.
 
-    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+    """
+    first_front = []
+    rest = []
+
+    if count_of_obj == 2:
+        min_value = None
+        for i in indices:
+            value = objs[i][1]
+            if not first_front or value < min_value:
+                first_front.append(i)
+                min_value = value
+            else:
+                rest.append(i)
+    elif count_of_obj == 3:
+        # The staircase of the first front on the second and the third values:
+        # 'second_values' are increasing, 'third_values' are decreasing.
+        second_values = []
+        third_values = []
+        for i in indices:
+            _, second_value, third_value = objs[i]
+            pos = bisect.bisect_right(second_values, second_value)
+            if pos and third_values[pos - 1] <= third_value:
+                rest.append(i)
+            else:
+                first_front.append(i)
+                start = end = bisect.bisect_left(second_values, second_value, 0, pos)
+                while end < len(third_values) and third_values[end] >= third_value:
+                    end += 1
+                second_values[start:end] = (second_value,)
+                third_values[start:end] = (third_value,)
+    else:
+        for i in indices:
+            fitness = objs[i]
+            if any(all(map(operator.le, objs[j], fitness)) for j in first_front):
+                rest.append(i)
+            else:
+                first_front.append(i)
+
+    return first_front, rest
+
+
+def _peel_front(objs: Sequence[Sequence[Any]], rest: List[int], count_of_obj: int, stats: "SortStats" = None) \
+        -> Tuple[List[int], List[int]]:
+    """Split the ordered indices 'rest' into the indices of the first front of their elements and the rest indices.
+
+    The '_first_front' compares the elements pairwise for more than three objectives,
+    so the first front is found by the Kung's method in this case.
+
+    """
+    if count_of_obj <= 3:
+        return _counted(stats, _first_front, objs, rest, count_of_obj)
+
+    # The 'pareto' module imports this module.
+    from . import pareto
+
+    front = [rest[j] for j in pareto._first_front_indices([objs[i] for i in rest], count_of_obj)]
+    front_set = set(front)
+
+    return front, [i for i in rest if i not in front_set]
+
+
+def _nd_sort_top(objs: Sequence[Sequence[Any]], count_of_obj: int, counts: Sequence[int],
+                 max_fronts: int = None, min_count: int = None, workers: int = None, engine: str = "python",
+                 ties: bool = False, stats: "SortStats" = None) -> List[int]:
+    """Attribute front's indices to the unique lexicographically ordered values of the objectives,
+    until the requested fronts are found.
+
+    At most 'TOP_PEELED_FRONTS' or 'TOP_KUNG_PEELED_FRONTS' fronts are peeled off one by one. If the requested fronts
+    are not found after it, then the rest elements are sorted by the '_nd_sort' at once and their indices
+    are capped. The rest elements get the index of the next front after the requested fronts,
+    it means that their front's index is greater or equal to it.
 
     --------------------
     Args:
-        'decisions': The sequence of the decisions for non-dominated sorting.
-        'get_objectives': The function which maps a decision space into a objectives space.
-        'only_front_indices':
+         'objs': The lexicographically ordered unique values of the objectives.
+         'count_of_obj': The number of the objectives.
+         'counts': The number of the decisions for the every element in 'objs'.
+         'max_fronts': The maximum number of the found fronts or None.
+         'min_count': The minimum number of the decisions in the found fronts or None.
+         'workers', 'engine', 'ties', 'stats': The parameters of the '_nd_sort'.
 
     --------------------
     Returns:
-        If 'only_front_indices' is False:
-            A dictionary. It contains indices of fronts as keys and values are tuple consist of
-            'decisions' which have a same index of the front.
-        Otherwise:
-            Tuple of front's indices for the every decision in 'decisions'.
+         The list of front's indices for the every element in 'objs'.
+
+    """
+    def is_found(count_of_fronts: int, count_in_fronts: int) -> bool:
+        return (max_fronts is not None and count_of_fronts >= max_fronts) or \
+               (min_count is not None and count_in_fronts >= min_count)
+
+    fronts = [0] * len(objs)
+    rest = list(range(len(objs)))
+    front_index = 0
+    count_in_fronts = 0
+    peeled_fronts = TOP_PEELED_FRONTS.get(count_of_obj, TOP_KUNG_PEELED_FRONTS)
+
+    while rest and front_index < peeled_fronts and not is_found(front_index, count_in_fronts):
+        front, rest = _peel_front(objs, rest, count_of_obj, stats)
+
+        for i in front:
+            fronts[i] = front_index
+            count_in_fronts += counts[i]
+
+        front_index += 1
+
+    if not rest or is_found(front_index, count_in_fronts):
+        for i in rest:
+            fronts[i] = front_index
+        return fronts
+
+    # The fronts of the rest elements are shifted by the number of the peeled fronts.
+    rest_fronts = _nd_sort(objs if front_index == 0 else [objs[i] for i in rest], count_of_obj, workers, engine,
+                           ties, stats)
+    front_counts = [0] * (max(rest_fronts) + 1)
+
+    for (i, front) in zip(rest, rest_fronts):
+        front_counts[front] += counts[i]
+
+    # The index of the first front after the requested fronts.
+    last_front = len(front_counts)
+
+    for (front, front_count) in enumerate(front_counts):
+        if is_found(front_index + front, count_in_fronts):
+            last_front = front
+            break
+        count_in_fronts += front_count
+
+    for (i, front) in zip(rest, rest_fronts):
+        fronts[i] = front_index + min(front, last_front)
+
+    return fronts
+
+
+def _rank_compress(objs: Sequence[Sequence[Any]], max_domain_size: int = None) \
+        -> Union[Tuple[List[Tuple[int, ...]], List[int]], None]:
+    """Replace the values of the every objective by their dense ranks for the tie-aware mode.
+
+    The ranks preserve the order of the values of the every objective, so they preserve the dominance
+    and the lexicographical order. In the tie-aware mode, the sweeps use the 'stools.FenwickMax' over
+    the ranks of the second objective and the medians are found by the counting.
+
+    --------------------
+    Args:
+         'objs': The values of the objectives.
+         'max_domain_size': The maximum number of the unique values of an objective or None.
+
+    --------------------
+    Returns:
+         The tuple: the ranks of the values of the objectives and the number of the unique values of the every
+         objective, or None, if an objective has more than 'max_domain_size' unique values.
+
+    """
+    columns = list(zip(*objs))
+    domains = []
+
+    for column in columns:
+        domain = set(column)
+        if max_domain_size is not None and len(domain) > max_domain_size:
+            return None
+        domains.append(domain)
+
+    rank_columns = []
+
+    for (column, domain) in zip(columns, domains):
+        ranks = {value: rank for (rank, value) in enumerate(sorted(domain))}
+        rank_columns.append(map(ranks.__getitem__, column))
+
+    return list(zip(*rank_columns)), [len(domain) for domain in domains]
+
+
+def _is_compiled_engine(engine: str, workers: int, is_float_exact: Callable[[], bool]) -> bool:
+    """Check. Is the compiled engine used for the sorting?
+
+    --------------------
+    Args:
+         'engine': The engine of the sorting (see '_ENGINES').
+         'workers': The number of the worker processes or None. The compiled engine is sequential,
+         so it is not selected automatically for the parallel sorting.
+         'is_float_exact': The function without arguments, it checks the values of the objectives
+         (see 'parallel.is_float_exact').
+
+    --------------------
+    Returns:
+         True, if the compiled engine is used, otherwise False.
+
+    --------------------
+    Raises:
+        ImportError: If 'engine' is "compiled", but the NumPy or the Numba is not installed.
+
+    """
+    assert engine in _ENGINES, "'engine' must be one of the {0}, but it is {1}.".format(_ENGINES, engine)
+
+    if engine == "python":
+        return False
+
+    from . import compiled as cmp
+
+    if engine == "compiled":
+        if not cmp.is_available():
+            raise ImportError("The engine \"compiled\" requires the NumPy and the Numba.")
+        assert is_float_exact(), "The engine \"compiled\" requires the values of the objectives, " \
+                                 "which are exactly representable as floats."
+        return True
+
+    return cmp.is_available() and (workers is None or workers <= 1) and is_float_exact()
+
+
+def _nd_sort(objs: Sequence[Sequence[Any]], count_of_obj: int, workers: int = None,
+             engine: str = "python", ties: bool = False, stats: "SortStats" = None) -> List[int]:
+    """Attribute front's indices to the unique lexicographically ordered values of the objectives.
+
+    --------------------
+    Args:
+         'objs': The lexicographically ordered unique values of the objectives.
+         'count_of_obj': The number of the objectives.
+         'workers': The number of the worker processes for the large subproblems or None.
+         'engine': The engine of the sorting (see '_ENGINES').
+         'ties': If it is True, then the tie-aware mode is used. If it is None, then the tie-aware mode is used,
+         when every objective has at most 'TIE_DOMAIN_SIZE' unique values (see '_rank_compress').
+         'stats': The statistics of the sorting or None (see 'stats.SortStats'). The compiled engine is not counted.
+
+    --------------------
+    Returns:
+         The list of front's indices for the every element in 'objs'.
+
+    """
+    if engine != "python":
+        from . import parallel as par
+
+        if _is_compiled_engine(engine, workers, lambda: par.is_float_exact(objs)):
+            from . import compiled as cmp
+
+            return cmp.nd_sort(objs, count_of_obj, BRUTE_FORCE_SIZE_A, BRUTE_FORCE_SIZE_B)
+
+    fronts = [0] * len(objs)
+    buffer = list(range(len(objs)))
+    tasks = [(_TASK_HELPER_A, 0, len(objs), count_of_obj)]
+
+    if ties is not False and (workers is None or workers <= 1):
+        compressed = _rank_compress(objs, TIE_DOMAIN_SIZE if ties is None else None)
+
+        if compressed is not None:
+            rank_objs, domain_sizes = compressed
+            _run_tasks(rank_objs, fronts, buffer, tasks, fenwick=st.FenwickMax(domain_sizes[1]), stats=stats)
+            return fronts
+
+    if workers is not None and workers > 1 and count_of_obj > 2:
+        from . import parallel as par
+
+        if len(objs) >= par.PARALLEL_THRESHOLD and par.is_float_exact(objs):
+            try:
+                parallel = par.ParallelHelperB(objs, count_of_obj, workers)
+            except ImportError:
+                # The shared memory requires Python 3.8, otherwise the sorting is sequential.
+                parallel = None
+
+            if parallel is not None:
+                with parallel:
+                    _run_tasks(objs, fronts, buffer, tasks, parallel, stats=stats)
+                return fronts
+
+    _run_tasks(objs, fronts, buffer, tasks, stats=stats)
+    return fronts
+
+
+def _assemble_fronts(objs_dict: Dict[Tuple[Any, ...], List[Tuple[int, Any]]], unique_objs: List[Tuple[Any, ...]],
+                     unique_fronts: List[int], result: str) \
+        -> Union[Tuple[int], Dict[int, Tuple[Any]], Tuple[array, array, array]]:
+    """Build the result of the 'non_domin_sort' in the linear time.
+
+    --------------------
+    Args:
+         'objs_dict': The dictionary contains the objectives as keys and the pairs (index, decision) as values.
+         'unique_objs': The lexicographically ordered unique values of the objectives.
+         'unique_fronts': The indices of the fronts of the 'unique_objs'.
+         'result': The form of the result (see 'non_domin_sort').
+
+    --------------------
+    Returns:
+         The result of the 'non_domin_sort'.
+
     """
+    if result == "dict":
+        # The dictionary contains indices of the fronts as keys and the list of 'decisions' as values.
+        front_lists = defaultdict(list)
+
+        for (objs, front) in zip(unique_objs, unique_fronts):
+            front_lists[front].extend(decision for (index, decision) in objs_dict[objs])
+
+        return defaultdict(tuple, ((front, tuple(decisions)) for (front, decisions) in front_lists.items()))
+
+    total_decisions = sum(map(len, objs_dict.values()))
+    fronts = array("i", bytes(total_decisions * array("i").itemsize))
+
+    for (objs, front) in zip(unique_objs, unique_fronts):
+        for (index, _) in objs_dict[objs]:
+            fronts[index] = front
+
+    if result == "indices":
+        return tuple(fronts)
+
+    # The counting sort of the decisions by the fronts.
+    front_offsets = array("i", bytes((max(unique_fronts) + 2) * array("i").itemsize))
+
+    for (objs, front) in zip(unique_objs, unique_fronts):
+        front_offsets[front + 1] += len(objs_dict[objs])
+
+    for front in range(1, len(front_offsets)):
+        front_offsets[front] += front_offsets[front - 1]
+
+    order = array("i", bytes(total_decisions * array("i").itemsize))
+    positions = front_offsets[:-1]
+
+    for (objs, front) in zip(unique_objs, unique_fronts):
+        for (index, _) in objs_dict[objs]:
+            order[positions[front]] = index
+            positions[front] += 1
+
+    return fronts, order, front_offsets
 
+
+def _group_by_objectives(decisions: Iterable[Any], get_objectives: Callable[[Any], Iterable[Any]] = None) \
+        -> Tuple[Dict[Tuple[Any, ...], List[Tuple[int, Any]]], int]:
+    """Group the decisions by the values of the objectives.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions.
+        'get_objectives': The function which maps a decision space into a objectives space or None.
+
+    --------------------
+    Returns:
+        The tuple: the dictionary contains the objectives as keys and the pairs (index, decision) as values,
+        and the number of the objectives.
+
+    """
     # The dictionary contains the objectives as keys and indices of the their preimages in the 'decisions' as values.
     objs_dict = defaultdict(list)
 
@@ -382,28 +914,408 @@ def non_domin_sort(decisions: Iterable[Any], get_objectives: Callable[[Any], Ite
 
     assert total_unique_objs != 0, "The sequence of the decisions or values of the objectives is empty."
 
-    # The list 'unique_objs' never changes, but its elements yes.
-    # It sorted in the lexicographical order.
-    unique_objs_and_fronts = [{"objs": fitness, "front": 0} for fitness in sorted(objs_dict.keys())]
-
-    # Further, algorithm works only with the indices of list 'unique_objs'.
-    indices_uniq_objs = list(range(len(unique_objs_and_fronts)))
-    _nd_helper_a(unique_objs_and_fronts, indices_uniq_objs, count_of_obj)
-
-    if only_front_indices is True:
-        total_decisions = sum(map(len, (objs_dict[objs] for objs in objs_dict)))
-        fronts = list(range(total_decisions))
-        for objs in unique_objs_and_fronts:
-            for (index, dec) in objs_dict[objs["objs"]]:
-                fronts[index] = objs["front"]
-        fronts = tuple(fronts)
+    return objs_dict, count_of_obj
+
+
+def _epsilon_objectives(get_objectives: Callable[[Any], Iterable[Any]],
+                        epsilon: Union[Any, Sequence[Any]]) -> Callable[[Any], Tuple[int, ...]]:
+    """Return the function which maps a decision into the box of the epsilon-grid (see 'stools.epsilon_box')."""
+    if hasattr(epsilon, "__len__"):
+        assert all(size > 0 for size in epsilon), "'epsilon' must be > 0, but it is {0}.".format(epsilon)
     else:
-        # The dictionary contains indices of the fronts as keys and the tuple of 'decisions' as values.
-        fronts = defaultdict(tuple)
+        assert epsilon > 0, "'epsilon' must be > 0, but it is {0}.".format(epsilon)
 
-        # Generate fronts.
-        for objs_front in unique_objs_and_fronts:
-            fronts[objs_front["front"]
-                   ] += tuple(decision for (index, decision) in objs_dict[objs_front["objs"]])
+    if get_objectives is None:
+        return lambda decision: st.epsilon_box(decision, epsilon)
 
-    return fronts
+    return lambda decision: st.epsilon_box(tuple(get_objectives(decision)), epsilon)
+
+
+def _constrained_sort(objs_dict: Dict[Tuple[Any, ...], List[Tuple[int, Any]]], count_of_obj: int,
+                      get_violation: Callable[[Any], Any], workers: int = None, engine: str = "python",
+                      ties: bool = False, stats: "SortStats" = None) \
+        -> Tuple[Dict[Tuple[Any, ...], List[Tuple[int, Any]]], List[Tuple[Any, ...]], List[int]]:
+    """Attribute front's indices by the constrained dominance (see 'stools.is_constrained_dominate').
+
+    The feasible decisions are dominated only by the feasible decisions, so they are sorted by the '_nd_sort'.
+    The infeasible decisions are dominated by all feasible decisions and by the infeasible decisions with the less
+    violation, so they follow the last feasible front in the order of the violation,
+    and the decisions with the same violation have the same front.
+
+    --------------------
+    Args:
+        'objs_dict': The dictionary contains the objectives as keys and the pairs (index, decision) as values.
+        'count_of_obj': The number of the objectives.
+        'get_violation': The function which maps a decision into the total violation of the constraints.
+
+    --------------------
+    Returns:
+        The arguments of the '_assemble_fronts': the dictionary, where the infeasible decisions are grouped
+        by the keys (_INFEASIBLE, violation), the ordered keys and their front's indices.
+
+    """
+    feasible_dict = {}
+    infeasible_dict = defaultdict(list)
+
+    for (objs, decisions) in objs_dict.items():
+        feasible_decisions = []
+
+        for (index, decision) in decisions:
+            violation = get_violation(decision)
+            if violation > 0:
+                infeasible_dict[(_INFEASIBLE, violation)].append((index, decision))
+            else:
+                feasible_decisions.append((index, decision))
+
+        if feasible_decisions:
+            feasible_dict[objs] = feasible_decisions
+
+    unique_objs = sorted(feasible_dict.keys())
+    unique_fronts = _nd_sort(unique_objs, count_of_obj, workers, engine, ties, stats) if unique_objs else []
+
+    count_of_fronts = max(unique_fronts, default=-1) + 1
+    violation_keys = sorted(infeasible_dict.keys(), key=operator.itemgetter(1))
+
+    feasible_dict.update(infeasible_dict)
+    unique_fronts.extend(range(count_of_fronts, count_of_fronts + len(violation_keys)))
+
+    return feasible_dict, unique_objs + violation_keys, unique_fronts
+
+
+def non_domin_sort(decisions: Iterable[Any], get_objectives: Callable[[Any], Iterable[Any]] = None,
+                   only_front_indices: bool = False, workers: int = None, max_fronts: int = None,
+                   min_count: int = None, result: str = "dict", engine: str = "auto", ties: bool = None,
+                   stats: "SortStats" = None, epsilon: Union[Any, Sequence[Any]] = None,
+                   get_violation: Callable[[Any], Any] = None) \
+        -> Union[Tuple[int], Dict[int, Tuple[Any]], Tuple[array, array, array]]:
+    """A non-dominated sorting.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions for non-dominated sorting.
+        'get_objectives': The function which maps a decision space into a objectives space.
+        'only_front_indices': If it is True, then it is equivalent to the 'result="indices"'.
+        'workers': The number of the worker processes. The large independent subproblems are executed
+        in a process pool, if it is greater than 1. The values of the objectives must be integers or floats,
+        which are exactly representable as floats, otherwise the sorting is sequential.
+        'max_fronts': If it is not None, then only the first 'max_fronts' fronts are found.
+        'min_count': If it is not None, then the fronts are found, until they contain at least 'min_count' decisions.
+        'result': The form of the result: "dict", "indices" or "array".
+        'engine': The engine of the sorting: "auto", "python" or "compiled". The "compiled" engine requires
+        the NumPy and the Numba, and the values of the objectives, which are exactly representable as floats.
+        The "auto" engine is the "compiled", if it can be used, otherwise it is the "python".
+        'ties': The tie-aware mode for the "python" engine: the values of the every objective are replaced
+        by their dense ranks, and the sweeps use the Fenwick tree. If it is None, then it is used,
+        when every objective has at most 'TIE_DOMAIN_SIZE' unique values. It is not used for the parallel sorting.
+        'stats': The object 'stats.SortStats' or None. If it is not None, then the statistics of the sorting
+        are added to it. The sorting without the statistics does not have any overhead.
+        'epsilon': The positive size of the box of the epsilon-grid for all objectives, the sequence of the sizes
+        for the every objective or None. If it is not None, then the decisions are sorted by the epsilon-dominance:
+        the values of the objectives are replaced by the boxes (see 'stools.epsilon_box').
+        'get_violation': The function which maps a decision into the total violation of the constraints or None.
+        If it is not None, then the decisions are sorted by the constrained dominance
+        (see 'stools.is_constrained_dominate'): the decision is feasible, if its violation is less or equal to 0.
+        The feasible decisions are sorted by the engine, and the infeasible decisions follow them in the order
+        of the violation. It cannot be used with 'max_fronts' and 'min_count'.
+
+    --------------------
+    Returns:
+        If 'result' is "dict":
+            A dictionary. It contains indices of fronts as keys and values are tuple consist of
+            'decisions' which have a same index of the front.
+        If 'result' is "indices":
+            Tuple of front's indices for the every decision in 'decisions'.
+        If 'result' is "array":
+            The tuple of the arrays ('i'): front's indices for the every decision in 'decisions',
+            the indices of the decisions ordered by the fronts and the offsets of the fronts in it.
+            The indices of the decisions of the k-th front are 'order[front_offsets[k]:front_offsets[k + 1]]'.
+
+        If the sorting is stopped by 'max_fronts' or 'min_count' after k fronts,
+        then the rest decisions have the front's index k, it means that their front's index is greater or equal to k.
+    """
+
+    if stats is not None and not stats.is_collecting:
+        with stats.collect():
+            return non_domin_sort(decisions, get_objectives, only_front_indices, workers, max_fronts, min_count,
+                                  result, engine, ties, stats, epsilon, get_violation)
+
+    if epsilon is not None:
+        get_objectives = _epsilon_objectives(get_objectives, epsilon)
+
+    objs_dict, count_of_obj = _counted(stats, _group_by_objectives, decisions, get_objectives)
+
+    assert max_fronts is None or max_fronts > 0, "'max_fronts' must be > 0, but it is {0}.".format(max_fronts)
+    assert result in _RESULT_FORMS, "'result' must be one of the {0}, but it is {1}.".format(_RESULT_FORMS, result)
+
+    if get_violation is not None:
+        assert max_fronts is None and min_count is None, \
+            "'get_violation' cannot be used with 'max_fronts' and 'min_count'."
+        return _assemble_fronts(*_constrained_sort(objs_dict, count_of_obj, get_violation, workers, engine, ties,
+                                                   stats), "indices" if only_front_indices is True else result)
+
+    # The list 'unique_objs' is sorted in the lexicographical order.
+    unique_objs = sorted(objs_dict.keys())
+
+    if max_fronts is None and min_count is None:
+        unique_fronts = _nd_sort(unique_objs, count_of_obj, workers, engine, ties, stats)
+    else:
+        unique_fronts = _nd_sort_top(unique_objs, count_of_obj, [len(objs_dict[objs]) for objs in unique_objs],
+                                     max_fronts, min_count, workers, engine, ties, stats)
+
+    return _assemble_fronts(objs_dict, unique_objs, unique_fronts, "indices" if only_front_indices is True else result)
+
+
+def iter_fronts(decisions: Iterable[Any], get_objectives: Callable[[Any], Iterable[Any]] = None) \
+        -> Iterator[Tuple[int, Tuple[Any]]]:
+    """Iterate the fronts of the non-dominated sorting in the order of their indices.
+
+    The first fronts are peeled off one by one (see 'ITER_PEELED_FRONTS'), so the first front is yielded without
+    the sorting of the rest fronts. The rest fronts are found at once, when they are requested. The tuple of the
+    decisions of a front is built, when it is yielded.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions for non-dominated sorting.
+        'get_objectives': The function which maps a decision space into a objectives space.
+
+    --------------------
+    Returns:
+        The iterator of the pairs: front's index and the tuple of the decisions of the front.
+        They are the same as the items of the 'non_domin_sort(decisions, get_objectives)'.
+
+    """
+    objs_dict, count_of_obj = _group_by_objectives(decisions, get_objectives)
+    unique_objs = sorted(objs_dict.keys())
+
+    rest = list(range(len(unique_objs)))
+    front_index = 0
+    max_fronts = ITER_PEELED_FRONTS.get(count_of_obj, 1)
+
+    while rest and front_index < max_fronts:
+        front, rest = _peel_front(unique_objs, rest, count_of_obj)
+        yield front_index, tuple(decision for i in front for (_, decision) in objs_dict[unique_objs[i]])
+        front_index += 1
+
+    if not rest:
+        return
+
+    # The fronts of the rest elements are shifted by the number of the peeled fronts.
+    rest_fronts = _nd_sort([unique_objs[i] for i in rest], count_of_obj, engine="auto", ties=None)
+    members = [[] for _ in range(max(rest_fronts) + 1)]
+
+    for (i, front) in zip(rest, rest_fronts):
+        members[front].append(i)
+
+    del rest, rest_fronts
+
+    for front in range(len(members)):
+        indices, members[front] = members[front], None
+        yield front_index + front, tuple(decision for i in indices for (_, decision) in objs_dict[unique_objs[i]])
+
+
+def _unique_rows(objectives: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Deduplicate the rows of the two-dimensional array and sort them in the lexicographical order.
+
+    --------------------
+    Returns:
+        The tuple: the lexicographically ordered unique rows and the index of the unique row for the every row.
+
+    """
+    # 'np.lexsort' uses the last key as a primary key.
+    order = np.lexsort(objectives.T[::-1])
+    sorted_objs = objectives[order]
+
+    is_new_objs = np.empty(len(sorted_objs), dtype=bool)
+    is_new_objs[0] = True
+    np.any(sorted_objs[1:] != sorted_objs[:-1], axis=1, out=is_new_objs[1:])
+
+    inverse = np.empty(len(order), dtype=np.intp)
+    inverse[order] = np.cumsum(is_new_objs) - 1
+
+    return sorted_objs[is_new_objs], inverse
+
+
+def non_domin_sort_array(objectives: "np.ndarray", workers: int = None, max_fronts: int = None,
+                         min_count: int = None, engine: str = "auto", ties: bool = None,
+                         stats: "SortStats" = None, epsilon: Union[Any, Sequence[Any]] = None,
+                         violations: "np.ndarray" = None) -> "np.ndarray":
+    """A non-dominated sorting of the objectives are stored as a two-dimensional array.
+
+    The rows are deduplicated and sorted in the lexicographical order with vectorized operations of the NumPy.
+
+    --------------------
+    Args:
+        'objectives': The array with shape (n, m), where n is the number of the decisions
+        and m is the number of the objectives.
+        'workers': The number of the worker processes (see 'non_domin_sort').
+        'max_fronts': The maximum number of the found fronts (see 'non_domin_sort').
+        'min_count': The minimum number of the rows in the found fronts (see 'non_domin_sort').
+        'engine': The engine of the sorting (see 'non_domin_sort').
+        'ties': The tie-aware mode (see 'non_domin_sort').
+        'stats': The statistics of the sorting (see 'non_domin_sort').
+        'epsilon': The sizes of the boxes of the epsilon-grid (see 'non_domin_sort').
+        'violations': The array of the total violations of the constraints for the every row or None
+        (see 'get_violation' in the 'non_domin_sort').
+
+    --------------------
+    Returns:
+        The array of front's indices (int32) for the every row in 'objectives'.
+
+    --------------------
+    Raises:
+        ImportError: If the NumPy is not installed.
+
+    """
+    if np is None:
+        raise ImportError("'non_domin_sort_array' requires the NumPy.")
+
+    objectives = np.ascontiguousarray(objectives)
+
+    assert objectives.ndim == 2, "'objectives' must be a two-dimensional array, " \
+                                 "but it has {0} dimensions.".format(objectives.ndim)
+    assert objectives.shape[0] != 0, "The array of the objectives is empty."
+    assert objectives.shape[1] > 1, "The number of the objectives must be > 1, " \
+                                    "but it is {0}.".format(objectives.shape[1])
+
+    if stats is not None and not stats.is_collecting:
+        with stats.collect():
+            return non_domin_sort_array(objectives, workers, max_fronts, min_count, engine, ties, stats, epsilon,
+                                        violations)
+
+    if epsilon is not None:
+        epsilon = np.asarray(epsilon, dtype=float)
+        assert np.all(epsilon > 0), "'epsilon' must be > 0, but it is {0}.".format(epsilon)
+        objectives = np.floor(objectives / epsilon)
+
+    if violations is not None:
+        violations = np.asarray(violations)
+        assert violations.shape == objectives.shape[:1], "'violations' must have the shape {0}, " \
+                                                         "but it is {1}.".format(objectives.shape[:1],
+                                                                                 violations.shape)
+        assert max_fronts is None and min_count is None, \
+            "'violations' cannot be used with 'max_fronts' and 'min_count'."
+
+        is_feasible = violations <= 0
+        fronts = np.empty(len(objectives), dtype=np.int32)
+        count_of_fronts = 0
+
+        if np.any(is_feasible):
+            fronts[is_feasible] = non_domin_sort_array(objectives[is_feasible], workers, engine=engine, ties=ties,
+                                                       stats=stats)
+            count_of_fronts = int(fronts[is_feasible].max()) + 1
+
+        if not np.all(is_feasible):
+            violation_ranks = np.unique(violations[~is_feasible], return_inverse=True)[1]
+            fronts[~is_feasible] = count_of_fronts + violation_ranks.reshape(-1)
+
+        return fronts
+
+    unique_array, inverse = _counted(stats, _unique_rows, objectives)
+
+    if max_fronts is None and min_count is None:
+        from . import compiled as cmp
+
+        if _is_compiled_engine(engine, workers, lambda: cmp.is_float_exact_array(objectives)):
+            unique_fronts = cmp.nd_sort_array(unique_array, BRUTE_FORCE_SIZE_A, BRUTE_FORCE_SIZE_B)
+            return unique_fronts.astype(np.int32)[inverse]
+
+    unique_objs = unique_array.tolist()
+
+    if max_fronts is None and min_count is None:
+        unique_fronts = _nd_sort(unique_objs, objectives.shape[1], workers, "python", ties, stats)
+    else:
+        assert max_fronts is None or max_fronts > 0, "'max_fronts' must be > 0, but it is {0}.".format(max_fronts)
+        counts = np.bincount(inverse, minlength=len(unique_objs)).tolist()
+        unique_fronts = _nd_sort_top(unique_objs, objectives.shape[1], counts, max_fronts, min_count, workers,
+                                     engine, ties, stats)
+
+    return np.asarray(unique_fronts, dtype=np.int32)[inverse]
+
+
+def non_domin_sort_many(populations: Iterable[Iterable[Any]], get_objectives: Callable[[Any], Iterable[Any]] = None,
+                        workers: int = None, executor: "concurrent.futures.Executor" = None, engine: str = "auto",
+                        ties: bool = None) -> List[Tuple[int]]:
+    """A non-dominated sorting of the every population from the 'populations'.
+
+    The unique values of the objectives of all populations are stored in the one list by the contiguous
+    lexicographically ordered ranges, and the decisions refer to them by the indices, so the dictionaries
+    of the decisions and the checks of the 'non_domin_sort' are not built for the every population.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'populations': The sequence of the populations. A population is a sequence of the decisions.
+        'get_objectives': The function which maps a decision space into a objectives space.
+        'workers': The number of the worker processes. If it is greater than 1, then the populations are sorted
+        in a process pool.
+        'executor': The executor ('concurrent.futures.Executor') for the sorting of the populations or None.
+        It is used instead of the 'workers'.
+        'engine': The engine of the sorting (see 'non_domin_sort').
+        'ties': The tie-aware mode (see 'non_domin_sort').
+
+    --------------------
+    Returns:
+        The list of the tuples of front's indices for the every decision of the every population.
+
+    """
+    # The unique values of the objectives of all populations. The values of a population are a contiguous range,
+    # which is ordered lexicographically, the ranges are given by the 'offsets'.
+    unique_objs = []
+    offsets = [0]
+    # The indices of the unique values of the objectives for the every decision of the every population.
+    objs_indices = []
+
+    for (pop_index, decisions) in enumerate(populations):
+        objs_gen = map(tuple, decisions) if get_objectives is None else map(tuple, map(get_objectives, decisions))
+        local_index = {}
+        local_indices = [local_index.setdefault(fitness, len(local_index)) for fitness in objs_gen]
+
+        assert local_index, "The population at position {0} is empty.".format(pop_index)
+
+        local_objs = list(local_index)
+        order = sorted(range(len(local_objs)), key=local_objs.__getitem__)
+        position = [0] * len(order)
+        for (pos, i) in enumerate(order, offsets[-1]):
+            position[i] = pos
+
+        unique_objs.extend(local_objs[i] for i in order)
+        objs_indices.append([position[i] for i in local_indices])
+        offsets.append(len(unique_objs))
+
+    objs_list = []
+    counts_of_obj = []
+
+    for pop_index in range(len(objs_indices)):
+        objs = unique_objs[offsets[pop_index]:offsets[pop_index + 1]]
+        lengths = set(map(len, objs))
+        assert len(lengths) == 1, "The images of the decisions in the population at position {0} " \
+                                  "have the different numbers of the objectives: {1}.".format(pop_index, lengths)
+        count_of_obj = lengths.pop()
+        assert count_of_obj > 1, "The number of the objectives must be > 1, but the images of the decisions " \
+                                 "in the population at position {0} have the length {1}.".format(pop_index,
+                                                                                                 count_of_obj)
+        objs_list.append(objs)
+        counts_of_obj.append(count_of_obj)
+
+    # The populations are sorted in the one process each: the 'workers' of the '_nd_sort' is None.
+    args = (objs_list, counts_of_obj, repeat(None), repeat(engine), repeat(ties))
+
+    if executor is not None:
+        fronts_list = list(executor.map(_nd_sort, *args))
+    elif workers is not None and workers > 1 and len(objs_list) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(objs_list) // (4 * workers))
+            fronts_list = list(pool.map(_nd_sort, *args, chunksize=chunksize))
+    else:
+        fronts_list = list(map(_nd_sort, *args))
+
+    unique_fronts = [front for fronts in fronts_list for front in fronts]
+
+    return [tuple(unique_fronts[i] for i in indices) for indices in objs_indices]
@@ -0,0 +1,262 @@
+"""The module contains a parallel execution of the independent subproblems for 'ndomsort'.
+
+The procedure '_nd_helper_b' does not change the fronts of the compared elements,
+and an assigned element depends only on the compared elements. So the subproblems of the '_nd_helper_b'
+with the disjoint sets of the assigned elements are independent, and they are executed in a process pool.
+
+The values of the objectives, the fronts and the indices of the subproblems are stored in a shared memory,
+so the tasks contain only the offsets in it.
+
+"""
+
+__all__ = ["ParallelHelperB", "is_float_exact"]
+
+from typing import List, Sequence, Tuple, Any
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+
+from . import ndomsort as nd
+
+# The minimum total number of the elements in a subproblem of the '_nd_helper_b' for the parallel execution.
+PARALLEL_THRESHOLD = 10000
+
+# The state of the worker process. It is filled by the '_init_worker'.
+_worker_state = {}
+
+
+def is_float_exact(objs: Sequence[Sequence[Any]]) -> bool:
+    """Check. Are all values of the objectives the integers or floats, which are exactly representable as floats?
+
+    Only such objectives are stored in the shared memory, because the order of the values must not change.
+
+    --------------------
+    Args:
+        'objs': The values of the objectives.
+
+    --------------------
+    Returns:
+        True, if all values are exactly representable as floats, otherwise False.
+
+    """
+    for fitness in objs:
+        for value in fitness:
+            if type(value) not in (int, float) or float(value) != value:
+                return False
+    return True
+
+
+def _attach(name: str):
+    from multiprocessing import shared_memory
+
+    return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(objs_name: str, fronts_name: str, count_of_objs: int, count_of_obj: int) -> None:
+    objs_shm = _attach(objs_name)
+    fronts_shm = _attach(fronts_name)
+
+    flat_objs = objs_shm.buf[:count_of_objs * count_of_obj * 8].cast("d").tolist()
+
+    _worker_state.clear()
+    _worker_state["shm"] = [objs_shm, fronts_shm]
+    _worker_state["objs"] = list(zip(*[iter(flat_objs)] * count_of_obj))
+    _worker_state["shared_fronts"] = fronts_shm.buf[:count_of_objs * 8].cast("q")
+    _worker_state["fronts"] = [0] * count_of_objs
+    _worker_state["arena"] = (None, None, None)
+
+
+def _run_job(job: Tuple[str, int, int, Tuple[Tuple[int, int, int], ...]]) -> None:
+    """Execute the subproblems with a same set of the assigned elements in the worker process.
+
+    --------------------
+    Args:
+        'job': The tuple: the name of the shared memory with the indices, the offset and the length of the indices
+        for assign front, and the tuple of the compared sets: the offset, the length and the number of the objectives.
+
+    """
+    arena_name, assign_offset, assign_len, comps = job
+
+    if _worker_state["arena"][0] != arena_name:
+        _, old_shm, old_view = _worker_state["arena"]
+        if old_shm is not None:
+            old_view.release()
+            old_shm.close()
+        shm = _attach(arena_name)
+        _worker_state["arena"] = (arena_name, shm, shm.buf.cast("q"))
+
+    arena = _worker_state["arena"][2]
+    objs, fronts, shared_fronts = _worker_state["objs"], _worker_state["fronts"], _worker_state["shared_fronts"]
+
+    assign_indices = arena[assign_offset:assign_offset + assign_len].tolist()
+
+    for j in assign_indices:
+        fronts[j] = shared_fronts[j]
+
+    for (comp_offset, comp_len, count_of_obj) in comps:
+        comp_indices = arena[comp_offset:comp_offset + comp_len].tolist()
+
+        for i in comp_indices:
+            fronts[i] = shared_fronts[i]
+
+        buffer = comp_indices + assign_indices
+        nd._run_tasks(objs, fronts, buffer,
+                      [(nd._TASK_HELPER_B, 0, comp_len, comp_len, len(buffer), count_of_obj)])
+
+    for j in assign_indices:
+        shared_fronts[j] = fronts[j]
+
+
+def _split_helper_b(objs: Sequence[Sequence[Any]], comp_indices: List[int], assign_indices: List[int],
+                    count_of_obj: int) -> List[Tuple[List[int], List[Tuple[List[int], int]]]]:
+    """Split a subproblem of the '_nd_helper_b' in the same way as the '_nd_helper_b' does it.
+
+    --------------------
+    Returns:
+        The list of the jobs. A job is the tuple: the indices for assign front and the list of the pairs:
+        the indices for comparing and the number of the values from the objectives.
+
+    """
+    comp_values = [objs[i][count_of_obj - 1] for i in comp_indices]
+    assign_values = [objs[j][count_of_obj - 1] for j in assign_indices]
+
+    if max(comp_values) <= min(assign_values):
+        return [(assign_indices, [(comp_indices, count_of_obj - 1)])]
+    elif min(comp_values) > max(assign_values):
+        return []
+
+    median = nd._select_median_low(comp_values + assign_values)
+
+    def split(indices, values):
+        less = [index for (index, value) in zip(indices, values) if value < median]
+        equal = [index for (index, value) in zip(indices, values) if value == median]
+        greater = [index for (index, value) in zip(indices, values) if value > median]
+        less_or_equal = [index for (index, value) in zip(indices, values) if value <= median]
+        return less, equal, greater, less_or_equal
+
+    comp_less, comp_equal, comp_greater, comp_less_or_equal = split(comp_indices, comp_values)
+    assign_less, assign_equal, assign_greater, _ = split(assign_indices, assign_values)
+
+    jobs = [(assign_less, [(comp_less, count_of_obj)]),
+            (assign_equal, [(comp_less, count_of_obj - 1), (comp_equal, count_of_obj - 1)]),
+            (assign_greater, [(comp_less_or_equal, count_of_obj - 1), (comp_greater, count_of_obj)])]
+
+    return [(assign, [(comp, count) for (comp, count) in comps if comp])
+            for (assign, comps) in jobs if assign and any(comp for (comp, _) in comps)]
+
+
+class ParallelHelperB:
+    """The executor of the large subproblems of the '_nd_helper_b' in a process pool.
+
+    The values of the objectives must be exactly representable as floats (see 'is_float_exact').
+    It must be closed after the usage, or it is used as a context manager.
+    It raises ImportError, if the 'multiprocessing.shared_memory' is not available (Python < 3.8).
+
+    """
+
+    def __init__(self, objs: Sequence[Sequence[Any]], count_of_obj: int, workers: int,
+                 threshold: int = None):
+        from multiprocessing import shared_memory
+
+        self._threshold = PARALLEL_THRESHOLD if threshold is None else threshold
+        self._workers = workers
+        self._count_of_objs = len(objs)
+
+        self._objs_shm = shared_memory.SharedMemory(create=True, size=max(1, len(objs) * count_of_obj * 8))
+        self._fronts_shm = shared_memory.SharedMemory(create=True, size=max(1, len(objs) * 8))
+        self._arena_shm = None
+
+        flat_objs = array("d", itertools.chain.from_iterable(objs))
+        self._objs_shm.buf[:len(flat_objs) * 8] = flat_objs.tobytes()
+        self._shared_fronts = self._fronts_shm.buf[:len(objs) * 8].cast("q")
+
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                             initargs=(self._objs_shm.name, self._fronts_shm.name,
+                                                       len(objs), count_of_obj))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Shutdown the process pool and free the shared memory."""
+        self._executor.shutdown()
+        self._shared_fronts.release()
+
+        for shm in (self._objs_shm, self._fronts_shm, self._arena_shm):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+        self._arena_shm = None
+
+    def accepts(self, comp_lo: int, comp_hi: int, assign_lo: int, assign_hi: int, count_of_obj: int) -> bool:
+        """Check. Is the subproblem large enough for the parallel execution?"""
+        return count_of_obj > 2 and comp_hi - comp_lo + assign_hi - assign_lo >= self._threshold
+
+    def _decompose(self, objs: Sequence[Sequence[Any]], comp_indices: List[int], assign_indices: List[int],
+                   count_of_obj: int) -> List[Tuple[List[int], List[Tuple[List[int], int]]]]:
+        jobs = [(assign_indices, [(comp_indices, count_of_obj)])]
+        target_count = 2 * self._workers
+
+        while len(jobs) < target_count:
+            # Only a job with a one compared set is split, because the compared sets are split differently.
+            candidates = [pos for (pos, (assign, comps)) in enumerate(jobs)
+                          if len(comps) == 1 and comps[0][1] > 2 and len(comps[0][0]) > 1 and len(assign) > 1
+                          and len(assign) + len(comps[0][0]) >= self._threshold // self._workers]
+
+            if not candidates:
+                break
+
+            pos = max(candidates, key=lambda index: len(jobs[index][0]) + len(jobs[index][1][0][0]))
+            assign, ((comp, count),) = jobs[pos]
+            jobs[pos:pos + 1] = _split_helper_b(objs, comp, assign, count)
+
+        return jobs
+
+    def helper_b(self, objs: Sequence[Sequence[Any]], fronts: List[int], buffer: List[int],
+                 comp_lo: int, comp_hi: int, assign_lo: int, assign_hi: int, count_of_obj: int) -> None:
+        """Execute the subproblem of the '_nd_helper_b' in the process pool.
+
+        The arguments are the same as for the '_nd_helper_b'. The ranges of the 'buffer' are not changed.
+
+        """
+        from multiprocessing import shared_memory
+
+        comp_indices, assign_indices = buffer[comp_lo:comp_hi], buffer[assign_lo:assign_hi]
+        jobs = self._decompose(objs, comp_indices, assign_indices, count_of_obj)
+
+        if not jobs:
+            return
+
+        arena = array("q")
+        job_args = []
+
+        for (assign, comps) in jobs:
+            assign_offset = len(arena)
+            arena.extend(assign)
+            comps_args = []
+            for (comp, count) in comps:
+                comps_args.append((len(arena), len(comp), count))
+                arena.extend(comp)
+            job_args.append((assign_offset, len(assign), tuple(comps_args)))
+
+        if self._arena_shm is None or self._arena_shm.size < len(arena) * 8:
+            if self._arena_shm is not None:
+                self._arena_shm.close()
+                self._arena_shm.unlink()
+            self._arena_shm = shared_memory.SharedMemory(create=True, size=2 * len(arena) * 8)
+
+        self._arena_shm.buf[:len(arena) * 8] = arena.tobytes()
+
+        shared_fronts = self._shared_fronts
+        for index in itertools.chain(comp_indices, assign_indices):
+            shared_fronts[index] = fronts[index]
+
+        arena_name = self._arena_shm.name
+        list(self._executor.map(_run_job, [(arena_name,) + args for args in job_args]))
+
+        for index in assign_indices:
+            fronts[index] = shared_fronts[index]
@@ -0,0 +1,187 @@
+"""The module contains the extraction of the first front (the Pareto front) without the sorting of the rest fronts.
+
+The elements are deduplicated and ordered in the lexicographical order as in the 'ndomsort.non_domin_sort',
+so an element can be dominated only by the lexicographically less elements.
+The first front is found by the sweep for two and three objectives (O(n log n)) and by the Kung's divide-and-conquer
+method for the greater number of the objectives, where the front of the second half is filtered
+by the front of the first half with the '_nd_helper_b'.
+
+"""
+
+__all__ = ["pareto_front", "is_pareto_efficient"]
+
+from typing import Iterable, Callable, Sequence, List, Tuple, Union, Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import ndomsort as nd
+from . import stools as st
+
+# The maximum number of the elements, which are filtered without the division.
+KUNG_BASE_SIZE = 256
+
+# The number of the rows of the first front, which are compared with the rows of a block at once.
+_FRONT_BLOCK_SIZE = 32
+
+
+def _kung_front(objs: Sequence[Sequence[Any]], fronts: List[int], lo: int, hi: int, count_of_obj: int) -> List[int]:
+    """Find the first front of the lexicographically ordered unique elements 'objs[lo:hi]'.
+
+    --------------------
+    Args:
+        'objs': The lexicographically ordered unique values of the objectives.
+        'fronts': The list of -1 with the same length as 'objs'. It is used as the buffer and it is restored.
+        'lo', 'hi': The range of the elements.
+        'count_of_obj': The number of the objectives.
+
+    --------------------
+    Returns:
+        The ordered indices of the elements of the first front.
+
+    """
+    if hi - lo <= KUNG_BASE_SIZE:
+        return nd._first_front(objs, range(lo, hi), count_of_obj)[0]
+
+    mid = (lo + hi) // 2
+    top_front = _kung_front(objs, fronts, lo, mid, count_of_obj)
+    bottom_front = _kung_front(objs, fronts, mid, hi, count_of_obj)
+
+    # The elements of the 'top_front' have the front 0 and the elements of the 'bottom_front' have the front -1,
+    # so the dominated elements of the 'bottom_front' get the front 1.
+    for i in top_front:
+        fronts[i] = 0
+
+    buffer = top_front + bottom_front
+    nd._run_tasks(objs, fronts, buffer, [(nd._TASK_HELPER_B, 0, len(top_front), len(top_front), len(buffer),
+                                          count_of_obj)])
+    front = top_front + [j for j in bottom_front if fronts[j] < 1]
+
+    for i in buffer:
+        fronts[i] = -1
+
+    return front
+
+
+def _first_front_indices(objs: Sequence[Sequence[Any]], count_of_obj: int) -> List[int]:
+    """Find the first front of the lexicographically ordered unique elements.
+
+    --------------------
+    Returns:
+        The ordered indices of the elements of the first front in the 'objs'.
+
+    """
+    if count_of_obj <= 3:
+        return nd._first_front(objs, range(len(objs)), count_of_obj)[0]
+
+    return _kung_front(objs, [-1] * len(objs), 0, len(objs), count_of_obj)
+
+
+def _is_pareto_efficient_array(objectives: "np.ndarray") -> "np.ndarray":
+    """Find the first front of the rows of the two-dimensional array with the vectorized operations.
+
+    For two objectives, a row is in the first front, if its second value is less than the second values of all
+    lexicographically less rows. For three objectives, the sweep is used. Otherwise, the blocks of the ordered rows
+    are filtered by the found part of the first front and by the rows of the same block.
+
+    """
+    count_of_obj = objectives.shape[1]
+
+    unique_objs, inverse = nd._unique_rows(objectives)
+
+    is_efficient = np.zeros(len(unique_objs), dtype=bool)
+
+    if count_of_obj == 2:
+        second_values = unique_objs[:, 1]
+        is_efficient[0] = True
+        is_efficient[1:] = second_values[1:] < np.minimum.accumulate(second_values)[:-1]
+    elif count_of_obj == 3:
+        is_efficient[nd._first_front(unique_objs.tolist(), range(len(unique_objs)), count_of_obj)[0]] = True
+    else:
+        front_objs = unique_objs[:0]
+        step = max(1, int(st.BLOCK_SIZE ** 0.5))
+
+        for start in range(0, len(unique_objs), step):
+            positions = np.arange(start, min(start + step, len(unique_objs)))
+
+            # The found part of the first front is compared by the small blocks, so the dominated rows are removed
+            # early. The rows of the first front with the lexicographically less values dominate more often.
+            for front_start in range(0, len(front_objs), _FRONT_BLOCK_SIZE):
+                if len(positions) == 0:
+                    break
+                front_block = front_objs[front_start:front_start + _FRONT_BLOCK_SIZE]
+                positions = positions[~st.is_weakly_dominated_by_any(front_block, unique_objs[positions])]
+
+            candidates = unique_objs[positions]
+
+            # The rows are unique, so a row, which is less or equal to other row, dominates it.
+            dominance = np.all(candidates[:, np.newaxis, :] <= candidates[np.newaxis, :, :], axis=2)
+            np.fill_diagonal(dominance, False)
+            positions = positions[~np.any(dominance, axis=0)]
+
+            is_efficient[positions] = True
+            front_objs = np.concatenate((front_objs, unique_objs[positions]))
+
+    return is_efficient[inverse]
+
+
+def is_pareto_efficient(decisions: Union[Iterable[Any], "np.ndarray"],
+                        get_objectives: Callable[[Any], Iterable[Any]] = None) -> Union[Tuple[bool], "np.ndarray"]:
+    """Check. Is a decision in the first front, for the every decision?
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions or the two-dimensional array of the objectives (n, m).
+        'get_objectives': The function which maps a decision space into a objectives space.
+        It is not used for the array.
+
+    --------------------
+    Returns:
+        The boolean array for the array of the objectives, otherwise the tuple of the bool values.
+        The value is True, if the decision has the front's index 0 in the 'ndomsort.non_domin_sort'.
+
+    """
+    if np is not None and isinstance(decisions, np.ndarray):
+        assert decisions.ndim == 2, "'decisions' must be a two-dimensional array, " \
+                                    "but it has {0} dimensions.".format(decisions.ndim)
+        assert decisions.shape[0] != 0, "The array of the objectives is empty."
+        assert decisions.shape[1] > 1, "The number of the objectives must be > 1, " \
+                                       "but it is {0}.".format(decisions.shape[1])
+        return _is_pareto_efficient_array(decisions)
+
+    objs_dict, count_of_obj = nd._group_by_objectives(decisions, get_objectives)
+    unique_objs = sorted(objs_dict.keys())
+
+    is_efficient = [False] * sum(map(len, objs_dict.values()))
+
+    for i in _first_front_indices(unique_objs, count_of_obj):
+        for (index, _) in objs_dict[unique_objs[i]]:
+            is_efficient[index] = True
+
+    return tuple(is_efficient)
+
+
+def pareto_front(decisions: Iterable[Any], get_objectives: Callable[[Any], Iterable[Any]] = None) -> Tuple[Any]:
+    """Find the first front of the decisions.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions.
+        'get_objectives': The function which maps a decision space into a objectives space.
+
+    --------------------
+    Returns:
+        The tuple of the decisions of the first front. It is equal to the 'ndomsort.non_domin_sort(decisions)[0]'.
+
+    """
+    objs_dict, count_of_obj = nd._group_by_objectives(decisions, get_objectives)
+    unique_objs = sorted(objs_dict.keys())
+
+    return tuple(decision for i in _first_front_indices(unique_objs, count_of_obj)
+                 for (_, decision) in objs_dict[unique_objs[i]])
@@ -0,0 +1,182 @@
+"""The module contains the selection of the survivors by the fronts and the crowding distance (NSGA-II).
+
+The crowding distance is computed for the every front separately. The decisions of a front are taken
+from the lexicographically ordered unique values of the objectives, which are already found by the sorting,
+so they are ordered by the first objective and only the rest objectives are sorted.
+For the selection, the first fronts are peeled off with 'min_count', so the sorting stops after the last required
+front, and the crowding distance is computed only for it.
+
+The NumPy is used for the vectorized computation, if it is installed.
+
+"""
+
+__all__ = ["crowding_distance", "select_survivors"]
+
+from typing import Iterable, Callable, Sequence, List, Tuple, Dict, Any
+from collections import defaultdict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import ndomsort as nd
+
+
+def _front_crowding_distance(values: List[Sequence[Any]], count_of_obj: int) -> List[float]:
+    """Compute the crowding distance of the elements of a front.
+
+    --------------------
+    Args:
+        'values': The values of the objectives of the front, which are ordered by the first objective.
+        'count_of_obj': The number of the objectives.
+
+    --------------------
+    Returns:
+        The list of the crowding distances for the every element in 'values'.
+
+    """
+    if len(values) < 3:
+        return [float("inf")] * len(values)
+
+    if np is not None:
+        values = np.asarray(values, dtype=float)
+        distances = np.zeros(len(values))
+
+        for k in range(count_of_obj):
+            # The values are already ordered by the first objective.
+            order = np.arange(len(values)) if k == 0 else np.argsort(values[:, k], kind="stable")
+            ordered_values = values[order, k]
+            span = ordered_values[-1] - ordered_values[0]
+
+            if span > 0:
+                distances[order[1:-1]] += (ordered_values[2:] - ordered_values[:-2]) / span
+
+            distances[order[[0, -1]]] = np.inf
+
+        return distances.tolist()
+
+    distances = [0.0] * len(values)
+
+    for k in range(count_of_obj):
+        order = range(len(values)) if k == 0 else sorted(range(len(values)), key=lambda i: values[i][k])
+        span = values[order[-1]][k] - values[order[0]][k]
+
+        if span > 0:
+            for pos in range(1, len(order) - 1):
+                distances[order[pos]] += (values[order[pos + 1]][k] - values[order[pos - 1]][k]) / span
+
+        distances[order[0]] = distances[order[-1]] = float("inf")
+
+    return distances
+
+
+def _front_members(objs_dict: Dict[Tuple[Any, ...], List[Tuple[int, Any]]], unique_objs: List[Tuple[Any, ...]],
+                   unique_fronts: List[int]) -> Dict[int, Tuple[List[int], List[Tuple[Any, ...]]]]:
+    """Group the decisions by the fronts.
+
+    --------------------
+    Returns:
+        The dictionary contains the indices of the fronts as keys and the pairs as values: the indices of the
+        decisions and their values of the objectives. The decisions are ordered lexicographically by the objectives.
+
+    """
+    members = defaultdict(lambda: ([], []))
+
+    for (objs, front) in zip(unique_objs, unique_fronts):
+        indices, values = members[front]
+        for (index, _) in objs_dict[objs]:
+            indices.append(index)
+            values.append(objs)
+
+    return members
+
+
+def crowding_distance(decisions: Iterable[Any], get_objectives: Callable[[Any], Iterable[Any]] = None,
+                      fronts: Sequence[int] = None) -> Tuple[float]:
+    """Compute the crowding distance of the every decision in its front.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions.
+        'get_objectives': The function which maps a decision space into a objectives space.
+        'fronts': Front's indices for the every decision (see 'ndomsort.non_domin_sort' with
+        'only_front_indices=True') or None. If it is None, then the decisions are sorted.
+
+    --------------------
+    Returns:
+        The tuple of the crowding distances for the every decision in 'decisions'.
+        The boundary decisions of a front have the infinite distance.
+
+    """
+    objs_dict, count_of_obj = nd._group_by_objectives(decisions, get_objectives)
+    unique_objs = sorted(objs_dict.keys())
+
+    if fronts is None:
+        unique_fronts = nd._nd_sort(unique_objs, count_of_obj)
+    else:
+        unique_fronts = [fronts[objs_dict[objs][0][0]] for objs in unique_objs]
+
+    distances = [0.0] * sum(map(len, objs_dict.values()))
+
+    for (indices, values) in _front_members(objs_dict, unique_objs, unique_fronts).values():
+        for (index, distance) in zip(indices, _front_crowding_distance(values, count_of_obj)):
+            distances[index] = distance
+
+    return tuple(distances)
+
+
+def select_survivors(decisions: Iterable[Any], count: int, get_objectives: Callable[[Any], Iterable[Any]] = None) \
+        -> Tuple[int]:
+    """Select the 'count' decisions by the fronts and the crowding distance as in the NSGA-II.
+
+    The fronts are taken one by one, while all their decisions can be taken. The decisions of the next front
+    are taken in the descending order of the crowding distance.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions.
+        'count': The number of the survivors.
+        'get_objectives': The function which maps a decision space into a objectives space.
+
+    --------------------
+    Returns:
+        The tuple of the indices of the selected decisions. The indices of the decisions from a front
+        are placed before the indices of the decisions from the next front.
+
+    """
+    assert count >= 0, "'count' must be >= 0, but it is {0}.".format(count)
+
+    objs_dict, count_of_obj = nd._group_by_objectives(decisions, get_objectives)
+    unique_objs = sorted(objs_dict.keys())
+    counts = [len(objs_dict[objs]) for objs in unique_objs]
+
+    if count == 0:
+        return ()
+
+    # The fronts are peeled off, until they contain at least 'count' decisions. Above three objectives
+    # they are found by the Kung's method (see 'ndomsort.TOP_KUNG_PEELED_FRONTS').
+    unique_fronts = nd._nd_sort_top(unique_objs, count_of_obj, counts, min_count=count, engine="auto", ties=None)
+
+    members = _front_members(objs_dict, unique_objs, unique_fronts)
+
+    survivors = []
+
+    for front in range(len(members)):
+        indices, values = members[front]
+
+        if len(survivors) + len(indices) <= count:
+            survivors.extend(indices)
+        else:
+            distances = _front_crowding_distance(values, count_of_obj)
+            order = sorted(range(len(indices)), key=lambda pos: -distances[pos])
+            survivors.extend(indices[pos] for pos in order[:count - len(survivors)])
+
+        if len(survivors) == count:
+            break
+
+    return tuple(survivors)
@@ -0,0 +1,182 @@
+"""The module contains the two-phase non-dominated sorting of the shards of a population.
+
+Firstly, the every shard is summarized independently (for example, on its node): the lexicographically ordered unique
+values of the objectives, their front's indices inside the shard and the numbers of the decisions.
+Secondly, the summaries are merged into the global front's indices. The ordered values of the shards are merged
+by the k-way merge without the sorting, and the local front's indices are the lower bounds of the global ones.
+
+All elements of the chains, which end in an element, dominate it, so if an element of one shard is not dominated
+by the elements of the other shards, then its local front's index is global. Such elements are found by the
+bounding boxes of the shards: an element is checked, only if the minimum of other shard is less or equal to it.
+The checked elements get the global front's indices by the '_nd_helper_b' with the unchecked elements
+and by the '_nd_helper_a' with the local front's indices as the initial values.
+
+The summaries are pickled, so they are exchanged as the files or by the pipes.
+
+"""
+
+__all__ = ["ShardSummary", "summarize", "merge_summaries", "assign_fronts", "dump_summary", "load_summary"]
+
+from typing import Iterable, Callable, Sequence, List, Tuple, NamedTuple, BinaryIO, Any
+import heapq
+import pickle
+
+from . import ndomsort as nd
+
+
+class ShardSummary(NamedTuple):
+    """The ranked summary of a shard.
+
+    The attributes:
+        'objs': The lexicographically ordered unique values of the objectives.
+        'fronts': Front's indices of the 'objs'.
+        'counts': The numbers of the decisions with the 'objs'.
+
+    """
+    objs: List[Tuple[Any, ...]]
+    fronts: List[int]
+    counts: List[int]
+
+
+def summarize(decisions: Iterable[Any], get_objectives: Callable[[Any], Iterable[Any]] = None, workers: int = None,
+              engine: str = "auto", ties: bool = None) -> ShardSummary:
+    """Sort the decisions of a shard and build its summary.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions of the shard.
+        'get_objectives': The function which maps a decision space into a objectives space.
+        'workers', 'engine', 'ties': The parameters of the sorting (see 'ndomsort.non_domin_sort').
+
+    --------------------
+    Returns:
+        The summary of the shard.
+
+    """
+    objs_dict, count_of_obj = nd._group_by_objectives(decisions, get_objectives)
+    unique_objs = sorted(objs_dict.keys())
+    unique_fronts = nd._nd_sort(unique_objs, count_of_obj, workers, engine, ties)
+
+    return ShardSummary(unique_objs, list(unique_fronts), [len(objs_dict[objs]) for objs in unique_objs])
+
+
+def _is_cross_dominated(objs: Sequence[Any], shards: List[int], minimums: List[Tuple[Any, ...]]) -> bool:
+    """Check. Can the element be dominated by an element of the shard, which does not contain it?
+
+    The element of the several shards is always checked, because its chains can pass through the different shards.
+
+    """
+    if len(shards) > 1:
+        return True
+
+    return any(shard not in shards and all(min_value <= value for (min_value, value) in zip(minimums[shard], objs))
+               for shard in range(len(minimums)))
+
+
+def merge_summaries(summaries: Sequence[ShardSummary]) -> Tuple[ShardSummary, List[List[int]]]:
+    """Merge the summaries of the shards into the global front's indices.
+
+    --------------------
+    Args:
+        'summaries': The summaries of the shards (see 'summarize').
+
+    --------------------
+    Returns:
+        The tuple: the summary of all shards and the global front's indices of the 'objs' of the every shard.
+
+    """
+    summaries = [summary for summary in summaries]
+
+    assert summaries, "'summaries' is empty."
+    assert all(summary.objs for summary in summaries), "The summary of a shard is empty."
+
+    count_of_obj = len(summaries[0].objs[0])
+
+    assert all(len(summary.objs[0]) == count_of_obj for summary in summaries), \
+        "The shards have the different numbers of the objectives."
+
+    minimums = [tuple(map(min, zip(*summary.objs))) for summary in summaries]
+
+    objs = []
+    fronts = []
+    counts = []
+    # The indices of the shards, which contain the element, and the positions of the element in them.
+    owners = []
+    positions = [[0] * len(summary.objs) for summary in summaries]
+
+    # The k-way merge of the ordered values of the shards.
+    merged = heapq.merge(*(zip(summary.objs, [shard] * len(summary.objs), range(len(summary.objs)))
+                           for (shard, summary) in enumerate(summaries)))
+
+    for (value, shard, pos) in merged:
+        summary = summaries[shard]
+
+        if objs and objs[-1] == value:
+            fronts[-1] = max(fronts[-1], summary.fronts[pos])
+            counts[-1] += summary.counts[pos]
+            owners[-1].append(shard)
+        else:
+            objs.append(value)
+            fronts.append(summary.fronts[pos])
+            counts.append(summary.counts[pos])
+            owners.append([shard])
+
+        positions[shard][pos] = len(objs) - 1
+
+    # The local front's indices are global for the unchecked elements. They are used as the compared elements.
+    unchecked = []
+    checked = []
+
+    for (index, value) in enumerate(objs):
+        if _is_cross_dominated(value, owners[index], minimums):
+            checked.append(index)
+        else:
+            unchecked.append(index)
+
+    if checked:
+        buffer = unchecked + checked
+        tasks = [(nd._TASK_HELPER_A, len(unchecked), len(buffer), count_of_obj)]
+
+        if unchecked:
+            tasks.append((nd._TASK_HELPER_B, 0, len(unchecked), len(unchecked), len(buffer), count_of_obj))
+
+        nd._run_tasks(objs, fronts, buffer, tasks)
+
+    return ShardSummary(objs, fronts, counts), [[fronts[index] for index in shard_positions]
+                                                for shard_positions in positions]
+
+
+def assign_fronts(decisions: Iterable[Any], summary_objs: Sequence[Tuple[Any, ...]], fronts: Sequence[int],
+                  get_objectives: Callable[[Any], Iterable[Any]] = None) -> Tuple[int]:
+    """Map the global front's indices of the summary of a shard into the decisions of the shard.
+
+    --------------------
+    Args:
+        'decisions': The sequence of the decisions of the shard.
+        'summary_objs': The 'objs' of the summary of the shard.
+        'fronts': The global front's indices of the 'summary_objs' (see 'merge_summaries').
+        'get_objectives': The function which maps a decision space into a objectives space.
+
+    --------------------
+    Returns:
+        Tuple of front's indices for the every decision in 'decisions'.
+
+    """
+    front_of_obj = dict(zip(summary_objs, fronts))
+
+    if get_objectives is None:
+        return tuple(front_of_obj[tuple(decision)] for decision in decisions)
+
+    return tuple(front_of_obj[tuple(get_objectives(decision))] for decision in decisions)
+
+
+def dump_summary(summary: ShardSummary, file: BinaryIO) -> None:
+    """Write the summary into the binary file or the pipe."""
+    pickle.dump(tuple(summary), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_summary(file: BinaryIO) -> ShardSummary:
+    """Read the summary from the binary file or the pipe (see 'dump_summary')."""
+    return ShardSummary(*pickle.load(file))
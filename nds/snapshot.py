@@ -0,0 +1,229 @@
+"""The module contains the binary snapshot of the sorted population.
+
+The snapshot is a file with the header and the contiguous arrays:
+    the header: the magic bytes, the version, the number of the objectives, the number of the unique values
+    of the objectives and the number of the decisions (little-endian, it is padded to 'HEADER_SIZE' bytes);
+    the lexicographically ordered unique values of the objectives ('<f8', shape (u, m));
+    the numbers of the decisions for the every unique value ('<i8', u);
+    the index of the unique value for the every decision ('<i8', n);
+    front's indices of the unique values ('<i4', u).
+
+The snapshot is loaded by the 'mmap' without the copying, so front's indices are available without the sorting,
+and the archive of the decisions is created from it without the sorting too (see 'Snapshot.to_archive').
+
+"""
+
+__all__ = ["Snapshot", "save", "load"]
+
+from typing import Iterable, Callable, Union, Any
+import mmap
+import os
+import struct
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import ndomsort as nd
+from . import parallel as par
+from .archive import NonDominatedArchive
+
+_MAGIC = b"NDSSNAP\x00"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQ")
+
+# The size of the header in bytes. The arrays are aligned by it.
+HEADER_SIZE = 64
+
+
+class Snapshot:
+    """The loaded snapshot. The arrays are the read-only views of the memory-mapped file.
+
+    The attributes:
+        'objs': The lexicographically ordered unique values of the objectives (float64, shape (u, m)).
+        'counts': The numbers of the decisions for the every unique value (int64).
+        'inverse': The index of the unique value for the every decision (int64).
+        'fronts': Front's indices of the unique values (int32).
+
+    """
+
+    def __init__(self, mapped: mmap.mmap, objs: "np.ndarray", counts: "np.ndarray", inverse: "np.ndarray",
+                 fronts: "np.ndarray"):
+        self._mmap = mapped
+        self.objs = objs
+        self.counts = counts
+        self.inverse = inverse
+        self.fronts = fronts
+
+    def __len__(self) -> int:
+        return len(self.inverse)
+
+    def front_indices(self) -> "np.ndarray":
+        """Return the array of front's indices (int32) for the every decision."""
+        return self.fronts[self.inverse]
+
+    def to_archive(self, decisions: Iterable[Any] = None, get_objectives: Callable[[Any], Iterable[Any]] = None) \
+            -> NonDominatedArchive:
+        """Create the archive of the decisions of the snapshot without the sorting.
+
+        --------------------
+        Args:
+            'decisions': The sequence of the decisions in the same order as at the saving or None.
+            If it is None, then the decisions are the tuples of the values of the objectives.
+            'get_objectives': The function which maps a decision space into a objectives space.
+            It is used for the inserted decisions.
+
+        --------------------
+        Returns:
+            The archive. The identifiers of the decisions are their indices.
+
+        """
+        sorted_objs = [tuple(objs) for objs in self.objs.tolist()]
+
+        if decisions is None:
+            decisions = (sorted_objs[index] for index in self.inverse.tolist())
+
+        return NonDominatedArchive.from_fronts(decisions, sorted_objs, self.fronts.tolist(), self.inverse.tolist(),
+                                               get_objectives)
+
+    def close(self) -> None:
+        """Release the memory-mapped file.
+
+        If the views of the arrays are kept outside, then the file is released, when they are deleted.
+
+        """
+        self.objs = self.counts = self.inverse = self.fronts = None
+
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def save(path: Union[str, "os.PathLike"], decisions: Union[Iterable[Any], "np.ndarray"],
+         get_objectives: Callable[[Any], Iterable[Any]] = None, workers: int = None, engine: str = "auto") \
+        -> "np.ndarray":
+    """Sort the decisions and save the snapshot.
+
+    The values of the objectives must be exactly representable as floats.
+
+    If 'get_objectives' is 'None', then it is identity map: 'get_objectives = lambda x: x'.
+
+    --------------------
+    Args:
+        'path': The path to the file of the snapshot.
+        'decisions': The sequence of the decisions or the two-dimensional array of the objectives (n, m).
+        'get_objectives': The function which maps a decision space into a objectives space.
+        It is not used for the array.
+        'workers', 'engine': The parameters of the sorting (see 'ndomsort.non_domin_sort').
+
+    --------------------
+    Returns:
+        The array of front's indices (int32) for the every decision.
+
+    --------------------
+    Raises:
+        ImportError: If the NumPy is not installed.
+
+    """
+    if np is None:
+        raise ImportError("'snapshot.save' requires the NumPy.")
+
+    if isinstance(decisions, np.ndarray):
+        assert decisions.ndim == 2, "'decisions' must be a two-dimensional array, " \
+                                    "but it has {0} dimensions.".format(decisions.ndim)
+        assert decisions.shape[0] != 0, "The array of the objectives is empty."
+        assert decisions.shape[1] > 1, "The number of the objectives must be > 1, " \
+                                       "but it is {0}.".format(decisions.shape[1])
+        objectives = decisions.astype(float)
+        assert np.array_equal(objectives, decisions), "The values of the objectives must be exactly " \
+                                                      "representable as floats."
+
+        unique_objs, inverse = nd._unique_rows(objectives)
+        counts = np.bincount(inverse, minlength=len(unique_objs))
+        fronts = nd.non_domin_sort_array(unique_objs, workers, engine=engine)
+    else:
+        objs_dict, count_of_obj = nd._group_by_objectives(decisions, get_objectives)
+        sorted_objs = sorted(objs_dict.keys())
+
+        assert par.is_float_exact(sorted_objs), "The values of the objectives must be exactly representable as floats."
+
+        unique_objs = np.array(sorted_objs, dtype=float).reshape(len(sorted_objs), count_of_obj)
+        counts = np.array([len(objs_dict[objs]) for objs in sorted_objs], dtype=np.int64)
+        inverse = np.empty(int(counts.sum()), dtype=np.int64)
+
+        for (unique_index, objs) in enumerate(sorted_objs):
+            for (index, _) in objs_dict[objs]:
+                inverse[index] = unique_index
+
+        fronts = np.asarray(nd._nd_sort(sorted_objs, count_of_obj, workers, engine, ties=None), dtype=np.int32)
+
+    header = _HEADER.pack(_MAGIC, _VERSION, unique_objs.shape[1], len(unique_objs), len(inverse))
+
+    with open(path, "wb") as file:
+        file.write(header.ljust(HEADER_SIZE, b"\x00"))
+        file.write(np.ascontiguousarray(unique_objs, dtype="<f8").tobytes())
+        file.write(np.ascontiguousarray(counts, dtype="<i8").tobytes())
+        file.write(np.ascontiguousarray(inverse, dtype="<i8").tobytes())
+        file.write(np.ascontiguousarray(fronts, dtype="<i4").tobytes())
+
+    return fronts.astype(np.int32)[inverse]
+
+
+def load(path: Union[str, "os.PathLike"]) -> Snapshot:
+    """Load the snapshot by the 'mmap' without the copying.
+
+    --------------------
+    Args:
+        'path': The path to the file of the snapshot.
+
+    --------------------
+    Returns:
+        The snapshot. It must be closed after the usage (see 'Snapshot.close').
+
+    --------------------
+    Raises:
+        ImportError: If the NumPy is not installed.
+        ValueError: If the file is not a snapshot or it is truncated.
+
+    """
+    if np is None:
+        raise ImportError("'snapshot.load' requires the NumPy.")
+
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        if len(mapped) < HEADER_SIZE:
+            raise ValueError("The file '{0}' is not a snapshot.".format(path))
+
+        magic, version, count_of_obj, count_of_unique, count_of_decisions = _HEADER.unpack_from(mapped)
+
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("The file '{0}' is not a snapshot of the version {1}.".format(path, _VERSION))
+
+        sizes = (count_of_unique * count_of_obj * 8, count_of_unique * 8, count_of_decisions * 8, count_of_unique * 4)
+
+        if len(mapped) != HEADER_SIZE + sum(sizes):
+            raise ValueError("The snapshot '{0}' is truncated.".format(path))
+
+        offset = HEADER_SIZE
+        arrays = []
+
+        for (size, dtype) in zip(sizes, ("<f8", "<i8", "<i8", "<i4")):
+            arrays.append(np.frombuffer(mapped, dtype=dtype, count=size // np.dtype(dtype).itemsize, offset=offset))
+            offset += size
+    except Exception:
+        mapped.close()
+        raise
+
+    objs, counts, inverse, fronts = arrays
+
+    return Snapshot(mapped, objs.reshape(count_of_unique, count_of_obj), counts, inverse, fronts)
@@ -0,0 +1,180 @@
+"""The module contains the statistics of the non-dominated sorting for the profiling.
+
+The statistics object is passed through the routines of the 'ndomsort' of a sorting, and they are counted
+by the 'SortStats.call' only if it is not None. So the sorting without the statistics does not have any overhead,
+and the sortings, which are executed concurrently in the other threads, are not counted. The routines of
+the compiled engine and the worker processes are not counted.
+
+"""
+
+__all__ = ["SortStats"]
+
+from typing import Callable, Dict, Any
+from collections import Counter
+from contextlib import contextmanager
+import time
+import tracemalloc
+
+# The routines of the 'ndomsort', which are counted.
+ROUTINES = ("_nd_helper_a", "_nd_helper_b", "_sweep_a", "_sweep_b", "_split_by", "_merge",
+            "_brute_force_a", "_brute_force_b", "_first_front", "_group_by_objectives", "_unique_rows")
+
+
+def _size_bucket(size: int) -> int:
+    """Return the upper bound of the bucket of the histogram: the least power of two, which is greater than 'size'."""
+    return 1 << size.bit_length()
+
+
+class SortStats:
+    """The statistics of the non-dominated sortings.
+
+    It is passed as the argument 'stats' of the 'ndomsort.non_domin_sort' or 'ndomsort.non_domin_sort_array'
+    and it accumulates the statistics of the all sortings.
+
+    The attributes:
+        'calls': The number of the calls of the every routine from the 'ROUTINES'.
+        'times': The total time of the calls of the every routine in seconds, including the nested routines.
+        'max_depth': The maximum size of the stack of the tasks. The tasks replace the recursive calls,
+        so it is the analog of the depth of the recursion.
+        'partition_sizes': The histogram of the sizes of the ranges after the '_split_by':
+        the upper bounds of the buckets (the powers of two) as keys and the numbers of the ranges as values.
+        'brute_force_sizes': The histogram of the sizes of the subproblems, which are solved by the pairwise
+        comparisons: the number of the elements for the '_brute_force_a' and the number of the pairs
+        for the '_brute_force_b'.
+        'count_of_decisions': The number of the sorted decisions.
+        'count_of_unique': The number of the unique values of the objectives.
+        'peak_memory': The maximum size of the allocated memory in bytes during a sorting (by the 'tracemalloc')
+        or None, if 'trace_memory' is False.
+        'elapsed': The total time of the sortings in seconds.
+
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        """
+        --------------------
+        Args:
+            'trace_memory': If it is True, then the peak of the allocated memory is traced by the 'tracemalloc'.
+            It slows down the sorting.
+
+        """
+        self.trace_memory = trace_memory
+        self.calls = Counter()
+        self.times = Counter()
+        self.max_depth = 0
+        self.partition_sizes = Counter()
+        self.brute_force_sizes = Counter()
+        self.count_of_decisions = 0
+        self.count_of_unique = 0
+        self.peak_memory = None
+        self.elapsed = 0.0
+        # The number of the nested 'collect'.
+        self._collecting = 0
+
+    @property
+    def is_collecting(self) -> bool:
+        """Is it inside the 'collect'?"""
+        return self._collecting > 0
+
+    @property
+    def dedup_ratio(self) -> float:
+        """The ratio of the number of the decisions to the number of the unique values of the objectives."""
+        return self.count_of_decisions / self.count_of_unique if self.count_of_unique else 1.0
+
+    def add_dedup(self, count_of_decisions: int, count_of_unique: int) -> None:
+        """Count the decisions and the unique values of the objectives of a sorting.
+
+        It is called by the 'call' of the '_group_by_objectives' and the '_unique_rows'.
+
+        """
+        self.count_of_decisions += count_of_decisions
+        self.count_of_unique += count_of_unique
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {"calls": dict(self.calls), "times": dict(self.times), "max_depth": self.max_depth,
+                "partition_sizes": dict(sorted(self.partition_sizes.items())),
+                "brute_force_sizes": dict(sorted(self.brute_force_sizes.items())),
+                "count_of_decisions": self.count_of_decisions, "count_of_unique": self.count_of_unique,
+                "dedup_ratio": self.dedup_ratio, "peak_memory": self.peak_memory, "elapsed": self.elapsed}
+
+    def __repr__(self) -> str:
+        return "{0}({1})".format(type(self).__name__, self.as_dict())
+
+    def add_depth(self, size_of_stack: int) -> None:
+        """Update the maximum size of the stack of the tasks."""
+        if size_of_stack > self.max_depth:
+            self.max_depth = size_of_stack
+
+    def call(self, routine: Callable[..., Any], *args: Any) -> Any:
+        """Call the routine of the 'ndomsort' with the 'args' and count it.
+
+        --------------------
+        Args:
+            'routine': The routine from the 'ROUTINES'.
+            'args': The positional arguments of the routine.
+
+        --------------------
+        Returns:
+            The result of the routine.
+
+        """
+        name = routine.__name__
+        start = time.perf_counter()
+        result = routine(*args)
+        self.times[name] += time.perf_counter() - start
+        self.calls[name] += 1
+
+        if name == "_split_by":
+            lo, indices = args[1], args[2]
+            mid1, mid2 = result
+            for size in (mid1 - lo, mid2 - mid1, lo + len(indices) - mid2):
+                self.partition_sizes[_size_bucket(size)] += 1
+        elif name == "_brute_force_a":
+            self.brute_force_sizes[_size_bucket(len(args[2]))] += 1
+        elif name == "_brute_force_b":
+            self.brute_force_sizes[_size_bucket(len(args[2]) * len(args[3]))] += 1
+        elif name == "_group_by_objectives":
+            self.add_dedup(sum(map(len, result[0].values())), len(result[0]))
+        elif name == "_unique_rows":
+            self.add_dedup(len(result[1]), len(result[0]))
+
+        return result
+
+    @contextmanager
+    def collect(self):
+        """Measure the elapsed time and the peak of the memory inside the context.
+
+        The sortings count their routines, when the statistics object is passed to them as the argument 'stats',
+        and they enter the context themselves. The nested contexts are measured once.
+
+        """
+        if self._collecting:
+            self._collecting += 1
+            try:
+                yield self
+            finally:
+                self._collecting -= 1
+            return
+
+        is_tracing = tracemalloc.is_tracing()
+
+        if self.trace_memory:
+            if not is_tracing:
+                tracemalloc.start()
+            elif hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+
+        self._collecting = 1
+        start = time.perf_counter()
+
+        try:
+            yield self
+        finally:
+            self.elapsed += time.perf_counter() - start
+            self._collecting = 0
+
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                self.peak_memory = peak if self.peak_memory is None else max(self.peak_memory, peak)
+                if not is_tracing:
+                    tracemalloc.stop()
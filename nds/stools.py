@@ -2,9 +2,20 @@
 
 """
 
-__all__ = ["is_dominate"]
+__all__ = ["is_dominate", "is_constrained_dominate", "epsilon_box", "is_epsilon_dominate", "is_dominate_many",
+           "dominance_matrix", "is_weakly_dominated_by_any", "FrontStaircase", "FenwickMax"]
 
-from typing import Sequence, Iterable, Optional, Any
+from typing import Sequence, Iterable, Optional, Tuple, Union, Any
+from bisect import bisect_left, bisect_right
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# The maximum number of the compared pairs of the vectors in the one block of the vectorized functions.
+BLOCK_SIZE = 1 << 16
 
 
 def is_dominate(leftv: Sequence[Any], rightv: Sequence[Any]) -> bool:
@@ -36,3 +47,278 @@ def is_dominate(leftv: Sequence[Any], rightv: Sequence[Any]) -> bool:
             is_all_values_less_or_eq = False
             break
     return is_all_values_less_or_eq and is_one_value_less
+
+
+def is_constrained_dominate(leftv: Sequence[Any], rightv: Sequence[Any], left_violation: Any,
+                            right_violation: Any) -> bool:
+    """Check. Does a 'leftv' dominate a 'rightv' by the rules of the constrained dominance (Deb)?
+
+    A vector is feasible, if its violation of the constraints is less or equal to 0. A 'leftv' dominates a 'rightv',
+    if and only if 'leftv' is feasible and 'rightv' is infeasible, or both vectors are infeasible and the violation
+    of the 'leftv' is less, or both vectors are feasible and 'leftv' dominates 'rightv' (see 'is_dominate').
+
+    --------------------
+    Args:
+        'leftv': A first vector of the values.
+        'rightv': A second vector of the values.
+        'left_violation': The total violation of the constraints of the 'leftv'.
+        'right_violation': The total violation of the constraints of the 'rightv'.
+
+    --------------------
+    Returns:
+        True if 'leftv' dominates a 'rightv', otherwise False.
+
+    """
+    if right_violation > 0:
+        return left_violation < right_violation
+    elif left_violation > 0:
+        return False
+
+    return is_dominate(leftv, rightv)
+
+
+def epsilon_box(values: Sequence[Any], epsilon: Union[Any, Sequence[Any]]) -> Tuple[int, ...]:
+    """Return the box of the epsilon-grid, which contains the vector: floor(values[i] / epsilon[i]) for the every i.
+
+    --------------------
+    Args:
+        'values': A vector of the values.
+        'epsilon': The positive size of the box for all values or the sequence of the sizes for the every value.
+
+    --------------------
+    Returns:
+        The tuple of the integer coordinates of the box.
+
+    """
+    if not hasattr(epsilon, "__len__"):
+        return tuple(math.floor(value / epsilon) for value in values)
+
+    assert len(epsilon) == len(values), "'epsilon' must have a same length as 'values'."
+
+    return tuple(math.floor(value / size) for (value, size) in zip(values, epsilon))
+
+
+def is_epsilon_dominate(leftv: Sequence[Any], rightv: Sequence[Any], epsilon: Union[Any, Sequence[Any]]) -> bool:
+    """Check. Does a 'leftv' epsilon-dominate a 'rightv'?
+
+    A 'leftv' epsilon-dominates a 'rightv', if and only if the box of the 'leftv' dominates the box of the 'rightv'
+    (see 'epsilon_box'). The vectors in the same box do not dominate each other.
+
+    --------------------
+    Args:
+        'leftv': A first vector of the values.
+        'rightv': A second vector of the values.
+        'epsilon': The positive size of the box for all values or the sequence of the sizes for the every value.
+
+    --------------------
+    Returns:
+        True if 'leftv' epsilon-dominates a 'rightv', otherwise False.
+
+    """
+    return is_dominate(epsilon_box(leftv, epsilon), epsilon_box(rightv, epsilon))
+
+
+def _as_matrix(vectors: Any) -> "np.ndarray":
+    if np is None:
+        raise ImportError("The vectorized functions require the NumPy.")
+
+    matrix = np.asarray(vectors)
+
+    assert matrix.ndim == 2, "The vectors must be a two-dimensional array, " \
+                             "but it has {0} dimensions.".format(matrix.ndim)
+    return matrix
+
+
+def is_dominate_many(leftv: Sequence[Any], rightvs: Any) -> "np.ndarray":
+    """Check. Does a 'leftv' dominate the every row of the 'rightvs'?
+
+    --------------------
+    Args:
+        'leftv': A vector of the values.
+        'rightvs': A two-dimensional array, the rows of it are the vectors of the values.
+
+    --------------------
+    Returns:
+        The boolean array. Its i-th value is True, if 'leftv' dominates 'rightvs[i]', otherwise False.
+
+    """
+    rightvs = _as_matrix(rightvs)
+    leftv = np.asarray(leftv)
+
+    assert leftv.shape == rightvs.shape[1:], "'leftv' must have a same length as the rows of 'rightvs'."
+
+    return np.all(leftv <= rightvs, axis=1) & np.any(leftv < rightvs, axis=1)
+
+
+def dominance_matrix(leftvs: Any, rightvs: Any) -> "np.ndarray":
+    """Compute the matrix of the dominance between the rows of the 'leftvs' and the rows of the 'rightvs'.
+
+    --------------------
+    Args:
+        'leftvs': A two-dimensional array, the rows of it are the vectors of the values.
+        'rightvs': A two-dimensional array, the rows of it are the vectors of the values.
+
+    --------------------
+    Returns:
+        The boolean matrix. Its value (i, j) is True, if 'leftvs[i]' dominates 'rightvs[j]', otherwise False.
+
+    """
+    leftvs, rightvs = _as_matrix(leftvs), _as_matrix(rightvs)
+
+    assert leftvs.shape[1] == rightvs.shape[1], "The rows of 'leftvs' must have a same length as the rows of 'rightvs'."
+
+    result = np.empty((len(leftvs), len(rightvs)), dtype=bool)
+    step = max(1, BLOCK_SIZE // max(1, len(rightvs)))
+
+    for start in range(0, len(leftvs), step):
+        block = leftvs[start:start + step, np.newaxis, :]
+        result[start:start + step] = np.all(block <= rightvs, axis=2) & np.any(block < rightvs, axis=2)
+
+    return result
+
+
+def is_weakly_dominated_by_any(compvs: Any, rightvs: Any) -> "np.ndarray":
+    """Check. Is there a row of the 'compvs', which is less or equal to a row of the 'rightvs', for the every row?
+
+    --------------------
+    Args:
+        'compvs': A two-dimensional array, the rows of it are the vectors of the values for comparing.
+        'rightvs': A two-dimensional array, the rows of it are the vectors of the values.
+
+    --------------------
+    Returns:
+        The boolean array. Its i-th value is True, if there exists j: compvs[j] <= rightvs[i] for all values,
+        otherwise False.
+
+    """
+    compvs, rightvs = _as_matrix(compvs), _as_matrix(rightvs)
+
+    assert compvs.shape[1] == rightvs.shape[1], "The rows of 'compvs' must have a same length as the rows of 'rightvs'."
+
+    result = np.zeros(len(rightvs), dtype=bool)
+    step = max(1, BLOCK_SIZE // max(1, len(rightvs)))
+
+    for start in range(0, len(compvs), step):
+        block = compvs[start:start + step, np.newaxis, :]
+        result |= np.any(np.all(block <= rightvs, axis=2), axis=0)
+
+    return result
+
+
+class FrontStaircase:
+    """An ordered staircase of the fronts for the line-sweep procedures.
+
+    It stores pairs (value, front), where the values and the fronts are both strictly increasing.
+    A pair is removed, when it cannot be an answer of the query 'max_front' anymore,
+    so the query and the insertion take O(log n) comparisons.
+
+    """
+
+    __slots__ = ("_values", "_fronts")
+
+    def __init__(self):
+        self._values = []
+        self._fronts = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def max_front(self, value: Any) -> int:
+        """Find the maximum front among the stored pairs, where the stored value is less or equal to a 'value'.
+
+        --------------------
+        Args:
+            'value': An upper bound of the values.
+
+        --------------------
+        Returns:
+            The maximum index of the front or -1, if there are not such pairs.
+
+        """
+        pos = bisect_right(self._values, value)
+        return self._fronts[pos - 1] if pos else -1
+
+    def add(self, value: Any, front: int) -> bool:
+        """Add the pair ('value', 'front') into the staircase.
+
+        The pair is ignored, if there is a stored pair with a less or equal value and a greater or equal front.
+        All stored pairs with a greater or equal value and a less or equal front are removed.
+
+        --------------------
+        Args:
+            'value': A value of the objective.
+            'front': An index of the front.
+
+        --------------------
+        Returns:
+            True, if the pair was added, otherwise False.
+
+        """
+        pos = bisect_right(self._values, value)
+
+        if pos and self._fronts[pos - 1] >= front:
+            return False
+
+        start = bisect_left(self._values, value, 0, pos)
+        end = bisect_right(self._fronts, front, start)
+
+        self._values[start:end] = (value,)
+        self._fronts[start:end] = (front,)
+
+        return True
+
+
+class FenwickMax:
+    """A Fenwick tree of the maximum fronts over the dense integer values [0, size) for the line-sweep procedures.
+
+    It is an alternative of the 'FrontStaircase' for a small domain of the values:
+    the query and the insertion take O(log size) time without the shifts of the lists.
+    The changed positions are remembered, so the tree is cleared in the time proportional to them
+    and it is reused by the next sweep.
+
+    """
+
+    __slots__ = ("_tree", "_touched")
+
+    def __init__(self, size: int):
+        self._tree = [-1] * (size + 1)
+        self._touched = []
+
+    def max_front(self, value: int) -> int:
+        """Find the maximum front among the stored pairs, where the stored value is less or equal to a 'value'.
+
+        --------------------
+        Returns:
+            The maximum index of the front or -1, if there are not such pairs.
+
+        """
+        tree = self._tree
+        front = -1
+        pos = value + 1
+
+        while pos > 0:
+            if tree[pos] > front:
+                front = tree[pos]
+            pos -= pos & -pos
+
+        return front
+
+    def add(self, value: int, front: int) -> None:
+        """Add the pair ('value', 'front') into the tree."""
+        tree = self._tree
+        pos = value + 1
+
+        while pos < len(tree) and tree[pos] < front:
+            if tree[pos] == -1:
+                self._touched.append(pos)
+            tree[pos] = front
+            pos += pos & -pos
+
+    def clear(self) -> None:
+        """Remove all pairs from the tree."""
+        tree = self._tree
+
+        for pos in self._touched:
+            tree[pos] = -1
+
+        self._touched.clear()
@@ -0,0 +1,394 @@
+"""The module contains the non-dominated sorting of the objectives, which do not fit into the memory.
+
+The sorting has three stages:
+
+1. The objectives are read by the chunks. Every chunk is sorted in the lexicographical order
+and it is written into the temporary file (a run).
+2. The runs are merged into the lexicographically ordered unique objectives.
+The index of the unique objectives is stored for the every row.
+3. The unique objectives are sorted by the divide-and-conquer over the ranges of them: the first half
+of the range is sorted, it is compared with the second half and then the second half is sorted.
+The comparison splits the rows by the median of an objective as the '_nd_helper_b', until the rows fit into
+the memory budget as the Python objects. The median is found by a sample of the values. The indices of the rows
+of the every part of the split are stored in the temporary files and they are processed by the chunks.
+
+All intermediate arrays of the objectives are memory-mapped files in the temporary directory. The NumPy is required.
+
+"""
+
+__all__ = ["non_domin_sort_stream"]
+
+from typing import Iterable, Iterator, List, Tuple, Union, Any
+import heapq
+import os
+import tempfile
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import ndomsort as nd
+
+# The default memory budget in bytes.
+DEFAULT_MEMORY_BUDGET = 256 * 1024 ** 2
+
+# The approximate size of the one row with 'm' objectives as the Python tuple in the bytes: a + b * m.
+_PY_ROW_BYTES = (200, 40)
+
+# The number of the values, whose median splits the rows, which do not fit into the memory.
+_MEDIAN_SAMPLE_SIZE = 4096
+
+
+def _iter_chunks(source: Any, count_of_obj: int, dtype: Any, chunk_size: int) -> Iterator["np.ndarray"]:
+    """Iterate over the chunks of the rows from the 'source'."""
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if path.endswith(".npy"):
+            source = np.load(path, mmap_mode="r")
+        else:
+            assert count_of_obj is not None, "'count_of_obj' is required for the raw binary file."
+            source = np.memmap(path, dtype=np.float64 if dtype is None else dtype, mode="r").reshape(-1, count_of_obj)
+
+    if isinstance(source, np.ndarray):
+        for start in range(0, len(source), chunk_size):
+            yield np.asarray(source[start:start + chunk_size])
+    else:
+        for chunk in source:
+            chunk = np.asarray(chunk)
+            for start in range(0, len(chunk), chunk_size):
+                yield chunk[start:start + chunk_size]
+
+
+def _iter_run(objs: "np.ndarray", indices: "np.ndarray", block_size: int) -> Iterator[Tuple[Tuple[Any, ...], int]]:
+    """Iterate over the rows of the run, which is read by the blocks."""
+    for start in range(0, len(objs), block_size):
+        yield from zip(map(tuple, objs[start:start + block_size].tolist()),
+                       indices[start:start + block_size].tolist())
+
+
+def _write_runs(chunks: Iterable["np.ndarray"], tmp_dir: str) -> Tuple[List[Tuple[str, str]], int, int, Any]:
+    """Sort the chunks and write them into the temporary files.
+
+    The runs keep the types of the chunks, so the values are not truncated, if the chunks have the different types.
+
+    --------------------
+    Returns:
+        The tuple: the list of the pairs of the paths to the objectives and the indices of the runs,
+        the total number of the rows, the number of the objectives and the common type of the values
+        of all chunks.
+
+    """
+    runs = []
+    total_rows = 0
+    count_of_obj = None
+    dtypes = []
+
+    for chunk in chunks:
+        assert chunk.ndim == 2, "The chunk must be a two-dimensional array, but it has {0} dimensions.".format(
+            chunk.ndim)
+
+        if count_of_obj is None:
+            count_of_obj = chunk.shape[1]
+            assert count_of_obj > 1, "The number of the objectives must be > 1, but it is {0}.".format(count_of_obj)
+        else:
+            assert chunk.shape[1] == count_of_obj, "The chunks have the different numbers of the objectives: " \
+                                                   "{0} and {1}.".format(count_of_obj, chunk.shape[1])
+
+        if len(chunk) == 0:
+            continue
+
+        dtypes.append(chunk.dtype)
+        # 'np.lexsort' uses the last key as a primary key.
+        order = np.lexsort(chunk.T[::-1])
+        objs_path = os.path.join(tmp_dir, "run{0}_objs.npy".format(len(runs)))
+        indices_path = os.path.join(tmp_dir, "run{0}_indices.npy".format(len(runs)))
+        np.save(objs_path, np.ascontiguousarray(chunk[order]))
+        np.save(indices_path, (order + total_rows).astype(np.int64))
+        runs.append((objs_path, indices_path))
+        total_rows += len(chunk)
+
+    assert total_rows != 0, "The sequence of the objectives is empty."
+
+    return runs, total_rows, count_of_obj, np.result_type(*dtypes)
+
+
+def _merge_runs(runs: List[Tuple[str, str]], total_rows: int, count_of_obj: int, dtype: Any, tmp_dir: str,
+                block_size: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Merge the runs into the lexicographically ordered unique objectives.
+
+    --------------------
+    Returns:
+        The tuple of the memory-mapped arrays: the unique objectives and the index of the unique objectives
+        for the every row.
+
+    """
+    unique_objs = np.lib.format.open_memmap(os.path.join(tmp_dir, "unique.npy"), mode="w+", dtype=dtype,
+                                            shape=(total_rows, count_of_obj))
+    inverse = np.lib.format.open_memmap(os.path.join(tmp_dir, "inverse.npy"), mode="w+", dtype=np.int64,
+                                        shape=(total_rows,))
+
+    iterators = [_iter_run(np.load(objs_path, mmap_mode="r"), np.load(indices_path, mmap_mode="r"), block_size)
+                 for (objs_path, indices_path) in runs]
+
+    count_unique = 0
+    last_objs = None
+    pending_objs = []
+    pending_rows, pending_ids = [], []
+
+    def flush():
+        nonlocal pending_objs
+        if pending_objs:
+            unique_objs[count_unique - len(pending_objs):count_unique] = pending_objs
+            pending_objs = []
+        if pending_rows:
+            inverse[pending_rows] = pending_ids
+            pending_rows.clear()
+            pending_ids.clear()
+
+    for (objs, row) in heapq.merge(*iterators):
+        if objs != last_objs:
+            last_objs = objs
+            count_unique += 1
+            pending_objs.append(objs)
+
+        pending_rows.append(row)
+        pending_ids.append(count_unique - 1)
+
+        if len(pending_rows) >= block_size:
+            flush()
+
+    flush()
+
+    return unique_objs[:count_unique], inverse
+
+
+def _tmp_array(size: int, dtype: Any, tmp_dir: str) -> "np.ndarray":
+    """Create the array in the temporary file, which is removed, when the array is deleted."""
+    if size == 0:
+        return np.empty(0, dtype=dtype)
+
+    with tempfile.TemporaryFile(dir=tmp_dir) as file:
+        return np.memmap(file, dtype=dtype, mode="w+", shape=(size,))
+
+
+def _tmp_arange(lo: int, hi: int, tmp_dir: str, block_size: int) -> "np.ndarray":
+    """Create the array of the indices [lo, hi) in the temporary file by the blocks."""
+    indices = _tmp_array(hi - lo, np.int64, tmp_dir)
+
+    for start in range(0, hi - lo, block_size):
+        indices[start:start + block_size] = np.arange(lo + start, min(hi, lo + start + block_size))
+
+    return indices
+
+
+def _split_rows(unique_objs: "np.ndarray", indices: "np.ndarray", obj_index: int, split_value: Any,
+                is_comp: bool, tmp_dir: str, block_size: int) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Split the ordered indices of the rows by the 'split_value' of the objective 'obj_index' by the blocks.
+
+    --------------------
+    Returns:
+        The indices of the rows with the less, the less or equal ('is_comp') or the greater or equal
+        (not 'is_comp') and the greater values in the temporary files.
+
+    """
+    parts = [_tmp_array(len(indices), np.int64, tmp_dir) for _ in range(3)]
+    sizes = [0, 0, 0]
+
+    for start in range(0, len(indices), block_size):
+        block = np.asarray(indices[start:start + block_size])
+        values = unique_objs[block, obj_index]
+        masks = (values < split_value, values <= split_value if is_comp else values >= split_value,
+                 values > split_value)
+
+        for (k, mask) in enumerate(masks):
+            selected = block[mask]
+            parts[k][sizes[k]:sizes[k] + len(selected)] = selected
+            sizes[k] += len(selected)
+
+    return parts[0][:sizes[0]], parts[1][:sizes[1]], parts[2][:sizes[2]]
+
+
+def _value_range(unique_objs: "np.ndarray", indices: "np.ndarray", obj_index: int, block_size: int) \
+        -> Tuple[Any, Any]:
+    """Return the minimum and the maximum values of the objective 'obj_index' of the rows by the blocks."""
+    ranges = [(values.min(), values.max()) for values in (unique_objs[np.asarray(indices[start:start + block_size]),
+                                                                     obj_index]
+                                                          for start in range(0, len(indices), block_size))]
+
+    return min(lo for (lo, _) in ranges), max(hi for (_, hi) in ranges)
+
+
+def _helper_b_blocks(unique_objs: "np.ndarray", fronts: "np.ndarray", comp: "np.ndarray", assign: "np.ndarray",
+                     count_of_obj: int, max_rows: int, tmp_dir: str) -> None:
+    """Update front's indices of the rows 'assign' by the rows 'comp' for the first 'count_of_obj' objectives.
+
+    It is the '_nd_helper_b' for the rows, which do not fit into the memory. The fronts of the 'comp' are final,
+    so the subproblems are independent. The rows are split by the median of the sample of the values of the last
+    objective as in the '_nd_helper_b', until the subproblem has at most 'max_rows' rows, then it is solved
+    in the memory. The indices of the rows are kept in the temporary files and they are read by the blocks
+    with 'max_rows' rows, so the used memory does not depend on the number of the rows.
+
+    --------------------
+    Args:
+        'unique_objs': The lexicographically ordered unique objectives.
+        'fronts': Front's indices of the 'unique_objs'.
+        'comp', 'assign': The ordered indices of the rows for comparing and for assign front.
+        'count_of_obj': The number of the values from the objectives, for the sorting.
+        'max_rows': The maximum number of the rows in the memory.
+        'tmp_dir': The directory for the temporary files.
+
+    """
+    if len(comp) == 0 or len(assign) == 0:
+        return
+
+    if count_of_obj == 0:
+        # All rows of the 'comp' dominate all rows of the 'assign'.
+        max_front = max(fronts[np.asarray(comp[start:start + max_rows])].max()
+                        for start in range(0, len(comp), max_rows))
+
+        for start in range(0, len(assign), max_rows):
+            block = np.asarray(assign[start:start + max_rows])
+            fronts[block] = np.maximum(fronts[block], max_front + 1)
+        return
+
+    if len(comp) + len(assign) <= max_rows:
+        comp, assign = np.asarray(comp), np.asarray(assign)
+
+        if count_of_obj == 1:
+            # The row is dominated by the rows with the less or equal first value, so the front is greater than
+            # the maximum front of them.
+            comp_values = unique_objs[comp, 0]
+            order = np.argsort(comp_values, kind="stable")
+            max_fronts = np.maximum.accumulate(fronts[comp][order])
+            positions = np.searchsorted(comp_values[order], unique_objs[assign, 0], side="right")
+            is_dominated = positions > 0
+            assign_fronts = fronts[assign]
+            fronts[assign[is_dominated]] = np.maximum(assign_fronts[is_dominated],
+                                                      max_fronts[positions[is_dominated] - 1] + 1)
+            return
+
+        indices = np.union1d(comp, assign)
+        objs = unique_objs[indices].tolist()
+        local_fronts = fronts[indices].tolist()
+        buffer = np.searchsorted(indices, comp).tolist() + np.searchsorted(indices, assign).tolist()
+        nd._run_tasks(objs, local_fronts, buffer,
+                      [(nd._TASK_HELPER_B, 0, len(comp), len(comp), len(buffer), count_of_obj)])
+        fronts[indices] = local_fronts
+        return
+
+    obj_index = count_of_obj - 1
+    comp_min, comp_max = _value_range(unique_objs, comp, obj_index, max_rows)
+    assign_min, assign_max = _value_range(unique_objs, assign, obj_index, max_rows)
+
+    if comp_max <= assign_min:
+        _helper_b_blocks(unique_objs, fronts, comp, assign, count_of_obj - 1, max_rows, tmp_dir)
+    elif comp_min <= assign_max:
+        # The median of the sample of the rows is the split value, because all values do not fit into the memory.
+        step = max(1, (len(comp) + len(assign)) // _MEDIAN_SAMPLE_SIZE)
+        values = np.concatenate((unique_objs[np.asarray(comp[::step]), obj_index],
+                                 unique_objs[np.asarray(assign[::step]), obj_index]))
+        median = np.partition(values, (len(values) - 1) // 2)[(len(values) - 1) // 2]
+        del values
+
+        comp_parts = _split_rows(unique_objs, comp, obj_index, median, True, tmp_dir, max_rows)
+        assign_parts = _split_rows(unique_objs, assign, obj_index, median, False, tmp_dir, max_rows)
+        del comp, assign
+
+        _helper_b_blocks(unique_objs, fronts, comp_parts[0], assign_parts[0], count_of_obj, max_rows, tmp_dir)
+        _helper_b_blocks(unique_objs, fronts, comp_parts[1], assign_parts[1], count_of_obj - 1, max_rows, tmp_dir)
+        _helper_b_blocks(unique_objs, fronts, comp_parts[2], assign_parts[2], count_of_obj, max_rows, tmp_dir)
+
+
+def _rank_blocks(unique_objs: "np.ndarray", fronts: "np.ndarray", block_size: int, tmp_dir: str, lo: int = 0,
+                 hi: int = None) -> None:
+    """Attribute front's indices to the lexicographically ordered unique objectives 'unique_objs[lo:hi]'.
+
+    The elements can be dominated only by the lexicographically less elements, so the range is split into halves:
+    the first half is sorted, then it is compared with the second half by the '_helper_b_blocks'
+    and then the second half is sorted. The ranges with at most two blocks are sorted in the memory.
+
+    """
+    hi = len(unique_objs) if hi is None else hi
+    count_of_obj = unique_objs.shape[1]
+
+    if hi - lo <= 2 * block_size:
+        objs = unique_objs[lo:hi].tolist()
+        # The fronts, which are found by the previous comparisons, are the lower bounds.
+        range_fronts = fronts[lo:hi].tolist()
+        nd._run_tasks(objs, range_fronts, list(range(len(objs))), [(nd._TASK_HELPER_A, 0, len(objs), count_of_obj)])
+        fronts[lo:hi] = range_fronts
+        return
+
+    mid = (lo + hi) // 2
+    _rank_blocks(unique_objs, fronts, block_size, tmp_dir, lo, mid)
+    _helper_b_blocks(unique_objs, fronts, _tmp_arange(lo, mid, tmp_dir, block_size),
+                     _tmp_arange(mid, hi, tmp_dir, block_size), count_of_obj, 2 * block_size, tmp_dir)
+    _rank_blocks(unique_objs, fronts, block_size, tmp_dir, mid, hi)
+
+
+def non_domin_sort_stream(source: Union[str, "os.PathLike", "np.ndarray", Iterable["np.ndarray"]],
+                          out: Union[str, "os.PathLike", None] = None, count_of_obj: int = None, dtype: Any = None,
+                          memory_budget: int = DEFAULT_MEMORY_BUDGET, block_size: int = None,
+                          tmp_dir: str = None) -> "np.ndarray":
+    """A non-dominated sorting of the objectives, which are read by the chunks.
+
+    --------------------
+    Args:
+        'source': The objectives. It is one of the following:
+            the path to the '.npy' file with the two-dimensional array, it is memory-mapped;
+            the path to the raw binary file with the values of the type 'dtype' (float64 by default),
+            'count_of_obj' is required;
+            the two-dimensional array (for example, 'np.memmap');
+            the iterable of the two-dimensional arrays (the chunks of the rows).
+        'out': The path to the '.npy' file for front's indices or None.
+        'count_of_obj': The number of the objectives for the raw binary file.
+        'dtype': The type of the values for the raw binary file.
+        'memory_budget': The approximate maximum memory in bytes for the chunks and the blocks.
+        'block_size': The number of the rows in the chunk and in the block.
+        It overrides the size, which is computed from the 'memory_budget'.
+        'tmp_dir': The directory for the temporary files or None for the default temporary directory.
+
+    --------------------
+    Returns:
+        The array of front's indices (int32) for the every row.
+        If 'out' is not None, then it is the memory-mapped array in the 'out' file.
+
+    --------------------
+    Raises:
+        ImportError: If the NumPy is not installed.
+
+    """
+    if np is None:
+        raise ImportError("'non_domin_sort_stream' requires the NumPy.")
+
+    if block_size is None:
+        row_bytes = _PY_ROW_BYTES[0] + _PY_ROW_BYTES[1] * (count_of_obj or getattr(source, "shape", (0, 8))[-1])
+        # Two blocks are in the memory as the Python objects at once.
+        block_size = max(1, memory_budget // (2 * row_bytes))
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        runs, total_rows, count_of_obj, dtype = _write_runs(_iter_chunks(source, count_of_obj, dtype, block_size),
+                                                            work_dir)
+        # The runs are merged at once, so the buffer of the every run is smaller.
+        run_block_size = max(1, block_size // max(1, len(runs)))
+        unique_objs, inverse = _merge_runs(runs, total_rows, count_of_obj, dtype, work_dir, run_block_size)
+
+        unique_fronts = np.lib.format.open_memmap(os.path.join(work_dir, "fronts.npy"), mode="w+", dtype=np.int32,
+                                                  shape=(len(unique_objs),))
+        _rank_blocks(unique_objs, unique_fronts, block_size, work_dir)
+
+        if out is None:
+            fronts = np.empty(total_rows, dtype=np.int32)
+        else:
+            fronts = np.lib.format.open_memmap(os.fspath(out), mode="w+", dtype=np.int32, shape=(total_rows,))
+
+        for start in range(0, total_rows, block_size):
+            fronts[start:start + block_size] = unique_fronts[inverse[start:start + block_size]]
+
+        if out is not None:
+            fronts.flush()
+
+        del unique_objs, inverse, unique_fronts
+
+    return fronts
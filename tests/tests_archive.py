@@ -0,0 +1,93 @@
+import unittest
+import random
+from unittest import mock
+
+import nds.ndomsort as nds
+import nds.archive as arch
+from nds.archive import NonDominatedArchive
+
+
+class TestArchive(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(2)
+        self._min_dim = 2
+        self._max_dim = 5
+
+    def _check_archive(self, archive: NonDominatedArchive, ids: list):
+        decisions = [archive.get(decision_id) for decision_id in ids]
+        expected = nds.non_domin_sort(decisions, only_front_indices=True)
+        self.assertSequenceEqual([archive.front(decision_id) for decision_id in ids], expected)
+        self.assertDictEqual(archive.fronts(), dict(nds.non_domin_sort(decisions)))
+
+    def test_archive_insert_remove(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            self._check_insert_remove(dim)
+
+    def test_archive_insert_remove_without_full_update(self):
+        with mock.patch.object(arch, "FULL_UPDATE_RATIO", 0):
+            for dim in range(self._min_dim, self._max_dim + 1):
+                self._check_insert_remove(dim)
+
+    def test_archive_large_affected_region(self):
+        # The inserted element dominates all elements, so they are sorted again without the search of the affected.
+        decisions = [tuple(random.randint(1, 10) for _ in range(3)) for _ in range(100)]
+        archive = NonDominatedArchive(decisions)
+        archive.fronts()
+
+        with mock.patch.object(NonDominatedArchive, "_find_affected", side_effect=AssertionError):
+            ids = archive.insert([(0, 0, 0)])
+            self.assertEqual(archive.front(ids[0]), 0)
+
+        self._check_archive(archive, list(range(len(decisions))) + ids)
+
+    def test_archive_one_update(self):
+        # The insertions and the removals between the requests of the fronts are handled by the one update.
+        decisions = [tuple(random.randint(0, 10) for _ in range(3)) for _ in range(100)]
+        archive = NonDominatedArchive(decisions)
+        archive.fronts()
+
+        with mock.patch.object(NonDominatedArchive, "_update", wraps=archive._update) as update:
+            ids = archive.insert([tuple(random.randint(0, 10) for _ in range(3)) for _ in range(10)])
+            archive.remove([0, 1, ids[0]])
+            self.assertEqual(update.call_count, 0)
+
+            self._check_archive(archive, list(range(2, len(decisions))) + ids[1:])
+            self.assertEqual(update.call_count, 1)
+
+    def _check_insert_remove(self, dim: int):
+        archive = NonDominatedArchive()
+        ids = []
+
+        for _ in range(20):
+            new_decisions = [tuple(random.randint(0, 5) for _ in range(dim)) for _ in range(10)]
+            ids.extend(archive.insert(new_decisions))
+            self._check_archive(archive, ids)
+
+            removed_ids = random.sample(ids, 5)
+            archive.remove(removed_ids)
+            ids = [decision_id for decision_id in ids if decision_id not in removed_ids]
+            self._check_archive(archive, ids)
+
+        self.assertEqual(len(archive), len(ids))
+
+    def test_archive_get_objectives(self):
+        archive = NonDominatedArchive([[1, 2, "a"], [2, 1, "b"]], lambda decision: decision[:2])
+        ids = archive.insert([[0, 0, "c"]])
+
+        self.assertEqual(archive.fronts(), {0: ([0, 0, "c"],), 1: ([1, 2, "a"], [2, 1, "b"])})
+
+        archive.remove(ids)
+
+        self.assertNotIn(ids[0], archive)
+        self.assertEqual(archive.fronts(), {0: ([1, 2, "a"], [2, 1, "b"])})
+
+    def test_archive_remove_unknown(self):
+        archive = NonDominatedArchive([(1, 2)])
+
+        with self.assertRaises(KeyError):
+            archive.remove([10])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import asyncio
+import random
+from unittest import mock
+
+import nds.ndomsort as nds
+import nds.asyncsort as asyncsort
+
+
+class TestAsyncSort(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(5)
+        # 'unittest.IsolatedAsyncioTestCase' requires Python 3.8.
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self._loop.close()
+
+    def _generate(self, dim: int, size: int, max_value: int):
+        return [tuple(random.randint(0, max_value) for _ in range(dim)) for _ in range(size)]
+
+    def test_non_domin_sort_async(self):
+        self._loop.run_until_complete(self._test_non_domin_sort_async())
+
+    async def _test_non_domin_sort_async(self):
+        for dim in (2, 3, 5):
+            for max_value in (10, 1000):
+                decisions = self._generate(dim, 500, max_value)
+                with self.subTest(dim=dim, max_value=max_value):
+                    self.assertDictEqual(await asyncsort.non_domin_sort_async(decisions),
+                                         nds.non_domin_sort(decisions))
+
+    def test_chunks(self):
+        self._loop.run_until_complete(self._test_chunks())
+
+    async def _test_chunks(self):
+        decisions = self._generate(4, 1000, 1000)
+        progress = []
+
+        with mock.patch.object(asyncsort, "CHUNKED_SIZE", 10), mock.patch.object(asyncsort, "CHUNK_TASKS", 1), \
+                mock.patch.object(asyncsort, "PROGRESS_INTERVAL", 0):
+            fronts = await asyncsort.non_domin_sort_async(decisions, only_front_indices=True,
+                                                          progress=progress.append)
+            # The callbacks are called in the event loop after the end of the sorting.
+            await asyncio.sleep(0)
+
+        self.assertTupleEqual(fronts, nds.non_domin_sort(decisions, only_front_indices=True))
+        self.assertGreater(len(progress), 1)
+        self.assertListEqual(progress, sorted(progress))
+        self.assertEqual(progress[-1], 1.0)
+
+    def test_cancellation(self):
+        self._loop.run_until_complete(self._test_cancellation())
+
+    async def _test_cancellation(self):
+        decisions = self._generate(4, 1000, 1000)
+        token = asyncsort.CancellationToken()
+
+        with mock.patch.object(asyncsort, "CHUNKED_SIZE", 10), mock.patch.object(asyncsort, "CHUNK_TASKS", 1), \
+                mock.patch.object(asyncsort, "PROGRESS_INTERVAL", 0):
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncsort.non_domin_sort_async(decisions, token=token,
+                                                     progress=lambda fraction: token.cancel())
+
+        self.assertTrue(token.cancelled)
+
+        with self.assertRaises(asyncio.CancelledError):
+            await asyncsort.non_domin_sort_async(decisions, token=token)
+
+    def test_service(self):
+        self._loop.run_until_complete(self._test_service())
+
+    async def _test_service(self):
+        populations = [self._generate(3, 300, 100) for _ in range(6)]
+        active = []
+        max_active = []
+        sort_async = asyncsort.non_domin_sort_async
+
+        async def counted_sort_async(*args, **kwargs):
+            active.append(None)
+            max_active.append(len(active))
+            try:
+                return await sort_async(*args, **kwargs)
+            finally:
+                active.pop()
+
+        with mock.patch.object(asyncsort, "non_domin_sort_async", counted_sort_async):
+            async with asyncsort.SortService(max_workers=2) as service:
+                results = await asyncio.gather(*(service.sort(decisions, only_front_indices=True)
+                                                 for decisions in populations))
+
+        self.assertLessEqual(max(max_active), 2)
+
+        for (decisions, fronts) in zip(populations, results):
+            self.assertTupleEqual(fronts, nds.non_domin_sort(decisions, only_front_indices=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from benchmarks import datasets
+from benchmarks.naive import naive_front_indices
+from benchmarks.runner import run, scaling_exponent
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_datasets(self):
+        for distribution in datasets.DISTRIBUTIONS:
+            seq = datasets.generate(distribution, 20, 3, 0)
+            self.assertEqual(len(seq), 20)
+            self.assertTrue(all(len(point) == 3 for point in seq))
+            self.assertListEqual(seq, datasets.generate(distribution, 20, 3, 0))
+
+        self.assertListEqual(naive_front_indices(datasets.generate("hyperplane", 20, 3, 0)), [0] * 20)
+        self.assertListEqual(sorted(naive_front_indices(datasets.generate("chain", 20, 3, 0))), list(range(20)))
+
+    def test_scaling_exponent(self):
+        self.assertAlmostEqual(scaling_exponent([10, 100, 1000], [1, 100, 10000]), 2)
+
+    def test_run(self):
+        report = run(["uniform", "tied"], [2, 4], [20, 40], repeat=1, naive_max_size=40)
+
+        self.assertEqual(len(report["results"]), 8)
+        self.assertEqual(len(report["scaling"]), 4)
+        self.assertTrue(all(record["is_equal_naive"] for record in report["results"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
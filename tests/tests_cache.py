@@ -0,0 +1,101 @@
+import unittest
+import random
+
+import nds.ndomsort as nds
+import nds.cache as cache
+
+
+class TestObjectiveCache(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(11)
+
+    def _generate(self, dim: int, size: int, max_value: int):
+        return [[random.randint(0, max_value) for _ in range(dim)] for _ in range(size)]
+
+    def test_memoization(self):
+        calls = []
+
+        def get_objectives(decision):
+            calls.append(decision)
+            return decision
+
+        decisions = self._generate(3, 50, 100)
+        objective_cache = cache.ObjectiveCache(get_objectives)
+
+        for _ in range(3):
+            self.assertTupleEqual(nds.non_domin_sort(decisions, objective_cache, only_front_indices=True),
+                                  nds.non_domin_sort(decisions, only_front_indices=True))
+
+        self.assertEqual(len(calls), len(decisions))
+        self.assertEqual(objective_cache.misses, len(decisions))
+        self.assertEqual(objective_cache.hits, 2 * len(decisions))
+
+    def test_lru_eviction(self):
+        decisions = self._generate(2, 10, 100)
+        objective_cache = cache.ObjectiveCache(maxsize=4)
+
+        for decision in decisions:
+            objective_cache(decision)
+
+        self.assertEqual(len(objective_cache), 4)
+
+        # The last decisions are in the cache, the first decision is evicted.
+        objective_cache(decisions[-1])
+        self.assertEqual(objective_cache.hits, 1)
+        objective_cache(decisions[0])
+        self.assertEqual(objective_cache.misses, len(decisions) + 1)
+
+    def test_key(self):
+        decisions = [{"id": index, "objs": objs} for (index, objs) in enumerate(self._generate(2, 20, 10))]
+        objective_cache = cache.ObjectiveCache(lambda x: x["objs"], key=lambda x: x["id"])
+
+        for decision in decisions:
+            objective_cache(dict(decision))
+
+        for decision in decisions:
+            self.assertTupleEqual(objective_cache(decision), tuple(decision["objs"]))
+
+        self.assertEqual(objective_cache.hits, len(decisions))
+
+    def test_repeated_sorts(self):
+        population = self._generate(4, 300, 30)
+        objective_cache = cache.ObjectiveCache()
+
+        for generation in range(10):
+            # The part of the population is replaced by the new decisions.
+            count_of_new = 10 if generation % 3 else 250
+            population = population[count_of_new:] + self._generate(4, count_of_new, 30)
+
+            with self.subTest(generation=generation):
+                self.assertTupleEqual(nds.non_domin_sort(population, objective_cache, only_front_indices=True),
+                                      nds.non_domin_sort(population, only_front_indices=True))
+
+    def test_clear(self):
+        objective_cache = cache.ObjectiveCache()
+        decisions = self._generate(3, 50, 5)
+        nds.non_domin_sort(decisions, objective_cache)
+
+        objective_cache.clear()
+
+        self.assertEqual(len(objective_cache), 0)
+        self.assertEqual(objective_cache.hits, 0)
+        self.assertEqual(objective_cache.misses, 0)
+
+    def test_repeated_sorts_same_objectives(self):
+        # 'c' is taken from the cache, but it is not in the previous sorting, and 'b2' is equal to the cached 'b'.
+        a, b, c, d, e = [0, 4], [1, 3], [2, 2], [3, 1], [4, 0]
+        b2 = list(b)
+        objective_cache = cache.ObjectiveCache()
+
+        for decisions in ([a, b, c, d, e], [a, b, d, e], [a, b, c, d, e, b2]):
+            with self.subTest(decisions=decisions):
+                self.assertTupleEqual(nds.non_domin_sort(decisions, objective_cache, only_front_indices=True),
+                                      nds.non_domin_sort(decisions, only_front_indices=True))
+
+        self.assertDictEqual(nds.non_domin_sort([a, b, c, d, e, b2], objective_cache),
+                             nds.non_domin_sort([a, b, c, d, e, b2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
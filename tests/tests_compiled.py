@@ -0,0 +1,57 @@
+import unittest
+import random
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import nds.ndomsort as nds
+import nds.compiled as cmp
+
+
+@unittest.skipIf(np is None, "The NumPy is not installed.")
+class TestCompiled(unittest.TestCase):
+    """The kernels are plain Python functions, if the Numba is not installed, so they are tested without it."""
+
+    def setUp(self):
+        random.seed(4)
+        self._min_dim = 2
+        self._max_dim = 5
+
+    def test_nd_sort(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            for max_value in (3, 1000):
+                objs = sorted(set(tuple(random.randint(0, max_value) for _ in range(dim)) for _ in range(300)))
+                expected = nds._nd_sort(objs, dim)
+
+                for (size_a, size_b) in ((nds.BRUTE_FORCE_SIZE_A, nds.BRUTE_FORCE_SIZE_B), (1, 1)):
+                    with self.subTest(dim=dim, max_value=max_value, size_a=size_a, size_b=size_b):
+                        self.assertListEqual(cmp.nd_sort(objs, dim, size_a, size_b), expected)
+
+    def test_engine(self):
+        seq = [tuple(random.randint(0, 10) for _ in range(3)) for _ in range(200)]
+        expected = nds.non_domin_sort(seq, only_front_indices=True, engine="python")
+
+        with mock.patch.object(cmp, "is_available", return_value=True):
+            self.assertSequenceEqual(nds.non_domin_sort(seq, only_front_indices=True, engine="compiled"), expected)
+            self.assertSequenceEqual(nds.non_domin_sort_array(np.array(seq), engine="compiled").tolist(), expected)
+
+            with self.assertRaises(AssertionError):
+                nds.non_domin_sort([(2 ** 60 + 1, 0), (0, 1)], engine="compiled")
+
+            # The values are not exactly representable as floats, so the "python" engine is used.
+            self.assertSequenceEqual(nds.non_domin_sort([(2 ** 60 + 1, 0), (2 ** 60, 1)], only_front_indices=True),
+                                     (0, 0))
+
+        self.assertSequenceEqual(nds.non_domin_sort(seq, only_front_indices=True, engine="auto"), expected)
+
+    @unittest.skipIf(cmp.numba is not None, "The Numba is installed.")
+    def test_engine_without_numba(self):
+        with self.assertRaises(ImportError):
+            nds.non_domin_sort([(1, 2), (2, 1)], engine="compiled")
+
+
+if __name__ == '__main__':
+    unittest.main()
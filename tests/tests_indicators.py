@@ -0,0 +1,94 @@
+import unittest
+import random
+import itertools
+
+import nds.indicators as indicators
+
+
+class TestIndicators(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(13)
+        self._min_dim = 2
+        self._max_dim = 5
+
+    def _naive_hypervolume(self, points, reference):
+        # The points and the reference point are integer, so the volume is the number of the covered unit cells.
+        return sum(any(all(value <= coord for (value, coord) in zip(point, cell)) for point in points)
+                   for cell in itertools.product(*(range(ref_value) for ref_value in reference)))
+
+    def _generate(self, dim: int, size: int, max_value: int):
+        return [tuple(random.randint(0, max_value) for _ in range(dim)) for _ in range(size)]
+
+    def test_hypervolume(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            reference = (5,) * dim
+            for _ in range(20):
+                points = self._generate(dim, random.randint(1, 12), 5)
+                with self.subTest(dim=dim, points=points):
+                    self.assertEqual(indicators.hypervolume(points, reference),
+                                     self._naive_hypervolume(points, reference))
+
+    def test_hypervolume_get_objectives(self):
+        decisions = [{"objs": (0.5, 0.5, 0.5)}, {"objs": (0.25, 0.75, 0.75)}]
+        self.assertAlmostEqual(indicators.hypervolume(decisions, (1, 1, 1), lambda x: x["objs"]),
+                               0.125 + 0.75 * 0.25 * 0.25 - 0.5 * 0.25 * 0.25)
+
+    def test_exclusive_contributions(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            reference = (5,) * dim
+            for _ in range(20):
+                points = self._generate(dim, random.randint(1, 10), 5)
+                volume = self._naive_hypervolume(points, reference)
+                expected = [volume - self._naive_hypervolume(points[:i] + points[i + 1:], reference)
+                            for i in range(len(points))]
+                with self.subTest(dim=dim, points=points):
+                    self.assertSequenceEqual(indicators.exclusive_contributions(points, reference), expected)
+
+    def test_exclusive_contributions_3d(self):
+        # The sweep is compared with the contributions by the volumes of the rest points on the bigger sets.
+        for max_value in (3, 8, 100):
+            reference = (max_value + 1,) * 3
+            for _ in range(20):
+                points = self._generate(3, 40, max_value)
+                expected = [indicators._contribution(point, points[:i] + points[i + 1:], reference)
+                            if all(value < max_value + 1 for value in point) else 0.0
+                            for (i, point) in enumerate(points)]
+                with self.subTest(max_value=max_value, points=points):
+                    self.assertSequenceEqual(indicators.exclusive_contributions(points, reference), expected)
+
+    def _naive_removal(self, points, count, reference):
+        alive = list(range(len(points)))
+        removed = []
+
+        for _ in range(count):
+            contributions = indicators.exclusive_contributions([points[i] for i in alive], reference)
+            outside = [i for i in alive if any(value >= ref_value for (value, ref_value) in zip(points[i], reference))]
+            index = outside[0] if outside else min(zip(contributions, alive))[1]
+            removed.append(index)
+            alive.remove(index)
+        return removed
+
+    def test_remove_least_contributors(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            reference = (6,) * dim
+            for _ in range(20):
+                points = self._generate(dim, random.randint(1, 12), 6)
+                count = random.randint(0, len(points))
+                with self.subTest(dim=dim, points=points, count=count):
+                    self.assertSequenceEqual(indicators.remove_least_contributors(points, count, reference),
+                                             self._naive_removal(points, count, reference))
+
+    def test_remove_least_contributors_front_2d(self):
+        for _ in range(50):
+            size = random.randint(1, 15)
+            points = list(zip(sorted(random.sample(range(20), size)), sorted(random.sample(range(20), size),
+                                                                            reverse=True)))
+            random.shuffle(points)
+            count = random.randint(0, size)
+            self.assertSequenceEqual(indicators.remove_least_contributors(points, count, (20, 20)),
+                                     self._naive_removal(points, count, (20, 20)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,20 @@
 import unittest
 import random
 import itertools
+import statistics
+import sys
+import inspect
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 import nds.ndomsort as nds
+import nds.parallel as par
+import nds.pareto as pareto
 import nds.stools as st
 
 
@@ -75,6 +87,218 @@ class TestNdomsort(unittest.TestCase):
 
         self.assertSequenceEqual(fronts, [0, 1, 0])
 
+    def test_non_domin_sort_without_recursion(self):
+        seq = [tuple(random.randint(0, 3) for _ in range(self._max_dim)) for _ in range(500)]
+        expected = self._naive_front_indices(seq)
+
+        recursion_limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack()) + 20)
+        try:
+            fronts = nds.non_domin_sort(seq, only_front_indices=True)
+        finally:
+            sys.setrecursionlimit(recursion_limit)
+
+        self.assertSequenceEqual(fronts, expected)
+
+    @unittest.skipIf(sys.version_info < (3, 8), "The shared memory requires Python 3.8.")
+    def test_non_domin_sort_workers(self):
+        seq = [tuple(random.randint(0, 5) for _ in range(self._max_dim)) for _ in range(600)]
+        seq += [tuple(random.random() for _ in range(self._max_dim)) for _ in range(600)]
+
+        with mock.patch.object(par, "PARALLEL_THRESHOLD", 50):
+            fronts = nds.non_domin_sort(seq, only_front_indices=True, workers=2)
+
+        self.assertSequenceEqual(fronts, nds.non_domin_sort(seq, only_front_indices=True))
+
+    def test_non_domin_sort_workers_without_shared_memory(self):
+        seq = [tuple(random.random() for _ in range(self._max_dim)) for _ in range(300)]
+
+        with mock.patch.object(par, "PARALLEL_THRESHOLD", 50), \
+                mock.patch.object(par, "ParallelHelperB", side_effect=ImportError):
+            fronts = nds.non_domin_sort(seq, only_front_indices=True, workers=2)
+
+        self.assertSequenceEqual(fronts, nds.non_domin_sort(seq, only_front_indices=True))
+
+    def test_non_domin_sort_max_fronts(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            seq = [tuple(random.randint(0, 6) for _ in range(dim)) for _ in range(200)]
+            expected = nds.non_domin_sort(seq, only_front_indices=True)
+
+            for max_fronts in (1, 2, 3, max(expected) + 2):
+                fronts = nds.non_domin_sort(seq, only_front_indices=True, max_fronts=max_fronts)
+                self.assertSequenceEqual(fronts, [min(front, max_fronts) for front in expected])
+
+    def test_non_domin_sort_min_count(self):
+        seq = [(i % 10, 10 - i % 10, i // 10) for i in range(100)] * 2
+        expected = nds.non_domin_sort(seq, only_front_indices=True)
+
+        fronts = nds.non_domin_sort(seq, only_front_indices=True, min_count=35)
+        self.assertSequenceEqual(fronts, [min(front, 2) for front in expected])
+
+        fronts = nds.non_domin_sort(seq, min_count=35, max_fronts=1)
+        self.assertSetEqual(set(fronts.keys()), {0, 1})
+        self.assertEqual(len(fronts[0]), 20)
+
+    def test_non_domin_sort_top_chain(self):
+        # The fronts after the peeled fronts are found by the sorting of the rest elements.
+        for dim in range(self._min_dim, self._max_dim + 1):
+            seq = [(i,) * dim for i in range(100)]
+            random.shuffle(seq)
+            expected = [decision[0] for decision in seq]
+
+            with self.subTest(dim=dim):
+                fronts = nds.non_domin_sort(seq, only_front_indices=True, max_fronts=60)
+                self.assertSequenceEqual(fronts, [min(front, 60) for front in expected])
+                fronts = nds.non_domin_sort(seq, only_front_indices=True, min_count=50, max_fronts=70)
+                self.assertSequenceEqual(fronts, [min(front, 50) for front in expected])
+
+    def test_non_domin_sort_top_kung(self):
+        # The leading fronts are peeled off by the Kung's method without the sorting of all elements.
+        seq = [tuple(random.randint(0, 20) for _ in range(5)) for _ in range(500)]
+        expected = nds.non_domin_sort(seq, only_front_indices=True)
+
+        with mock.patch.object(nds, "_nd_sort", side_effect=AssertionError), \
+                mock.patch.object(pareto, "KUNG_BASE_SIZE", 8):
+            fronts = nds.non_domin_sort(seq, only_front_indices=True, max_fronts=2)
+            self.assertSequenceEqual(fronts, [min(front, 2) for front in expected])
+
+            count = sum(1 for front in expected if front == 0) + 1
+            fronts = nds.non_domin_sort(seq, only_front_indices=True, min_count=count)
+            self.assertSequenceEqual(fronts, [min(front, 2) for front in expected])
+
+    def test_non_domin_sort_result_array(self):
+        seq = [tuple(random.randint(0, 4) for _ in range(3)) for _ in range(300)]
+
+        fronts, order, front_offsets = nds.non_domin_sort(seq, result="array")
+        expected = nds.non_domin_sort(seq)
+
+        self.assertSequenceEqual(fronts, nds.non_domin_sort(seq, result="indices"))
+        self.assertEqual(len(front_offsets), len(expected) + 1)
+        self.assertEqual(front_offsets[-1], len(seq))
+
+        for front in expected:
+            indices = order[front_offsets[front]:front_offsets[front + 1]]
+            self.assertTrue(all(fronts[index] == front for index in indices))
+            self.assertSequenceEqual([seq[index] for index in indices], expected[front])
+
+    def test_non_domin_sort_populations(self):
+        populations = [[tuple(random.randint(0, 6) for _ in range(dim)) for _ in range(random.randint(1, 150))]
+                       for dim in range(self._min_dim, self._max_dim + 1) for _ in range(3)]
+        expected = [nds.non_domin_sort(decisions, only_front_indices=True) for decisions in populations]
+
+        self.assertListEqual(nds.non_domin_sort_many(populations), expected)
+        self.assertListEqual(nds.non_domin_sort_many(populations, workers=2), expected)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertListEqual(nds.non_domin_sort_many(populations, executor=executor), expected)
+
+        decisions = [[(fitness, "decision") for fitness in population] for population in populations]
+        self.assertListEqual(nds.non_domin_sort_many(decisions, lambda x: x[0]), expected)
+
+        for (engine, ties) in (("python", False), ("python", True), ("auto", None)):
+            with self.subTest(engine=engine, ties=ties):
+                self.assertListEqual(nds.non_domin_sort_many(populations, engine=engine, ties=ties), expected)
+
+    def test_non_domin_sort_populations_defaults(self):
+        # The populations are sorted with the same defaults of the engine and the tie-aware mode as 'non_domin_sort'.
+        populations = [[(1, 2), (2, 1), (2, 2)], [(1, 1, 1), (0, 2, 2)]]
+
+        with mock.patch.object(nds, "_nd_sort", wraps=nds._nd_sort) as nd_sort:
+            nds.non_domin_sort_many(populations)
+
+        self.assertTrue(all(call_args[0][3:5] == ("auto", None) for call_args in nd_sort.call_args_list))
+        self.assertEqual(nd_sort.call_count, len(populations))
+
+    def test_iter_fronts(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            for max_value in (5, 1000):
+                seq = [tuple(random.randint(0, max_value) for _ in range(dim)) for _ in range(300)]
+                with self.subTest(dim=dim, max_value=max_value):
+                    self.assertListEqual(list(nds.iter_fronts(seq)), sorted(nds.non_domin_sort(seq).items()))
+
+                    with mock.patch.object(nds, "ITER_PEELED_FRONTS", {}):
+                        self.assertListEqual(list(nds.iter_fronts(seq, lambda x: x[::-1])),
+                                             sorted(nds.non_domin_sort(seq, lambda x: x[::-1]).items()))
+
+        seq = [(i,) * 3 for i in range(50)]
+        self.assertTupleEqual(next(nds.iter_fronts(seq)), (0, ((0, 0, 0),)))
+
+    def test_iter_fronts_kung(self):
+        # The first front is found by the Kung's method for more than three objectives.
+        for dim in range(4, self._max_dim + 1):
+            seq = [tuple(random.randint(0, 20) for _ in range(dim)) for _ in range(400)]
+            with self.subTest(dim=dim), mock.patch.object(pareto, "KUNG_BASE_SIZE", 8):
+                self.assertListEqual(list(nds.iter_fronts(seq)), sorted(nds.non_domin_sort(seq).items()))
+
+    def test_select_median_low(self):
+        for size in (1, 2, 3, 10, 65, 100, 1000):
+            values = [random.randint(0, size // 2) for _ in range(size)]
+            self.assertEqual(nds._select_median_low(values), statistics.median_low(values))
+            self.assertEqual(nds._count_median_low(values), statistics.median_low(values))
+
+    def test_non_domin_sort_ties(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            for values in (range(3), range(40), [0.5 * i for i in range(-5, 5)]):
+                seq = [tuple(random.choice(values) for _ in range(dim)) for _ in range(500)]
+                expected = nds.non_domin_sort(seq, only_front_indices=True, engine="python", ties=False)
+
+                for ties in (None, True):
+                    with self.subTest(dim=dim, ties=ties):
+                        self.assertSequenceEqual(nds.non_domin_sort(seq, only_front_indices=True, engine="python",
+                                                                    ties=ties), expected)
+
+                with mock.patch.object(nds, "BRUTE_FORCE_SIZE_A", 2), mock.patch.object(nds, "BRUTE_FORCE_SIZE_B", 1):
+                    self.assertSequenceEqual(nds.non_domin_sort(seq, only_front_indices=True, engine="python",
+                                                                ties=True), expected)
+
+    def _naive_fronts_by(self, size: int, dominates) -> list:
+        fronts = [None] * size
+        rest = set(range(size))
+        front = 0
+
+        while rest:
+            current = [j for j in rest if not any(dominates(i, j) for i in rest if i != j)]
+            for j in current:
+                fronts[j] = front
+            rest.difference_update(current)
+            front += 1
+        return fronts
+
+    def test_non_domin_sort_constrained(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            for max_violation in (0, 3, 10):
+                seq = [(tuple(random.randint(0, 10) for _ in range(dim)), max(0, random.randint(-5, max_violation)))
+                       for _ in range(150)]
+                expected = self._naive_fronts_by(len(seq), lambda i, j: st.is_constrained_dominate(
+                    seq[i][0], seq[j][0], seq[i][1], seq[j][1]))
+
+                with self.subTest(dim=dim, max_violation=max_violation):
+                    self.assertSequenceEqual(nds.non_domin_sort(seq, lambda x: x[0], only_front_indices=True,
+                                                                get_violation=lambda x: x[1]), expected)
+                    if np is not None:
+                        self.assertSequenceEqual(nds.non_domin_sort_array(np.array([objs for (objs, _) in seq]),
+                                                                          violations=[v for (_, v) in seq]).tolist(),
+                                                 expected)
+
+        seq = [(random.random(), random.random()) for _ in range(50)]
+        fronts = nds.non_domin_sort(seq, get_violation=lambda x: x[0])
+        self.assertListEqual(sorted(fronts.keys()), list(range(len(fronts))))
+        self.assertEqual(sum(map(len, fronts.values())), len(seq))
+
+    def test_non_domin_sort_epsilon(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            seq = [tuple(random.uniform(0, 10) for _ in range(dim)) for _ in range(150)]
+
+            for epsilon in (0.5, 2, [1 + k for k in range(dim)]):
+                expected = self._naive_fronts_by(len(seq), lambda i, j: st.is_epsilon_dominate(seq[i], seq[j],
+                                                                                               epsilon))
+                with self.subTest(dim=dim, epsilon=epsilon):
+                    self.assertSequenceEqual(nds.non_domin_sort(seq, only_front_indices=True, epsilon=epsilon),
+                                             expected)
+                    if np is not None:
+                        self.assertSequenceEqual(nds.non_domin_sort_array(np.array(seq), epsilon=epsilon).tolist(),
+                                                 expected)
+
     def _generate_seq(self, dim: int):
         numbers = [i for i in range(-1, 2)]
         total_seq = len(numbers) ** dim
@@ -125,6 +349,34 @@ class TestNdomsort(unittest.TestCase):
 
             self._check_fronts(fronts)
 
+    def _naive_front_indices(self, seq) -> list:
+        fronts = [0] * len(seq)
+
+        for i in sorted(range(len(seq)), key=lambda index: tuple(seq[index])):
+            for j in range(len(seq)):
+                if st.is_dominate(seq[j], seq[i]):
+                    fronts[i] = max(fronts[i], fronts[j] + 1)
+        return fronts
+
+    def test_non_domin_sort_naive(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            for size in (10, 50, 200):
+                seq = [tuple(random.randint(0, 6) for _ in range(dim)) for _ in range(size)]
+                fronts = nds.non_domin_sort(seq, only_front_indices=True)
+                self.assertSequenceEqual(fronts, self._naive_front_indices(seq))
+
+    def test_non_domin_sort_without_brute_force(self):
+        with mock.patch.object(nds, "BRUTE_FORCE_SIZE_A", 2), mock.patch.object(nds, "BRUTE_FORCE_SIZE_B", 1):
+            self.test_non_domin_sort_naive()
+
+    @unittest.skipIf(np is None, "NumPy is not installed.")
+    def test_non_domin_sort_array(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            seq = [tuple(random.randint(0, 6) for _ in range(dim)) for _ in range(200)]
+            fronts = nds.non_domin_sort_array(np.array(seq, dtype=float))
+            self.assertEqual(fronts.dtype, np.int32)
+            self.assertSequenceEqual(fronts.tolist(), nds.non_domin_sort(seq, only_front_indices=True))
+
     def test_non_domin_sort_random_seq(self):
         for dim in range(self._min_dim, self._max_dim + 1):
             seq = self._generate_seq(dim)
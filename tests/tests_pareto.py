@@ -0,0 +1,64 @@
+import unittest
+import random
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import nds.ndomsort as nds
+import nds.pareto as pareto
+
+
+class TestPareto(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self._min_dim = 2
+        self._max_dim = 6
+
+    def _generate(self, dim: int, size: int, max_value: int):
+        return [tuple(random.randint(0, max_value) for _ in range(dim)) for _ in range(size)]
+
+    def test_pareto_front(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            for max_value in (3, 1000):
+                decisions = self._generate(dim, 300, max_value)
+                with self.subTest(dim=dim, max_value=max_value):
+                    self.assertTupleEqual(pareto.pareto_front(decisions), nds.non_domin_sort(decisions)[0])
+
+    def test_pareto_front_kung(self):
+        with mock.patch.object(pareto, "KUNG_BASE_SIZE", 3):
+            for dim in range(4, self._max_dim + 1):
+                decisions = self._generate(dim, 500, 20)
+                with self.subTest(dim=dim):
+                    self.assertTupleEqual(pareto.pareto_front(decisions), nds.non_domin_sort(decisions)[0])
+
+    def test_pareto_front_get_objectives(self):
+        decisions = [(value, "decision {0}".format(index)) for (index, value)
+                     in enumerate(self._generate(3, 200, 10))]
+        self.assertTupleEqual(pareto.pareto_front(decisions, lambda x: x[0]),
+                              nds.non_domin_sort(decisions, lambda x: x[0])[0])
+
+    def test_is_pareto_efficient(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            decisions = self._generate(dim, 300, 5)
+            expected = tuple(front == 0 for front in nds.non_domin_sort(decisions, only_front_indices=True))
+            with self.subTest(dim=dim):
+                self.assertTupleEqual(pareto.is_pareto_efficient(decisions), expected)
+
+    @unittest.skipIf(np is None, "The NumPy is not installed.")
+    def test_is_pareto_efficient_array(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            for max_value in (3, 1000):
+                objectives = np.array(self._generate(dim, 2000, max_value), dtype=float)
+                expected = np.array(nds.non_domin_sort(objectives.tolist(), only_front_indices=True)) == 0
+                with self.subTest(dim=dim, max_value=max_value):
+                    result = pareto.is_pareto_efficient(objectives)
+                    self.assertEqual(result.dtype, bool)
+                    self.assertListEqual(result.tolist(), expected.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
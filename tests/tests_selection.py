@@ -0,0 +1,101 @@
+import unittest
+import random
+from unittest import mock
+
+import nds.ndomsort as nds
+import nds.pareto as pareto
+import nds.selection as sel
+
+
+def _naive_crowding_distance(values):
+    distances = [0.0] * len(values)
+
+    for k in range(len(values[0])):
+        order = sorted(range(len(values)), key=lambda i: (values[i][k], values[i]))
+        span = values[order[-1]][k] - values[order[0]][k]
+        for pos in range(1, len(order) - 1):
+            if span > 0:
+                distances[order[pos]] += (values[order[pos + 1]][k] - values[order[pos - 1]][k]) / span
+        distances[order[0]] = distances[order[-1]] = float("inf")
+
+    return distances
+
+
+class TestSelection(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(11)
+        self._min_dim = 2
+        self._max_dim = 5
+
+    def _generate(self, dim: int, size: int):
+        return [tuple(random.randint(0, 30) for _ in range(dim)) for _ in range(size)]
+
+    def _expected_distances(self, decisions):
+        fronts = nds.non_domin_sort(decisions, only_front_indices=True)
+        distances = [0.0] * len(decisions)
+
+        for front in set(fronts):
+            indices = [index for index in range(len(decisions)) if fronts[index] == front]
+            for (index, distance) in zip(indices, _naive_crowding_distance([decisions[i] for i in indices])):
+                distances[index] = distance
+
+        return fronts, distances
+
+    def _check_crowding_distance(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            decisions = self._generate(dim, 200)
+            fronts, expected = self._expected_distances(decisions)
+
+            with self.subTest(dim=dim):
+                for distances in (sel.crowding_distance(decisions), sel.crowding_distance(decisions, fronts=fronts)):
+                    for (distance, expected_distance) in zip(distances, expected):
+                        self.assertAlmostEqual(distance, expected_distance)
+
+    def test_crowding_distance(self):
+        self._check_crowding_distance()
+
+    def test_crowding_distance_without_numpy(self):
+        with mock.patch.object(sel, "np", None):
+            self._check_crowding_distance()
+
+    def test_select_survivors(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            decisions = self._generate(dim, 150)
+            fronts, distances = self._expected_distances(decisions)
+
+            for count in (0, 1, 10, 75, 150, 200):
+                with self.subTest(dim=dim, count=count):
+                    survivors = sel.select_survivors(decisions, count)
+                    self.assertEqual(len(survivors), min(count, len(decisions)))
+                    self.assertEqual(len(set(survivors)), len(survivors))
+
+                    if not survivors:
+                        continue
+
+                    self.assertListEqual([fronts[index] for index in survivors],
+                                         sorted(fronts[index] for index in survivors))
+
+                    last_front = fronts[survivors[-1]]
+                    rest = set(range(len(decisions))) - set(survivors)
+                    self.assertTrue(all(fronts[index] >= last_front for index in rest))
+
+                    min_distance = min(distances[index] for index in survivors if fronts[index] == last_front)
+                    self.assertTrue(all(distances[index] <= min_distance for index in rest
+                                        if fronts[index] == last_front))
+
+    def test_select_survivors_kung(self):
+        # Above three objectives the required fronts are peeled off by the Kung's method without the full sorting.
+        decisions = self._generate(5, 300)
+        fronts = nds.non_domin_sort(decisions, only_front_indices=True)
+        count = sum(1 for front in fronts if front < 2)
+
+        with mock.patch.object(nds, "_nd_sort", side_effect=AssertionError), \
+                mock.patch.object(pareto, "KUNG_BASE_SIZE", 8):
+            survivors = sel.select_survivors(decisions, count)
+
+        self.assertSetEqual(set(survivors), {index for (index, front) in enumerate(fronts) if front < 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
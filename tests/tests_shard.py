@@ -0,0 +1,103 @@
+import unittest
+import random
+import os
+import io
+import tempfile
+import multiprocessing
+
+import nds.ndomsort as nds
+import nds.shard as shard
+
+
+def _summarize_to_file(decisions, path):
+    with open(path, "wb") as file:
+        shard.dump_summary(shard.summarize(decisions), file)
+
+
+def _summarize_to_pipe(decisions, connection):
+    buffer = io.BytesIO()
+    shard.dump_summary(shard.summarize(decisions), buffer)
+    connection.send_bytes(buffer.getvalue())
+    connection.close()
+
+
+class TestShard(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(9)
+        self._min_dim = 2
+        self._max_dim = 5
+
+    def _check_merge(self, shards):
+        summaries = [shard.summarize(decisions) for decisions in shards]
+        total_summary, shard_fronts = shard.merge_summaries(summaries)
+
+        fronts = []
+        for (decisions, summary, summary_fronts) in zip(shards, summaries, shard_fronts):
+            fronts.extend(shard.assign_fronts(decisions, summary.objs, summary_fronts))
+
+        all_decisions = [decision for decisions in shards for decision in decisions]
+        self.assertSequenceEqual(fronts, nds.non_domin_sort(all_decisions, only_front_indices=True))
+        self.assertListEqual(total_summary.objs, sorted(set(map(tuple, all_decisions))))
+        self.assertEqual(sum(total_summary.counts), len(all_decisions))
+
+    def test_merge_summaries(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            for max_value in (3, 1000):
+                decisions = [tuple(random.randint(0, max_value) for _ in range(dim)) for _ in range(600)]
+                for count_of_shards in (1, 2, 5):
+                    with self.subTest(dim=dim, max_value=max_value, count_of_shards=count_of_shards):
+                        self._check_merge([decisions[k::count_of_shards] for k in range(count_of_shards)])
+
+    def test_merge_summaries_regions(self):
+        # The shards are shifted, so the most elements are not dominated by the elements of the other shards.
+        for dim in range(self._min_dim, self._max_dim + 1):
+            shards = [[(k + random.random(), 4 - k + random.random()) + tuple(random.random() for _ in range(dim - 2))
+                       for _ in range(200)] for k in range(4)]
+            with self.subTest(dim=dim):
+                self._check_merge(shards)
+
+    def test_processes_files(self):
+        shards = [[tuple(random.randint(0, 100) for _ in range(3)) for _ in range(300)] for _ in range(3)]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = [os.path.join(tmp_dir, "shard_{0}.pickle".format(k)) for k in range(len(shards))]
+            processes = [multiprocessing.Process(target=_summarize_to_file, args=(decisions, path))
+                         for (decisions, path) in zip(shards, paths)]
+
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+                self.assertEqual(process.exitcode, 0)
+
+            summaries = []
+            for path in paths:
+                with open(path, "rb") as file:
+                    summaries.append(shard.load_summary(file))
+
+        self.assertListEqual(summaries, [shard.summarize(decisions) for decisions in shards])
+
+        _, shard_fronts = shard.merge_summaries(summaries)
+        fronts = [front for (decisions, summary, summary_fronts) in zip(shards, summaries, shard_fronts)
+                  for front in shard.assign_fronts(decisions, summary.objs, summary_fronts)]
+        self.assertSequenceEqual(fronts, nds.non_domin_sort([decision for decisions in shards
+                                                             for decision in decisions], only_front_indices=True))
+
+    def test_processes_pipes(self):
+        shards = [[tuple(random.randint(0, 100) for _ in range(4)) for _ in range(300)] for _ in range(2)]
+        summaries = []
+
+        for decisions in shards:
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(target=_summarize_to_pipe, args=(decisions, sender))
+            process.start()
+            sender.close()
+            summaries.append(shard.load_summary(io.BytesIO(receiver.recv_bytes())))
+            process.join()
+
+        self.assertListEqual(summaries, [shard.summarize(decisions) for decisions in shards])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import random
+import os
+import tempfile
+
+import nds.ndomsort as nds
+import nds.snapshot as snapshot
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "The NumPy is not installed.")
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(17)
+        self._min_dim = 2
+        self._max_dim = 5
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._tmp_dir.name, "population.snapshot")
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _generate(self, dim: int, size: int, max_value: int):
+        return [tuple(random.randint(0, max_value) for _ in range(dim)) for _ in range(size)]
+
+    def test_save_load(self):
+        for dim in range(self._min_dim, self._max_dim + 1):
+            for max_value in (3, 1000):
+                decisions = self._generate(dim, 500, max_value)
+                expected = nds.non_domin_sort(decisions, only_front_indices=True)
+                with self.subTest(dim=dim, max_value=max_value):
+                    self.assertSequenceEqual(snapshot.save(self._path, decisions).tolist(), expected)
+
+                    with snapshot.load(self._path) as snap:
+                        self.assertEqual(len(snap), len(decisions))
+                        self.assertListEqual(snap.objs.tolist(), [list(objs) for objs in sorted(set(decisions))])
+                        self.assertListEqual(snap.counts.tolist(), [decisions.count(objs)
+                                                                    for objs in sorted(set(decisions))])
+                        self.assertSequenceEqual(snap.front_indices().tolist(), expected)
+
+    def test_save_array(self):
+        objectives = np.array(self._generate(3, 400, 20), dtype=float)
+        expected = nds.non_domin_sort_array(objectives)
+        np.testing.assert_array_equal(snapshot.save(self._path, objectives), expected)
+
+        with snapshot.load(self._path) as snap:
+            np.testing.assert_array_equal(snap.front_indices(), expected)
+            np.testing.assert_array_equal(snap.objs[snap.inverse], objectives)
+
+    def test_load_zero_copy(self):
+        snapshot.save(self._path, self._generate(3, 100, 10))
+
+        with snapshot.load(self._path) as snap:
+            for array in (snap.objs, snap.counts, snap.inverse, snap.fronts):
+                self.assertFalse(array.flags.owndata)
+                self.assertFalse(array.flags.writeable)
+
+    def test_to_archive(self):
+        decisions = [{"objs": objs} for objs in self._generate(3, 300, 30)]
+        get_objectives = lambda x: x["objs"]
+        snapshot.save(self._path, decisions, get_objectives)
+
+        with snapshot.load(self._path) as snap:
+            archive = snap.to_archive(decisions, get_objectives)
+
+        self.assertSequenceEqual([archive.front(i) for i in range(len(decisions))],
+                                 nds.non_domin_sort(decisions, get_objectives, only_front_indices=True))
+
+        new_decisions = [{"objs": objs} for objs in self._generate(3, 50, 30)]
+        all_decisions = decisions + new_decisions
+        self.assertListEqual(archive.insert(new_decisions), list(range(len(decisions), len(all_decisions))))
+        self.assertSequenceEqual([archive.front(i) for i in range(len(all_decisions))],
+                                 nds.non_domin_sort(all_decisions, get_objectives, only_front_indices=True))
+
+    def test_to_archive_objectives(self):
+        decisions = self._generate(2, 200, 50)
+        snapshot.save(self._path, decisions)
+
+        with snapshot.load(self._path) as snap:
+            archive = snap.to_archive()
+
+        self.assertListEqual([archive.get(i) for i in range(len(decisions))], decisions)
+        self.assertDictEqual(archive.fronts(), nds.non_domin_sort(decisions))
+
+    def test_load_not_snapshot(self):
+        with open(self._path, "wb") as file:
+            file.write(b"not a snapshot" * 10)
+
+        with self.assertRaises(ValueError):
+            snapshot.load(self._path)
+
+        snapshot.save(self._path, self._generate(2, 10, 5))
+
+        with open(self._path, "r+b") as file:
+            file.truncate(os.path.getsize(self._path) - 4)
+
+        with self.assertRaises(ValueError):
+            snapshot.load(self._path)
+
+    def test_save_not_float_exact(self):
+        with self.assertRaises(AssertionError):
+            snapshot.save(self._path, [(2 ** 60 + 1, 0), (0, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import nds.ndomsort as nds
+from nds.stats import SortStats, ROUTINES
+
+
+class TestStats(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(8)
+
+    def test_stats(self):
+        seq = [tuple(random.randint(0, 50) for _ in range(4)) for _ in range(2000)]
+        seq += seq[:500]
+        stats = SortStats(trace_memory=True)
+
+        fronts = nds.non_domin_sort(seq, only_front_indices=True, engine="python", stats=stats)
+
+        self.assertSequenceEqual(fronts, nds.non_domin_sort(seq, only_front_indices=True, engine="python"))
+        self.assertEqual(stats.count_of_decisions, len(seq))
+        self.assertEqual(stats.count_of_unique, len(set(seq)))
+        self.assertGreater(stats.dedup_ratio, 1)
+
+        for name in ("_nd_helper_a", "_nd_helper_b", "_split_by", "_sweep_b", "_brute_force_b"):
+            self.assertGreater(stats.calls[name], 0, name)
+            self.assertGreaterEqual(stats.times[name], 0, name)
+
+        self.assertEqual(sum(stats.partition_sizes.values()), 3 * stats.calls["_split_by"])
+        self.assertEqual(sum(stats.brute_force_sizes.values()),
+                         stats.calls["_brute_force_a"] + stats.calls["_brute_force_b"])
+        self.assertGreater(stats.max_depth, 0)
+        self.assertGreater(stats.peak_memory, 0)
+        self.assertGreater(stats.elapsed, 0)
+        self.assertSetEqual(set(stats.as_dict()["calls"]) - set(ROUTINES), set())
+
+    def test_stats_are_not_leaked(self):
+        # The statistics are collected only by the sorting, which gets them, and only until it is finished.
+        seq = [tuple(random.randint(0, 50) for _ in range(3)) for _ in range(300)]
+        stats = SortStats()
+
+        with self.assertRaises(AssertionError):
+            nds.non_domin_sort([(1, 2), (1, 2, 3)], stats=stats)
+
+        self.assertFalse(stats.is_collecting)
+        calls = dict(stats.calls)
+
+        nds.non_domin_sort(seq, engine="python")
+        nds.non_domin_sort(seq, only_front_indices=True, max_fronts=2, engine="python")
+
+        self.assertDictEqual(dict(stats.calls), calls)
+        self.assertEqual(stats.count_of_decisions, 0)
+
+        other_stats = SortStats()
+        nds.non_domin_sort(seq, engine="python", stats=other_stats)
+        nds.non_domin_sort(seq, engine="python")
+
+        self.assertDictEqual(dict(stats.calls), calls)
+        self.assertEqual(other_stats.count_of_decisions, len(seq))
+        self.assertEqual(other_stats.calls["_group_by_objectives"], 1)
+
+    def test_stats_other_sortings(self):
+        # The sortings without the statistics are not counted, even if they are executed during the collection.
+        seq = [tuple(random.randint(0, 50) for _ in range(3)) for _ in range(500)]
+        stats = SortStats()
+
+        with stats.collect():
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(nds.non_domin_sort, seq).result()
+            nds.non_domin_sort(seq)
+
+        self.assertEqual(sum(stats.calls.values()), 0)
+        self.assertFalse(stats.is_collecting)
+
+        with stats.collect():
+            nds.non_domin_sort(seq, engine="python", stats=stats)
+            self.assertTrue(stats.is_collecting)
+
+        self.assertEqual(stats.calls["_group_by_objectives"], 1)
+        self.assertEqual(stats.count_of_decisions, len(seq))
+        self.assertFalse(stats.is_collecting)
+
+    @unittest.skipIf(np is None, "The NumPy is not installed.")
+    def test_stats_array(self):
+        objectives = np.random.RandomState(1).randint(0, 4, size=(500, 3))
+        stats = SortStats()
+
+        fronts = nds.non_domin_sort_array(objectives, engine="python", stats=stats)
+
+        self.assertListEqual(fronts.tolist(), nds.non_domin_sort_array(objectives, engine="python").tolist())
+        self.assertEqual(stats.count_of_decisions, 500)
+        self.assertEqual(stats.count_of_unique, len(set(map(tuple, objectives.tolist()))))
+        self.assertIsNone(stats.peak_memory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,11 @@
 import unittest
 import random
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 import nds.stools as st
 
 
@@ -26,6 +31,88 @@ class TestStools(unittest.TestCase):
         for ((left, right), answer) in zip(self.dom_pairs_seq, self.dom_answers):
             self.assertEqual(st.is_dominate(left, right), answer)
 
+    def test_is_constrained_dominate(self):
+        for (left, right) in self.dom_pairs_seq:
+            self.assertEqual(st.is_constrained_dominate(left, right, 0, 0), st.is_dominate(left, right))
+            self.assertTrue(st.is_constrained_dominate(right, left, -1, 0.5))
+            self.assertFalse(st.is_constrained_dominate(left, right, 2, 0))
+            self.assertTrue(st.is_constrained_dominate(right, left, 1, 2))
+            self.assertFalse(st.is_constrained_dominate(left, right, 1, 1))
+
+    def test_is_epsilon_dominate(self):
+        self.assertTupleEqual(st.epsilon_box((0.5, 1.5, -0.5), 1), (0, 1, -1))
+        self.assertTupleEqual(st.epsilon_box((3, 3), (2, 4)), (1, 0))
+        self.assertFalse(st.is_epsilon_dominate((0.1, 0.2), (0.9, 0.3), 1))
+        self.assertTrue(st.is_epsilon_dominate((0.1, 0.2), (1.2, 0.3), 1))
+        self.assertTrue(st.is_epsilon_dominate((0.1, 0.2), (0.9, 0.3), (0.5, 1)))
+
+        for (left, right) in self.dom_pairs_seq:
+            self.assertEqual(st.is_epsilon_dominate(left, right, 1), st.is_dominate(left, right))
+
+    @unittest.skipIf(np is None, "NumPy is not installed.")
+    def test_dominance_kernels(self):
+        lefts = [tuple(random.randint(0, 3) for _ in range(3)) for _ in range(self.max_size)]
+        rights = [tuple(random.randint(0, 3) for _ in range(3)) for _ in range(self.max_size)]
+
+        matrix = st.dominance_matrix(lefts, rights)
+        expected = [[st.is_dominate(left, right) for right in rights] for left in lefts]
+        self.assertListEqual(matrix.tolist(), expected)
+
+        for (left, row) in zip(lefts, expected):
+            self.assertListEqual(st.is_dominate_many(left, rights).tolist(), row)
+
+        weakly_dominated = st.is_weakly_dominated_by_any(lefts, rights)
+        self.assertListEqual(weakly_dominated.tolist(),
+                             [any(all(l <= r for (l, r) in zip(left, right)) for left in lefts)
+                              for right in rights])
+
+    def test_front_staircase(self):
+        stairs = st.FrontStaircase()
+
+        self.assertEqual(stairs.max_front(10), -1)
+
+        self.assertTrue(stairs.add(5, 0))
+        self.assertTrue(stairs.add(3, 1))
+        self.assertFalse(stairs.add(6, 0))
+        self.assertTrue(stairs.add(7, 2))
+
+        self.assertEqual(len(stairs), 2)
+        self.assertEqual(stairs.max_front(2), -1)
+        self.assertEqual(stairs.max_front(3), 1)
+        self.assertEqual(stairs.max_front(7), 2)
+
+        self.assertTrue(stairs.add(1, 3))
+        self.assertEqual(len(stairs), 1)
+        self.assertEqual(stairs.max_front(1), 3)
+
+    def test_front_staircase_random(self):
+        for _ in range(self.max_size):
+            stairs = st.FrontStaircase()
+            pairs = []
+            for _ in range(self.max_size):
+                value, front = random.randint(0, 10), random.randint(0, 10)
+                stairs.add(value, front)
+                pairs.append((value, front))
+                bound = random.randint(0, 10)
+                expected = max((f for (v, f) in pairs if v <= bound), default=-1)
+                self.assertEqual(stairs.max_front(bound), expected)
+
+
+    def test_fenwick_max_random(self):
+        fenwick = st.FenwickMax(11)
+
+        for _ in range(self.max_size):
+            pairs = []
+            for _ in range(self.max_size):
+                value, front = random.randint(0, 10), random.randint(0, 10)
+                fenwick.add(value, front)
+                pairs.append((value, front))
+                bound = random.randint(0, 10)
+                expected = max((f for (v, f) in pairs if v <= bound), default=-1)
+                self.assertEqual(fenwick.max_front(bound), expected)
+
+            fenwick.clear()
+            self.assertTrue(all(fenwick.max_front(value) == -1 for value in range(11)))
 
 if __name__ == "__main__":
-    unitest.main()
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import os
+import random
+import tempfile
+import tracemalloc
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import nds.ndomsort as nds
+from nds.stream import non_domin_sort_stream
+
+
+@unittest.skipIf(np is None, "The NumPy is not installed.")
+class TestStream(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(5)
+        self._rng = np.random.RandomState(5)
+
+    def _check(self, objectives, fronts):
+        expected = nds.non_domin_sort(objectives.tolist(), only_front_indices=True)
+        self.assertEqual(fronts.dtype, np.int32)
+        self.assertSequenceEqual(fronts.tolist(), list(expected))
+
+    def test_stream_array(self):
+        for dim in range(2, 6):
+            objectives = self._rng.randint(0, 10, size=(300, dim)).astype(np.float64)
+
+            for block_size in (1, 7, 64, 1000):
+                with self.subTest(dim=dim, block_size=block_size):
+                    self._check(objectives, non_domin_sort_stream(objectives, block_size=block_size))
+
+    def test_stream_chunks(self):
+        objectives = self._rng.randint(0, 20, size=(500, 3))
+        chunks = (objectives[start:start + 45] for start in range(0, len(objectives), 45))
+        self._check(objectives, non_domin_sort_stream(chunks, block_size=32))
+
+    def test_stream_mixed_dtypes(self):
+        # The float values of the later chunks are not truncated by the integer type of the first chunk.
+        int_chunk = self._rng.randint(0, 5, size=(100, 3))
+        float_chunk = self._rng.randint(0, 5, size=(100, 3)) + 0.5
+        self._check(np.concatenate((int_chunk, float_chunk)),
+                    non_domin_sort_stream(iter((int_chunk, float_chunk)), block_size=16))
+
+    def test_stream_files(self):
+        objectives = self._rng.rand(400, 4)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            npy_path = os.path.join(tmp_dir, "objectives.npy")
+            raw_path = os.path.join(tmp_dir, "objectives.bin")
+            out_path = os.path.join(tmp_dir, "fronts.npy")
+
+            np.save(npy_path, objectives)
+            objectives.tofile(raw_path)
+
+            self._check(objectives, non_domin_sort_stream(npy_path, block_size=50, tmp_dir=tmp_dir))
+
+            fronts = non_domin_sort_stream(raw_path, out=out_path, count_of_obj=4, block_size=50)
+            self._check(objectives, fronts)
+            del fronts
+            self._check(objectives, np.load(out_path))
+
+    def test_stream_memory_budget(self):
+        objectives = self._rng.randint(0, 5, size=(200, 3))
+        self._check(objectives, non_domin_sort_stream(objectives, memory_budget=4096))
+
+    def test_stream_memory_peak(self):
+        # The allocated memory does not depend on the number of the rows.
+        objectives = self._rng.rand(8000, 3)
+        memory_budget = 256 * 1024
+        # The modules, which are imported by the first call, are not counted.
+        non_domin_sort_stream(objectives[:1000], memory_budget=memory_budget)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tracemalloc.start()
+            try:
+                fronts = non_domin_sort_stream(objectives, out=os.path.join(tmp_dir, "fronts.npy"),
+                                               memory_budget=memory_budget, tmp_dir=tmp_dir)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+            self.assertLessEqual(peak, memory_budget)
+            self._check(objectives, fronts)
+            del fronts
+
+
+if __name__ == '__main__':
+    unittest.main()